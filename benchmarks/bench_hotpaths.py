@@ -0,0 +1,395 @@
+"""
+Hot-path micro-benchmarks for Zombie Whacker.
+
+Runs under the dummy SDL drivers with a frozen virtual clock, so results do
+not depend on a window, audio device or wall-clock timing. Each case reports
+the best per-call time over several repeats. Results are compared against a
+JSON baseline and the run fails if any case regressed beyond the threshold.
+
+Usage (from the repository root):
+    python benchmarks/bench_hotpaths.py                  # compare with baseline
+    python benchmarks/bench_hotpaths.py --save-baseline  # record a new baseline
+    python benchmarks/bench_hotpaths.py -k zombie_update
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.chdir(ROOT)  # asset paths in config are relative to the repository root
+
+import pygame
+
+import config
+import game_clock
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.25  # fail when a case gets more than 25% slower
+HORDE_SIZE = 50  # zombies used by the per-horde cases
+
+# name -> (setup returning the timed callable, calls per repeat)
+BENCHMARKS: Dict[str, Tuple[Callable[[], Callable[[], None]], int]] = {}
+
+clock = game_clock.ManualClock(100000)
+_game = None
+
+
+def benchmark(name: str, number: int = 200):
+    """Register a benchmark case; the decorated setup returns the timed callable"""
+    def register(setup):
+        BENCHMARKS[name] = (setup, number)
+        return setup
+    return register
+
+
+def get_game():
+    """Shared Game instance with persistence and telemetry off"""
+    global _game
+    if _game is None:
+        from game import Game
+        config.SCORE_STORE_ENABLED = False
+        config.TELEMETRY_ENABLED = False
+        with contextlib.redirect_stdout(io.StringIO()):
+            _game = Game()
+    return _game
+
+
+def make_horde(count: int = HORDE_SIZE) -> List:
+    """Spawn zombies on a grid at the current virtual time"""
+    from sprites.zombie import Zombie
+    columns = 10
+    zombies = []
+    for i in range(count):
+        x = 60 + (i % columns) * 70
+        y = 120 + (i // columns) * 80
+        zombie = Zombie(x, y)
+        zombie.lifetime = 10 ** 9  # never expire while being measured
+        zombies.append(zombie)
+    return zombies
+
+
+def reset_playing(game, zombies) -> None:
+    """Put the game in PLAYING with the given zombies"""
+    game.zombies[:] = zombies
+    game.lod.reset(zombies)
+    game.score = 0
+    game.misses = 0
+    game.game_start_time = clock.get_ticks()
+    game.state_manager.set_state(config.GameState.PLAYING)
+
+
+@benchmark("load_shared_animations", number=3)
+def bench_load_shared_animations():
+    from sprites import zombie as zombie_module
+
+    def run():
+        zombie_module._sprite_cache.clear()
+        zombie_module.load_shared_animations()
+    return run
+
+
+@benchmark("zombie_update_idle")
+def bench_zombie_update_idle():
+    zombies = make_horde()
+
+    def run():
+        for zombie in zombies:
+            zombie.update()
+    return run
+
+
+@benchmark("zombie_update_hurt")
+def bench_zombie_update_hurt():
+    zombies = make_horde()
+    for zombie in zombies:
+        zombie.on_click()
+
+    def run():
+        for zombie in zombies:
+            zombie.update()
+    return run
+
+
+@benchmark("zombie_update_dying")
+def bench_zombie_update_dying():
+    zombies = make_horde()
+    for zombie in zombies:
+        zombie.on_click()
+        # Push the clip start back so the first update switches to dying
+        zombie.clip_start -= config.ZOMBIE_HURT_DURATION + 1
+
+    def run():
+        for zombie in zombies:
+            zombie.update()
+    return run
+
+
+@benchmark("game_check_zombie_hits_miss", number=1000)
+def bench_check_zombie_hits():
+    game = get_game()
+    reset_playing(game, make_horde())
+    pos = (5, 5)  # outside every zombie, so every rect is tested
+
+    def run():
+        game._check_zombie_hits(pos)
+    return run
+
+
+@benchmark("game_check_zombie_hits_transparent", number=1000)
+def bench_check_zombie_hits_transparent():
+    game = get_game()
+    zombies = make_horde()
+    reset_playing(game, zombies)
+    # Inside the last zombie's frame but on a transparent corner pixel
+    pos = (zombies[-1].rect.left + 2, zombies[-1].rect.bottom - 2)
+
+    def run():
+        game._check_zombie_hits(pos)
+    return run
+
+
+@benchmark("game_update_zombies")
+def bench_update_zombies():
+    game = get_game()
+    reset_playing(game, make_horde())
+
+    def run():
+        game._update_zombies()
+    return run
+
+
+@benchmark("game_update_zombies_300", number=50)
+def bench_update_zombies_300():
+    game = get_game()
+    reset_playing(game, make_horde(300))
+
+    def run():
+        game._update_zombies()
+    return run
+
+
+@benchmark("game_draw_menu", number=100)
+def bench_draw_menu():
+    game = get_game()
+    game.zombies.clear()
+    game.state_manager.set_state(config.GameState.MENU)
+    game.ui.in_settings = False
+
+    def run():
+        game.draw()
+    return run
+
+
+@benchmark("game_draw_settings", number=100)
+def bench_draw_settings():
+    game = get_game()
+    game.zombies.clear()
+    game.state_manager.set_state(config.GameState.MENU)
+    game.ui.in_settings = True
+
+    def run():
+        game.draw()
+    return run
+
+
+@benchmark("game_draw_playing", number=100)
+def bench_draw_playing():
+    game = get_game()
+    game.ui.in_settings = False
+    reset_playing(game, make_horde(config.MAX_ZOMBIES))
+    game.last_click_pos = (400, 300)
+
+    def run():
+        game.draw()
+    return run
+
+
+@benchmark("game_draw_game_over", number=100)
+def bench_draw_game_over():
+    game = get_game()
+    reset_playing(game, make_horde(config.MAX_ZOMBIES))
+    game.state_manager.set_state(config.GameState.GAME_OVER)
+
+    def run():
+        game.draw()
+    return run
+
+
+@benchmark("ui_draw_hud", number=500)
+def bench_draw_hud():
+    game = get_game()
+    screen = game.screen
+
+    def run():
+        game.ui.draw_score(screen, 120)
+        game.ui.draw_misses(screen, 3)
+        game.ui.draw_time(screen, 7)
+    return run
+
+
+@benchmark("weapon_cursor_draw_swinging", number=500)
+def bench_draw_cursor_swinging():
+    game = get_game()
+    cursor = game.weapon_cursor
+    screen = game.screen
+
+    def run():
+        # Mid-swing, in the first half so the trail is drawn too
+        cursor.start_swing_animation()
+        cursor.swing_timer -= cursor.swing_duration // 4
+        cursor.update()
+        cursor.draw_cursor(screen)
+    return run
+
+
+@benchmark("horde_move_300", number=50)
+def bench_horde_move():
+    from movement import HordeMover
+    from sprites.animation import Clip
+    from sprites.zombie import Zombie
+    import random
+
+    rng = random.Random(7)
+    zombies = [Zombie(rng.randint(60, 740), rng.randint(120, 540), Clip.WALKING)
+               for _ in range(300)]
+    mover = HordeMover()
+
+    def run():
+        mover.update(zombies, 16)
+    return run
+
+
+@benchmark("sweep_and_prune_300", number=100)
+def bench_sweep_and_prune():
+    from movement import sweep_and_prune
+    import random
+
+    rng = random.Random(7)
+    boxes = []
+    for _ in range(300):
+        x, y = rng.randint(60, 740), rng.randint(120, 540)
+        boxes.append((x - 25, y - 45, x + 25, y + 45))
+
+    def run():
+        sweep_and_prune(boxes)
+    return run
+
+
+@benchmark("particles_step_full_budget", number=100)
+def bench_particles_step():
+    from particles import ParticleSystem
+    particles = ParticleSystem(enabled=True)
+    screen = get_game().screen
+
+    def run():
+        # Keep the budget full: refill what the step culled
+        while particles.burst("blood", (400, 300)):
+            pass
+        particles.update(16)
+        screen.blits(particles.draw_list(), doreturn=False)
+    return run
+
+
+@benchmark("rewind_record_tick", number=200)
+def bench_rewind_record():
+    from rewind import RewindBuffer
+    game = get_game()
+    reset_playing(game, make_horde())
+    buffer = RewindBuffer()
+    ticks = iter(range(10 ** 9))
+
+    def run():
+        buffer.record(next(ticks), game.snapshot_state())
+    return run
+
+
+def measure(setup: Callable[[], Callable[[], None]], number: int, repeat: int) -> float:
+    """Best per-call time in microseconds"""
+    run = setup()
+    run()  # warm caches outside the measurement
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+def run_benchmarks(pattern: str = "", repeat: int = 5) -> Dict[str, float]:
+    """Run every registered case matching the pattern"""
+    pygame.init()
+    game_clock.set_time_source(clock.get_ticks)
+    get_game()  # sets the display mode that image conversion needs
+    results = {}
+    try:
+        for name, (setup, number) in BENCHMARKS.items():
+            if pattern in name:
+                results[name] = measure(setup, number, repeat)
+    finally:
+        game_clock.set_time_source(None)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[str]:
+    """Print a comparison table and return the names of regressed cases"""
+    regressions = []
+    print(f"{'benchmark':36} {'time (us)':>12} {'baseline':>12} {'change':>8}")
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base:
+            change = value / base - 1
+            flag = "  REGRESSED" if change > threshold else ""
+            if flag:
+                regressions.append(name)
+            print(f"{name:36} {value:12.2f} {base:12.2f} {change:+8.1%}{flag}")
+        else:
+            print(f"{name:36} {value:12.2f} {'-':>12} {'new':>8}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run hot-path micro-benchmarks")
+    parser.add_argument("-k", dest="pattern", default="", help="only run matching cases")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write results to the baseline file")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.pattern, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Per-zombie memory accounting.
+
+Spawns N zombies under tracemalloc and reports the bytes each live zombie
+costs (instance, rect and anything else allocated per spawn) plus the total
+traced heap. Shared animation frames are loaded before measuring, so they
+are not attributed to individual zombies.
+
+Usage (from the repository root):
+    python benchmarks/zombie_memory.py
+    python benchmarks/zombie_memory.py --counts 100 1000 10000
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.chdir(ROOT)  # asset paths in config are relative to the repository root
+
+import pygame
+
+import config
+from sprites.zombie import Zombie, load_shared_animations
+
+
+def measure(count: int):
+    """Return (bytes per zombie, traced heap in bytes) for a horde of `count`"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    zombies = [Zombie(60 + i % 680, 120 + i % 420) for i in range(count)]
+
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del zombies
+    return allocated / count, current
+
+
+def shallow_size(zombie) -> int:
+    """Bytes held directly by one zombie and its rect"""
+    size = sys.getsizeof(zombie) + sys.getsizeof(zombie.rect)
+    if hasattr(zombie, "__dict__"):
+        size += sys.getsizeof(zombie.__dict__)
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report memory used per live zombie")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    load_shared_animations()
+
+    print(f"shallow size: {shallow_size(Zombie(0, 0))} bytes per zombie")
+    print(f"{'zombies':>8} {'bytes/zombie':>14} {'traced heap':>14}")
+    for count in args.counts:
+        per_zombie, heap = measure(count)
+        print(f"{count:>8} {per_zombie:>14.1f} {heap / 1024:>12.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
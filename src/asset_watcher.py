@@ -0,0 +1,164 @@
+"""
+Hot asset reload for development mode.
+
+AssetWatcher polls the asset directories on a background thread and reports
+files that were added, modified or removed. A change is only reported once
+its size and modification time have stayed the same for a full scan, so a
+file still being written by an image editor is not reloaded half-way.
+(Polling keeps this portable. Inotify is not in the standard library, and a
+scan of the asset tree takes well under a millisecond.)
+
+HotReloader maps changed paths to the caches that own them and reloads only
+those entries: one zombie clip, the sword cursor, the background or one
+sound effect. Zombie clips and sounds reload between updates on the thread
+that updates the game (the simulation thread in threaded mode). The sword
+cursor and the background are read by the renderer directly and touch the
+OS cursor, so they are queued for apply_render() on the render thread. Every
+reload swaps the new objects in with plain assignments, so neither a tick
+nor a frame sees a half-loaded asset. A deleted sound falls back to the next
+file for its effect, or the effect is dropped.
+"""
+import os
+import queue
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import config
+from sprites import zombie as zombie_sprites
+from sprites.animation import CLIPS
+
+Stamp = Tuple[int, int]  # (size, mtime_ns)
+
+
+class AssetWatcher(threading.Thread):
+    """Polls directories and queues paths whose contents changed"""
+
+    def __init__(self, roots: Iterable[str], interval: Optional[int] = None):
+        super().__init__(name="asset-watcher", daemon=True)
+        self.roots = list(roots)
+        self.interval = (config.DEV_RELOAD_INTERVAL if interval is None else interval) / 1000
+        self.changes: "queue.Queue[str]" = queue.Queue()
+        self._stop_event = threading.Event()
+        self._stamps = self.scan()
+
+    def scan(self) -> Dict[str, Stamp]:
+        """Size and modification time of every file under the roots"""
+        stamps = {}
+        for root in self.roots:
+            for directory, _, files in os.walk(root):
+                for name in files:
+                    path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue  # Removed between listing and stat
+                    stamps[path] = (stat.st_size, stat.st_mtime_ns)
+        return stamps
+
+    def run(self) -> None:
+        pending: Dict[str, Optional[Stamp]] = {}
+        while not self._stop_event.wait(self.interval):
+            current = self.scan()
+            previous, self._stamps = self._stamps, current
+
+            # Report changes seen on the last scan that have since settled
+            for path, stamp in list(pending.items()):
+                if current.get(path) == stamp:
+                    self.changes.put(path)
+                    del pending[path]
+
+            for path in current.keys() | previous.keys():
+                stamp = current.get(path)
+                if stamp != previous.get(path):
+                    pending[path] = stamp
+
+    def drain(self) -> List[str]:
+        """Changed paths reported since the last call, without duplicates"""
+        changed = []
+        while True:
+            try:
+                path = self.changes.get_nowait()
+            except queue.Empty:
+                break
+            if path not in changed:
+                changed.append(path)
+        return changed
+
+    def stop(self) -> None:
+        """Ask the thread to exit after its current scan"""
+        self._stop_event.set()
+
+
+class HotReloader:
+    """Reloads the game caches affected by changed asset files"""
+
+    def __init__(self, game, watcher: Optional[AssetWatcher] = None):
+        self.game = game
+        self.watcher = watcher or AssetWatcher([config.IMG_DIR, config.SOUND_DIR])
+        if not self.watcher.is_alive():
+            self.watcher.start()
+        # Reloads waiting for the render thread: "sword" and/or "background"
+        self._render_pending: Set[str] = set()
+        self._render_lock = threading.Lock()
+
+    def apply(self) -> int:
+        """Reload changed clips and sounds, queueing render-side assets; returns the reload count"""
+        changed = self.watcher.drain()
+        if not changed:
+            return 0
+
+        clips: Set = set()
+        render_kinds: Set[str] = set()
+        sounds: Set[str] = set()
+
+        for path in changed:
+            kind, parts = self._classify(path)
+            if kind == "zombie" and len(parts) > 1:
+                clips.update(clip for clip, spec in CLIPS.items() if spec.folder == parts[0])
+            elif kind in ("sword", "background"):
+                render_kinds.add(kind)
+            elif kind == "sound":
+                sounds.add(parts[-1])
+
+        if render_kinds:
+            with self._render_lock:
+                self._render_pending |= render_kinds
+
+        reloads = 0
+        for clip in clips:
+            if zombie_sprites.reload_clip(clip, self.game.zombies) is not None:
+                print(f"Reloaded zombie clip {CLIPS[clip].folder}")
+                reloads += 1
+        for sound_file in sounds:
+            reloads += self.game.sound_manager.reload_sound_file(sound_file)
+        return reloads
+
+    def apply_render(self) -> int:
+        """Reload queued cursor and background changes; call on the render thread"""
+        with self._render_lock:
+            pending, self._render_pending = self._render_pending, set()
+
+        if "sword" in pending:
+            self.game.weapon_cursor.load_sword_images()
+            print("Reloaded sword cursor")
+        if "background" in pending:
+            self.game.reload_background()
+            print("Reloaded background")
+        return len(pending)
+
+    @staticmethod
+    def _classify(path: str) -> Tuple[Optional[str], List[str]]:
+        """Which cache a path belongs to, and its path parts below that cache's folder"""
+        for root, kind in ((config.IMG_DIR, None), (config.SOUND_DIR, "sound")):
+            relative = os.path.relpath(path, root)
+            if relative.startswith(os.pardir):
+                continue
+            parts = relative.split(os.sep)
+            if kind is None:
+                return parts[0], parts[1:]
+            return kind, parts
+        return None, []
+
+    def close(self) -> None:
+        """Stop watching"""
+        self.watcher.stop()
@@ -0,0 +1,76 @@
+"""
+Scripted bot player that drives a Game headlessly through handle_click
+"""
+import heapq
+import random
+from typing import Any, List, NamedTuple, Optional, Set, Tuple
+
+import config
+
+
+class BotProfile(NamedTuple):
+    reaction_mean: float = config.BOT_REACTION_MEAN
+    reaction_stddev: float = config.BOT_REACTION_STDDEV
+    reaction_min: float = config.BOT_REACTION_MIN
+    accuracy: float = config.BOT_ACCURACY
+
+
+class BotPlayer:
+    """Plans one click per zombie with a sampled reaction time and accuracy"""
+
+    def __init__(self, profile: Optional[BotProfile] = None, seed: Optional[int] = None):
+        self.profile = profile or BotProfile()
+        self.rng = random.Random(seed)
+
+        # (due time, serial, zombie, click position)
+        self._planned: List[Tuple[int, int, Any, Tuple[int, int]]] = []
+        self._seen: Set[int] = set()
+
+        self.clicks = 0
+        self.reaction_times: List[int] = []
+
+    def reset(self) -> None:
+        """Forget planned clicks before a new round"""
+        self._planned.clear()
+        self._seen.clear()
+        self.clicks = 0
+        self.reaction_times.clear()
+
+    def tick(self, game, now: int) -> None:
+        """Plan clicks for new zombies and fire the ones that are due"""
+        for zombie in game.zombies:
+            if zombie.serial not in self._seen and zombie.alive and not zombie.clicked:
+                self._seen.add(zombie.serial)
+                self._plan_click(zombie)
+
+        while self._planned and self._planned[0][0] <= now:
+            if now - game.last_click_time <= config.CLICK_COOLDOWN:
+                break  # Retry once the cooldown has passed
+            _, _, zombie, pos = heapq.heappop(self._planned)
+            if not zombie.alive or zombie.clicked:
+                continue  # Gone before the bot reacted
+            game.handle_click(pos)
+            game.last_click_time = now
+            self.clicks += 1
+            self.reaction_times.append(now - zombie.appear_time)
+
+    def _plan_click(self, zombie) -> None:
+        """Sample when and where the bot will click a zombie"""
+        profile = self.profile
+        reaction = max(profile.reaction_min,
+                       self.rng.gauss(profile.reaction_mean, profile.reaction_stddev))
+        rect = zombie.rect
+
+        if self.rng.random() < profile.accuracy:
+            # Aim at the middle of the visible body
+            body_w, body_h = config.ZOMBIE_BODY_SIZE
+            pos = (rect.centerx + self.rng.randint(-body_w // 4, body_w // 4),
+                   rect.centery + self.rng.randint(-body_h // 4, body_h // 4))
+        else:
+            # Overshoot to one side of the frame
+            side = self.rng.choice((-1, 1))
+            pos = (rect.centerx + side * (rect.width // 2 + self.rng.randint(5, 40)),
+                   rect.centery + self.rng.randint(-rect.height // 2, rect.height // 2))
+
+        due = zombie.appear_time + int(reaction)
+        heapq.heappush(self._planned, (due, zombie.serial, zombie, pos))
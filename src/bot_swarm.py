@@ -0,0 +1,213 @@
+"""
+Multi-process bot swarm for load and balance testing.
+
+Runs seeded headless sessions of the game on a virtual clock across a
+ProcessPoolExecutor and aggregates score, miss and frame-cost statistics.
+
+Usage (from the repository root):
+    python src/bot_swarm.py --sessions 2000 --set GAME_DURATION=30
+    python src/bot_swarm.py --sweep ZOMBIE_SPAWN_RATE=1000,1500,2000 --json sweep.json
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+# Headless drivers must be selected before pygame initializes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import config
+import game_clock
+from bot_player import BotPlayer, BotProfile
+from cli_config import parse_assignments
+
+# One Game and one monotonic virtual clock per worker process, reused across sessions
+_worker_game = None
+_worker_clock = None
+
+
+@contextlib.contextmanager
+def config_overrides(overrides: Dict[str, Any]):
+    """Set config values for the duration of a block, then restore the old ones"""
+    saved = {name: getattr(config, name) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(config, name, value)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
+def _init_worker(overrides: Optional[Dict[str, Any]] = None) -> None:
+    """Initialize pygame and build the worker's Game without console noise"""
+    global _worker_game, _worker_clock
+    from game import Game
+
+    pygame.init()
+    config.SCORE_STORE_ENABLED = False
+    config.TELEMETRY_ENABLED = False
+    # Settings only read while the Game is built (screen size, budgets, ...) must
+    # be in place before it exists; a swarm's pool serves one set of overrides
+    for name, value in (overrides or {}).items():
+        setattr(config, name, value)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_game = Game()
+    # Start well past 0 so "no spawn or click yet" (time 0) is long ago in every
+    # session, not only in the ones after the first
+    _worker_clock = game_clock.ManualClock(60 * 60 * 1000)
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+def run_session(seed: int, overrides: Dict[str, Any], profile: BotProfile,
+                draw: bool = True) -> Dict[str, Any]:
+    """Play one full round with a bot on a virtual clock"""
+    if _worker_game is None:
+        _init_worker()
+    game = _worker_game
+
+    with config_overrides(overrides):
+        random.seed(seed)
+        clock = _worker_clock
+        # Start on a whole second so frame times round the same way in every session
+        clock.advance(-clock.time_ms % 1000)
+        game_clock.set_time_source(clock.get_ticks)
+        bot = BotPlayer(profile, seed)
+        frame_ms = 1000 / config.FPS
+        frame_costs = []
+
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                game.reset_game()
+                while game.state_manager.is_state(config.GameState.PLAYING):
+                    clock.advance(frame_ms)
+                    bot.tick(game, clock.get_ticks())
+
+                    start = time.perf_counter()
+                    game.update()
+                    if draw:
+                        game.draw()
+                    frame_costs.append((time.perf_counter() - start) * 1000)
+        finally:
+            game_clock.set_time_source(None)
+
+        hits = game.score // config.POINTS_PER_HIT
+        return {
+            "seed": seed,
+            "score": game.score,
+            "misses": game.misses,
+            "hits": hits,
+            "clicks": bot.clicks,
+            "click_misses": bot.clicks - hits,
+            "reaction_mean": statistics.fmean(bot.reaction_times) if bot.reaction_times else 0.0,
+            "frames": len(frame_costs),
+            "frame_mean_ms": statistics.fmean(frame_costs) if frame_costs else 0.0,
+            "frame_p95_ms": _percentile(frame_costs, 0.95),
+            "frame_max_ms": max(frame_costs, default=0.0),
+        }
+
+
+def aggregate(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize per-session results"""
+    def summary(key):
+        values = [r[key] for r in results]
+        return {
+            "mean": statistics.fmean(values),
+            "stdev": statistics.pstdev(values),
+            "min": min(values),
+            "p50": _percentile(values, 0.5),
+            "p95": _percentile(values, 0.95),
+            "max": max(values),
+        }
+
+    return {
+        "sessions": len(results),
+        "score": summary("score"),
+        "misses": summary("misses"),
+        "click_misses": summary("click_misses"),
+        "reaction_mean": summary("reaction_mean"),
+        "frame_mean_ms": summary("frame_mean_ms"),
+        "frame_p95_ms": summary("frame_p95_ms"),
+        "frame_max_ms": summary("frame_max_ms"),
+    }
+
+
+def run_swarm(sessions: int, overrides: Dict[str, Any], profile: BotProfile,
+              workers: Optional[int] = None, base_seed: int = 0,
+              draw: bool = True) -> Dict[str, Any]:
+    """Fan seeded sessions across worker processes and aggregate them"""
+    seeds = range(base_seed, base_seed + sessions)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(overrides,)) as pool:
+        results = list(pool.map(
+            run_session, seeds,
+            itertools.repeat(overrides), itertools.repeat(profile), itertools.repeat(draw),
+            chunksize=max(1, sessions // ((workers or os.cpu_count() or 1) * 8))
+        ))
+    return aggregate(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run headless bot sessions")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0, help="first session seed")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="override a config setting")
+    parser.add_argument("--sweep", action="append", default=[], metavar="NAME=V1,V2",
+                        help="sweep a config setting over several values")
+    parser.add_argument("--reaction-mean", type=float, default=config.BOT_REACTION_MEAN)
+    parser.add_argument("--reaction-stddev", type=float, default=config.BOT_REACTION_STDDEV)
+    parser.add_argument("--reaction-min", type=float, default=config.BOT_REACTION_MIN)
+    parser.add_argument("--accuracy", type=float, default=config.BOT_ACCURACY)
+    parser.add_argument("--no-draw", action="store_true", help="skip rendering")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    base = {name: values[0] for name, values in parse_assignments(args.set).items()}
+    sweep = parse_assignments(args.sweep)
+    profile = BotProfile(args.reaction_mean, args.reaction_stddev,
+                         args.reaction_min, args.accuracy)
+
+    runs = []
+    for combination in itertools.product(*sweep.values()):
+        overrides = dict(base, **dict(zip(sweep.keys(), combination)))
+        started = time.perf_counter()
+        stats = run_swarm(args.sessions, overrides, profile, args.workers,
+                          args.seed, not args.no_draw)
+        elapsed = time.perf_counter() - started
+        runs.append({"overrides": overrides, "stats": stats})
+
+        print(f"{overrides or 'defaults'}: {args.sessions} sessions in {elapsed:.1f}s")
+        print(f"  score  mean {stats['score']['mean']:.1f}  p50 {stats['score']['p50']}"
+              f"  p95 {stats['score']['p95']}")
+        print(f"  misses mean {stats['misses']['mean']:.2f}"
+              f"  click misses mean {stats['click_misses']['mean']:.2f}")
+        print(f"  frame  mean {stats['frame_mean_ms']['mean']:.3f}ms"
+              f"  p95 {stats['frame_p95_ms']['p95']:.3f}ms"
+              f"  max {stats['frame_max_ms']['max']:.3f}ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(runs, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
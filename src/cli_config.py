@@ -0,0 +1,42 @@
+"""
+Config overrides from the command line for the headless tools.
+
+bot_swarm and record_session both accept NAME=VALUE (or NAME=v1,v2,...)
+arguments naming settings in config.py.
+"""
+from typing import Any, Dict, List
+
+import config
+
+# BotProfile takes its defaults from these when bot_player is imported, so
+# overriding them does nothing; set them on the BotProfile instead
+IMPORT_TIME_SETTINGS = frozenset({
+    "BOT_REACTION_MEAN", "BOT_REACTION_STDDEV", "BOT_REACTION_MIN", "BOT_ACCURACY",
+})
+
+
+def parse_value(text: str) -> Any:
+    """Parse a config override value as bool, int, float or string"""
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_assignments(items: List[str]) -> Dict[str, List[Any]]:
+    """Parse NAME=v1[,v2...] arguments, rejecting unknown and import-time settings"""
+    parsed = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if not hasattr(config, name):
+            raise SystemExit(f"Unknown config setting: {name}")
+        if name in IMPORT_TIME_SETTINGS:
+            raise SystemExit(f"{name} is read when bot_player is imported and cannot be "
+                             "overridden; set it on the BotProfile instead "
+                             "(bot_swarm: --reaction-mean/--reaction-stddev/--reaction-min/--accuracy)")
+        parsed[name] = [parse_value(v) for v in values.split(",")]
+    return parsed
@@ -4,12 +4,35 @@ from enum import Enum
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+THREADED_SIMULATION = False  # run the simulation on its own thread, rendering snapshots
+SIMULATION_RATE = 60  # simulation steps per second in threaded mode
+
+# Frame pacing
+FRAME_PACING = "sleep_spin"  # "tick" (pygame Clock), "sleep_spin" or "vsync"
+FRAME_SPIN_MARGIN = 2  # milliseconds busy-waited before each deadline with sleep_spin
+FRAME_SKIP_POLICY = "skip_render"  # when a frame behind: "skip_render" or "none"
+FRAME_SKIP_MAX = 2  # renders skipped in a row before drawing anyway
+FRAME_LATE_TOLERANCE = 2  # milliseconds past the deadline before a frame counts as late
+FRAME_STATS_WINDOW = 600  # recent frame intervals used for jitter
+
+# Rendering settings
+COLORKEY = (255, 0, 255)  # used for sprites whose alpha is only on or off
+RLE_MIN_TRANSPARENCY = 0.25  # transparent fraction before RLEACCEL pays off
+HARDWARE_CURSOR = True  # idle sword as the OS cursor; software drawing only while swinging
+RENDER_BACKEND = "surface"  # "surface" (blit to the display) or "texture" (SDL renderer, pygame._sdl2)
+RENDER_ACCELERATED = -1  # texture backend: 1 hardware, 0 software renderer, -1 let SDL choose
+WARMUP_ENABLED = True  # load and pre-touch a round's assets when leaving the menu instead of on first use
+
+# Development settings
+DEV_MODE = False  # watch assets/ and hot-reload changed images and sounds
+DEV_RELOAD_INTERVAL = 500  # milliseconds between asset scans
 
 # Asset directories
 ASSET_DIR = "assets/"
 IMG_DIR = ASSET_DIR + "images/"
 SOUND_DIR = ASSET_DIR + "sounds/"
 FONT_DIR = ASSET_DIR + "fonts/"
+DATA_DIR = "data/"
 
 # Game settings
 GAME_DURATION = 10  # seconds
@@ -22,8 +45,27 @@ CLICK_COOLDOWN = 100  # milliseconds
 ZOMBIE_SIZE = (120, 120)
 ZOMBIE_LIFETIME_MIN = 1500  # milliseconds - shorter lifetime
 ZOMBIE_LIFETIME_MAX = 3000  # milliseconds - shorter lifetime
-ZOMBIE_HURT_DURATION = 200  # milliseconds
-ZOMBIE_DEATH_TIMEOUT = 800  # milliseconds
+ZOMBIE_HURT_DURATION = 200  # milliseconds - length of the hurt clip
+ZOMBIE_DEATH_TIMEOUT = 800  # milliseconds from the hit until the dying clip ends
+ZOMBIE_MOVEMENT_ENABLED = False  # walk between waypoints instead of standing still
+ZOMBIE_WALK_SPEED = 60  # pixels per second
+ZOMBIE_BODY_SIZE = (50, 70)  # visible body inside the sprite frame, kept apart while walking
+ZOMBIE_HIT_ALPHA = 127  # frame pixels more opaque than this count as hits
+
+# Particle effects
+PARTICLES_ENABLED = True
+PARTICLE_BUDGET = 600  # hard cap on live particles; bursts beyond it are cut short
+PARTICLE_GRAVITY = 900  # pixels per second squared
+PARTICLE_BLOOD_COUNT = 24  # particles per hit
+PARTICLE_SPARK_COUNT = 10  # particles per hit, at the click position
+PARTICLE_DEATH_COUNT = 16  # particles when a dying zombie disappears
+
+# Animation level-of-detail
+LOD_ENABLED = True  # stagger idle animation and expire zombies from a time-ordered queue
+LOD_BUCKETS = 3  # untouched zombies are animated every this many frames
+LOD_LOW_DETAIL_FACTOR = 4  # low-detail zombies are animated this many times less often
+LOD_OCCLUDED_FRACTION = 0.6  # body share hidden by a zombie drawn above before it counts as occluded
+LOD_SMALL_AREA = 64 * 64  # frames smaller than this on screen are low detail (none are at 120x120)
 
 # Audio settings
 DEFAULT_MUSIC_VOLUME = 0.3
@@ -32,8 +74,68 @@ VOLUME_STEP = 0.1
 MIN_VOLUME = 0.0
 MAX_VOLUME = 1.0
 
+# Sound variation bank
+SOUND_VARIED_EFFECTS = ("hit", "miss")  # effects played with pitch/gain variants
+SOUND_VARIANTS = 6  # variants rendered per effect; 1 plays the original only
+SOUND_PITCH_RANGE = (0.9, 1.12)  # playback speed factors
+SOUND_GAIN_RANGE = (0.8, 1.0)
+SOUND_VARIATION_SEED = 1  # fixed so cached variants stay valid between runs
+SOUND_CACHE_DIR = DATA_DIR + "sound_cache/"
+
+# High-score settings
+SCORE_STORE_ENABLED = True  # False keeps scores in memory only
+SCORE_LOG_PATH = DATA_DIR + "scores.log"  # append-only record log
+SCORE_INDEX_PATH = DATA_DIR + "scores.idx"  # top-N snapshot + log offset
+LEADERBOARD_SIZE = 10  # entries kept in the in-memory index
+LEADERBOARD_DISPLAY = 5  # entries shown on the game over screen
+SCORE_FSYNC_BATCH = 16  # records per fsync
+SCORE_FSYNC_INTERVAL = 2000  # milliseconds - max delay before a pending batch is synced
+
+# Telemetry settings
+TELEMETRY_ENABLED = False
+TELEMETRY_DIR = DATA_DIR + "telemetry/"
+TELEMETRY_QUEUE_SIZE = 8192  # events buffered before new ones are dropped
+TELEMETRY_BATCH_SIZE = 512  # queued events that wake the writer early
+TELEMETRY_FLUSH_INTERVAL = 1000  # milliseconds between writer drains
+TELEMETRY_SEGMENT_SIZE = 1024 * 1024  # compressed bytes per segment before rotating
+
+# Bot swarm settings
+BOT_REACTION_MEAN = 450  # milliseconds from spawn to click
+BOT_REACTION_STDDEV = 120  # milliseconds
+BOT_REACTION_MIN = 150  # milliseconds - fastest plausible human reaction
+BOT_ACCURACY = 0.85  # probability that an aimed click lands on the zombie
+
+# Memory accounting
+MEMORY_SAMPLE_INTERVAL = 1000  # milliseconds between cache measurements
+MEMORY_DUMP_PATH = DATA_DIR + "memory.json"  # written with F4
+MEMORY_BUDGETS = {  # bytes per cache; caches not listed have no budget
+    "zombie_frames": 32 * 1024 * 1024,
+    "zombie_masks": 1024 * 1024,
+    "background": 4 * 1024 * 1024,
+    "sword": 256 * 1024,
+    "sounds": 16 * 1024 * 1024,
+    "sound_variants": 16 * 1024 * 1024,
+    "particles": 512 * 1024,
+    "rewind": 8 * 1024 * 1024,
+}
+
+# Gameplay capture
+CAPTURE_ENABLED = False  # record from startup; F9 starts and stops a recording
+CAPTURE_DIR = DATA_DIR + "capture/"  # each recording gets a timestamped folder here
+CAPTURE_FORMAT = "png"  # "png" (zlib, encoded in parallel) or anything pygame.image.save writes ("jpg", "bmp")
+CAPTURE_PNG_LEVEL = 1  # zlib level; higher is smaller and much slower
+CAPTURE_RING_SIZE = 8  # preallocated frame buffers; frames are dropped when all are in use
+CAPTURE_WORKERS = 4  # encoder threads
+CAPTURE_EVERY = 1  # keep every Nth drawn frame
+
+# Rewind settings
+REWIND_ENABLED = False  # record every tick for Game.seek (debugging; costs time every tick)
+REWIND_CHECKPOINT_INTERVAL = 60  # ticks between full keyframes
+REWIND_CHECKPOINTS = 30  # keyframes kept in the ring (about 30s at 60 ticks/s)
+
 # Animation settings
-ANIMATION_SPEED = 0.15
+ANIMATION_FRAME_DURATION = 110  # milliseconds per frame for clips without a fixed duration
+ANIMATION_TIMELINE_RESOLUTION = 5  # milliseconds per timeline lookup slot
 FRAME_LIMIT_IDLE = 6
 FRAME_LIMIT_HURT = 3
 FRAME_LIMIT_DYING = 8
@@ -52,6 +154,7 @@ class Colors:
 class GameState(Enum):
     MENU = "menu"
     PLAYING = "playing"
+    PAUSED = "paused"
     GAME_OVER = "game_over"
 
 class SoundType(Enum):
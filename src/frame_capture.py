@@ -0,0 +1,144 @@
+"""
+Off-thread gameplay capture to an image sequence.
+
+grab() only copies the finished frame into one of CAPTURE_RING_SIZE
+preallocated surfaces, which is a single blit in the display's format.
+A thread pool turns each copy into bytes, returns the buffer to the ring
+and encodes and writes the file while the game moves on. When every buffer
+is still waiting for a worker, the frame is dropped and counted instead of
+stalling the loop. Pass drop=False to wait instead, e.g. for headless runs
+where every frame matters more than the pace.
+
+PNG files are encoded here with zlib at CAPTURE_PNG_LEVEL. This is several
+times faster than pygame's PNG writer, and zlib releases the GIL, so
+workers encode in parallel. Any other CAPTURE_FORMAT ("jpg", "bmp", "tga")
+is written with pygame.image.save. Files are named by frame number, so
+gaps in the sequence show where frames were dropped.
+"""
+import os
+import queue
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional, Tuple, Union
+
+import pygame
+
+import config
+
+
+class CaptureStats(NamedTuple):
+    grabbed: int
+    written: int
+    dropped: int
+    failed: int
+
+
+def encode_png(pixels: bytes, size: Tuple[int, int], level: int) -> bytes:
+    """8-bit RGB PNG from packed RGB rows, without row filtering"""
+    width, height = size
+    stride = width * 3
+    # Filter type 0 (none) before every row
+    rows = b"".join(b"\0" + pixels[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) +
+            chunk(b"IDAT", zlib.compress(rows, level)) + chunk(b"IEND", b""))
+
+
+class FrameCapture:
+    """Copies frames into a ring of surfaces and writes them on worker threads"""
+
+    def __init__(self, screen: pygame.Surface, out_dir: str, drop: bool = True,
+                 image_format: Optional[str] = None, ring_size: Optional[int] = None,
+                 workers: Optional[int] = None, every: Optional[int] = None):
+        self.out_dir = out_dir
+        self.drop = drop
+        self.format = (config.CAPTURE_FORMAT if image_format is None else image_format).lower()
+        self.every = max(1, config.CAPTURE_EVERY if every is None else every)
+        os.makedirs(out_dir, exist_ok=True)
+
+        # Same size and pixel format as the display, so a grab is a plain copy
+        ring_size = max(1, config.CAPTURE_RING_SIZE if ring_size is None else ring_size)
+        self.ring = [pygame.Surface(screen.get_size(), 0, screen) for _ in range(ring_size)]
+        self._free: "queue.Queue[pygame.Surface]" = queue.Queue()
+        for buffer in self.ring:
+            self._free.put(buffer)
+        self._pool = ThreadPoolExecutor(max_workers=config.CAPTURE_WORKERS if workers is None else workers,
+                                        thread_name_prefix="capture")
+
+        self._lock = threading.Lock()
+        # Held while a frame is queued, so close() never races a submit
+        self._grab_lock = threading.Lock()
+        self._closed = False
+        self.frame = 0
+        self.grabbed = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def grab(self, source: Union[pygame.Surface, Callable[[pygame.Surface], object]]) -> bool:
+        """Queue the current frame; source is a surface or fills the given surface.
+        Returns False when the frame was skipped or dropped, or after close()."""
+        with self._grab_lock:
+            if self._closed:
+                return False
+            frame = self.frame
+            self.frame += 1
+            if frame % self.every:
+                return False
+
+            try:
+                buffer = self._free.get(block=not self.drop)
+            except queue.Empty:
+                self.dropped += 1
+                return False
+
+            if isinstance(source, pygame.Surface):
+                buffer.blit(source, (0, 0))
+            else:
+                source(buffer)
+            self.grabbed += 1
+            self._pool.submit(self._write, buffer, frame)
+            return True
+
+    def _write(self, buffer: pygame.Surface, frame: int) -> None:
+        """Worker: release the buffer as soon as its pixels are copied, then encode"""
+        path = os.path.join(self.out_dir, f"frame_{frame:06d}.{self.format}")
+        try:
+            if self.format == "png":
+                pixels = pygame.image.tobytes(buffer, "RGB")
+                size = buffer.get_size()
+                self._free.put(buffer)
+                data = encode_png(pixels, size, config.CAPTURE_PNG_LEVEL)
+                with open(path, "wb") as f:
+                    f.write(data)
+            else:
+                try:
+                    pygame.image.save(buffer, path)
+                finally:
+                    self._free.put(buffer)
+        except (OSError, pygame.error) as e:
+            with self._lock:
+                if not self.failed:
+                    print(f"Could not write capture frame {path}: {e}")
+                self.failed += 1
+            return
+        with self._lock:
+            self.written += 1
+
+    def stats(self) -> CaptureStats:
+        """Frame counts so far"""
+        with self._lock:
+            return CaptureStats(self.grabbed, self.written, self.dropped, self.failed)
+
+    def close(self) -> CaptureStats:
+        """Finish writing queued frames and stop the workers; later grabs do nothing"""
+        with self._grab_lock:
+            self._closed = True
+        self._pool.shutdown(wait=True)
+        return self.stats()
@@ -0,0 +1,146 @@
+"""
+Frame pacing with jitter and late-frame statistics.
+
+clock.tick() sleeps with millisecond (often coarser) granularity and measures
+each frame from the end of the previous one, so small oversleeps add up to
+uneven frame delivery. FramePacer schedules frames against absolute deadlines
+and supports three strategies (FRAME_PACING):
+
+- "tick": the previous pygame Clock.tick behaviour
+- "sleep_spin": sleep until shortly before the deadline, then busy-wait on
+  perf_counter for the last FRAME_SPIN_MARGIN milliseconds
+- "vsync": no waiting; the display is created with vsync, so flip() paces
+  the loop to the refresh rate
+
+When the loop falls behind by a whole frame or more, FRAME_SKIP_POLICY
+decides what happens. "skip_render" keeps simulating but skips drawing, for
+up to FRAME_SKIP_MAX frames in a row, until the loop catches up. "none"
+draws every frame and moves the schedule forward instead.
+
+Every frame's start time is recorded, so stats() can report interval jitter,
+late frames (started after deadline + FRAME_LATE_TOLERANCE) and the longest
+stall. In threaded mode frames are paced on the render thread while the
+simulation thread resets and reads the statistics, so a lock guards them.
+"""
+import statistics
+import threading
+import time
+from collections import deque
+from typing import NamedTuple, Optional
+
+import pygame
+
+import config
+
+STRATEGIES = ("tick", "sleep_spin", "vsync")
+
+
+class PacingStats(NamedTuple):
+    frames: int
+    late_frames: int
+    skipped_renders: int
+    mean_interval_ms: float
+    jitter_ms: float  # standard deviation of recent frame intervals
+    longest_stall_ms: float
+
+
+class FramePacer:
+    """Decides when each frame starts and whether it is drawn"""
+
+    def __init__(self, strategy: Optional[str] = None, fps: Optional[int] = None):
+        strategy = config.FRAME_PACING if strategy is None else strategy
+        if strategy not in STRATEGIES:
+            print(f"Unknown frame pacing strategy {strategy!r}, using sleep_spin")
+            strategy = "sleep_spin"
+        self.strategy = strategy
+        self.period = 1 / (config.FPS if fps is None else fps)
+        self.clock = pygame.time.Clock()
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        self._deadline: Optional[float] = None
+        self._skipped_in_row = 0
+
+    def reset_stats(self) -> None:
+        """Start measuring from scratch (e.g. for a new round)"""
+        with self._stats_lock:
+            self.frames = 0
+            self.late_frames = 0
+            self.skipped_renders = 0
+            self.longest_stall = 0.0
+            self.intervals: deque = deque(maxlen=config.FRAME_STATS_WINDOW)
+            self._last_start: Optional[float] = None
+
+    def begin_frame(self) -> bool:
+        """Wait for the next frame; returns False when this frame should not be drawn"""
+        if self.strategy == "tick":
+            self.clock.tick(round(1 / self.period))
+        elif self.strategy == "sleep_spin":
+            self._wait_until_deadline()
+
+        now = time.perf_counter()
+        with self._stats_lock:
+            render = self._schedule(now)
+            self._record(now)
+        return render
+
+    def _wait_until_deadline(self) -> None:
+        """Sleep most of the way to the deadline, then spin"""
+        if self._deadline is None:
+            return
+        spin_margin = config.FRAME_SPIN_MARGIN / 1000
+        remaining = self._deadline - time.perf_counter()
+        if remaining > spin_margin:
+            time.sleep(remaining - spin_margin)
+        while time.perf_counter() < self._deadline:
+            pass
+
+    def _schedule(self, now: float) -> bool:
+        """Advance the deadline and apply the frame-skip policy"""
+        if self._deadline is None:
+            self._deadline = now + self.period
+            return True
+
+        lateness = now - self._deadline
+        if lateness > config.FRAME_LATE_TOLERANCE / 1000:
+            self.late_frames += 1
+
+        self._deadline += self.period
+        if lateness < self.period:
+            self._skipped_in_row = 0
+            return True
+
+        # A full frame or more behind (with vsync, flip() sets the rate, so never skip)
+        if (config.FRAME_SKIP_POLICY == "skip_render" and self.strategy != "vsync" and
+                self._skipped_in_row < config.FRAME_SKIP_MAX):
+            self._skipped_in_row += 1
+            self.skipped_renders += 1
+            return False
+
+        # Give up catching up: draw, and schedule from now
+        self._skipped_in_row = 0
+        self._deadline = now + self.period
+        return True
+
+    def _record(self, now: float) -> None:
+        """Track frame intervals for the statistics"""
+        if self._last_start is not None:
+            interval = now - self._last_start
+            self.intervals.append(interval)
+            self.longest_stall = max(self.longest_stall, interval)
+        self._last_start = now
+        self.frames += 1
+
+    def stats(self) -> PacingStats:
+        """Pacing statistics since the last reset; safe to call from another thread"""
+        with self._stats_lock:
+            intervals = list(self.intervals)
+            frames, late_frames = self.frames, self.late_frames
+            skipped_renders, longest_stall = self.skipped_renders, self.longest_stall
+        return PacingStats(
+            frames=frames,
+            late_frames=late_frames,
+            skipped_renders=skipped_renders,
+            mean_interval_ms=statistics.fmean(intervals) * 1000 if intervals else 0.0,
+            jitter_ms=statistics.pstdev(intervals) * 1000 if len(intervals) > 1 else 0.0,
+            longest_stall_ms=longest_stall * 1000,
+        )
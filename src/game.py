@@ -1,43 +1,90 @@
 """
 Main game class for Zombie Whacker Game
 """
+import os
 import pygame
-from typing import Optional
+import queue
+import time
+from typing import List, Optional
 
 import config
+import game_clock
+import surface_cache
+import memory_stats
 from utils import load_image, get_random_position
 from sprites.zombie import Zombie
+from sprites import zombie as zombie_sprites
+from sprites.animation import Clip
+from movement import HordeMover
+from lod import LodScheduler
+from particles import ParticleSystem
+from simulation import RenderSnapshot, SnapshotBuffer, SimulationThread
+from rewind import RewindBuffer, encode_state, decode_state
 from ui import GameUI
 from weapon_cursor import WeaponCursor
 from sound_manager import SoundManager
 from game_state import GameStateManager
 from input_handler import InputHandler
+from score_store import ScoreStore
+from telemetry import Telemetry
+from asset_watcher import HotReloader
+from frame_pacing import FramePacer
+from frame_capture import FrameCapture
 
 class Game:
     """Main game class handling game loop and state management"""
     
     def __init__(self):
         # Initialize display
-        self.screen = pygame.display.set_mode(
-            (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-        )
+        pacing = config.FRAME_PACING
+        self.screen = None
+        self.texture_renderer = None
+        if config.RENDER_BACKEND == "texture":
+            # The display stays hidden for surface conversion; the renderer owns the visible window
+            self.screen = pygame.display.set_mode(
+                (config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.HIDDEN
+            )
+            try:
+                from texture_renderer import TextureRenderer
+                self.texture_renderer = TextureRenderer(self, vsync=(pacing == "vsync"))
+            except (ImportError, pygame.error) as e:
+                print(f"Could not create texture renderer, drawing with surfaces: {e}")
+                self.screen = None
+        if self.screen is None and pacing == "vsync":
+            try:
+                # vsync needs a SCALED (renderer-backed) window
+                self.screen = pygame.display.set_mode(
+                    (config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SCALED, vsync=1
+                )
+            except pygame.error as e:
+                print(f"Could not enable vsync, pacing with sleep_spin: {e}")
+                pacing = "sleep_spin"
+        if self.screen is None:
+            self.screen = pygame.display.set_mode(
+                (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+            )
         pygame.display.set_caption("Zombie Whacker Game")
 
         # Core game components
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(pacing)
         self.running = True
         self.state_manager = GameStateManager()
         
         # Initialize systems
         self.sound_manager = SoundManager()
         self.input_handler = InputHandler(self)
+        self.score_store = ScoreStore()
+        self.telemetry = Telemetry()
         
         # Audio settings
         self.music_volume = self.sound_manager.get_music_volume()
         self.sound_volume = self.sound_manager.get_sound_volume()
         
         # Game objects
-        self.zombies = pygame.sprite.Group()
+        self.zombies: List[Zombie] = []
+        self.mover = HordeMover()
+        self.lod = LodScheduler()
+        self.particles = ParticleSystem()
         self.ui = GameUI()
         self.weapon_cursor = WeaponCursor()
         
@@ -46,24 +93,84 @@ class Game:
         self.misses = 0
         self.game_start_time = 0
         self.last_zombie_spawn = 0
+        self.last_update_time = 0
         self.last_click_pos: Optional[tuple] = None
         self.last_click_time = 0
+        self.last_rank: Optional[int] = None
+        
+        # Rewind history and pause state
+        self.tick = 0
+        self.rewind = RewindBuffer()
+        self.paused_state: Optional[bytes] = None
+        memory_stats.register('rewind', self.rewind.memory_usage)
+        self.show_memory_overlay = False
         
         # Initialize graphics
         self._load_background()
+        
+        # Gameplay capture to an image sequence
+        self.capture: Optional[FrameCapture] = None
+        memory_stats.register('capture', lambda: (
+            (len(self.capture.ring), memory_stats.surface_bytes(self.capture.ring)) if self.capture else (0, 0)
+        ))
+        if config.CAPTURE_ENABLED:
+            self.start_capture()
+        
+        # Development mode: reload changed assets between frames
+        self.hot_reloader = HotReloader(self) if config.DEV_MODE else None
+        
+        # Warm-ups run on the first MENU -> PLAYING transition
+        if config.WARMUP_ENABLED:
+            self._register_warmups()
+    
+    def _register_warmups(self) -> None:
+        """Register what a round needs loaded and touched before PLAYING is entered"""
+        # Pause and game over are only reached from a round, so they are prepared with it
+        for warmup in (self._warm_up_playing, self._warm_up_paused, self._warm_up_game_over):
+            self.state_manager.register_warmup(config.GameState.PLAYING, warmup)
+    
+    def _warm_up_playing(self) -> None:
+        """Preload and pre-touch zombie frames, HUD glyphs, swing, particles and sounds"""
+        scratch = self.background.copy()
+        zombie_sprites.warm_up(scratch)
+        scratch.blit(self.background, (0, 0))
+        self.ui.warm_up(scratch)
+        self.weapon_cursor.warm_up(scratch)
+        self.particles.warm_up(scratch)
+        self.sound_manager.warm_up()
+    
+    def _warm_up_paused(self) -> None:
+        """Render the pause overlay once"""
+        self.ui.draw_paused(self.background.copy())
+    
+    def _warm_up_game_over(self) -> None:
+        """Render the game over screen and leaderboard once"""
+        leaderboard = tuple(self.score_store.top(config.LEADERBOARD_DISPLAY))
+        self.ui.draw_game_over(self.background.copy(), 0, 0, leaderboard)
     
     def _load_background(self) -> None:
         """Load background image with fallback"""
         try:
             self.background = load_image("background/background_2.jpg", convert_alpha=False)
-            self.background = pygame.transform.scale(
+            self.background = surface_cache.finalize(pygame.transform.scale(
                 self.background, 
                 (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-            )
+            ))
         except Exception as e:
             print(f"Could not load background image: {e}")
             self.background = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
             self.background.fill((50, 50, 50))  # Dark gray background
+            self.background = surface_cache.finalize(self.background)
+        surface_cache.register('background', self._refinalize_background)
+        memory_stats.register('background', lambda: (1, memory_stats.surface_bytes((self.background,))))
+    
+    def reload_background(self) -> None:
+        """Load the background image again after its file changed"""
+        self._load_background()
+    
+    def _refinalize_background(self) -> None:
+        """Convert the background again after the display format changed"""
+        self.background = surface_cache.finalize(self.background)
         
     def start_background_music(self) -> None:
         """Start playing background music"""
@@ -75,32 +182,138 @@ class Game:
         
     def reset_game(self) -> None:
         """Reset game for new round"""
-        self.zombies.empty()
+        self.zombies.clear()
+        # Clip durations and frame limits may have changed since the last round
+        zombie_sprites.refresh_timelines()
+        # Entering PLAYING runs pending warm-ups, so do it before the round clock starts.
+        # In threaded mode this runs on the simulation thread and blits (RLE-encodes)
+        # the shared zombie frames. That is only safe because the render thread first
+        # draws those frames from a PLAYING snapshot, and the simulation thread
+        # publishes that snapshot after the warm-up returns.
+        self.state_manager.set_state(config.GameState.PLAYING)
+        self.lod.clear()
+        self.particles.clear()
         self.score = 0
         self.misses = 0
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = game_clock.get_ticks()
         self.last_zombie_spawn = 0
+        self.last_update_time = self.game_start_time
         self.last_click_time = 0
         self.last_click_pos = None
-        self.state_manager.set_state(config.GameState.PLAYING)
+        self.last_rank = None
+        self.tick = 0
+        self.rewind.clear()
+        self.paused_state = None
+        self.pacer.reset_stats()
+        self.telemetry.emit("round_start", self.game_start_time)
         
         # Start background music when game starts
         self.start_background_music()
 
     def run(self) -> None:
         """Main game loop"""
+        if config.THREADED_SIMULATION:
+            self._run_threaded()
+            return
+        
         while self.running:
-            self.clock.tick(config.FPS)
+            render = self.pacer.begin_frame()
             self.input_handler.handle_events()
+            surface_cache.refresh_if_display_changed()
+            if self.hot_reloader:
+                self.hot_reloader.apply()
+                self.hot_reloader.apply_render()
+            memory_stats.sample_if_due()
             self.update()
-            self.draw()
+            if render:
+                self.draw()
         
         # Clean up when exiting
         self.cleanup()
     
+    def _run_threaded(self) -> None:
+        """Render loop with the simulation on its own thread"""
+        buffer = SnapshotBuffer()
+        events: queue.Queue = queue.Queue()
+        buffer.publish(self.capture_snapshot())
+        simulation = SimulationThread(self, buffer, events)
+        simulation.start()
+        
+        while self.running:
+            render = self.pacer.begin_frame()
+            # Only the main thread may pump events; the simulation handles them
+            for event in pygame.event.get():
+                events.put(event)
+            if self.hot_reloader:
+                self.hot_reloader.apply_render()
+            if render:
+                self.draw_snapshot(buffer.latest())
+        
+        simulation.stop()
+        simulation.join()
+        self.cleanup()
+    
+    def toggle_memory_overlay(self) -> None:
+        """Show or hide the cache memory overlay"""
+        self.show_memory_overlay = not self.show_memory_overlay
+        if self.show_memory_overlay:
+            memory_stats.sample()
+    
+    def dump_memory(self) -> None:
+        """Write cache memory use and peaks as JSON"""
+        try:
+            print(f"Memory report written to {memory_stats.dump()}")
+        except OSError as e:
+            print(f"Could not write memory report: {e}")
+    
+    def start_capture(self, out_dir: Optional[str] = None, drop: bool = True) -> None:
+        """Start recording drawn frames to an image sequence"""
+        if self.capture:
+            return
+        if out_dir is None:
+            stamp = config.CAPTURE_DIR + time.strftime("%Y%m%d-%H%M%S")
+            out_dir, count = stamp, 1
+            # Several recordings in the same second get -2, -3, ...
+            while os.path.exists(out_dir):
+                count += 1
+                out_dir = f"{stamp}-{count}"
+        try:
+            self.capture = FrameCapture(self.screen, out_dir, drop)
+            print(f"Capturing frames to {out_dir}")
+        except OSError as e:
+            print(f"Could not start capture: {e}")
+    
+    def stop_capture(self) -> None:
+        """Finish writing captured frames"""
+        if not self.capture:
+            return
+        capture, self.capture = self.capture, None
+        stats = capture.close()
+        print(f"Capture finished: {stats.written} frames written to {capture.out_dir}, "
+              f"{stats.dropped} dropped, {stats.failed} failed")
+    
+    def toggle_capture(self) -> None:
+        """Start or stop recording"""
+        if self.capture:
+            self.stop_capture()
+        else:
+            self.start_capture()
+    
     def cleanup(self) -> None:
         """Clean up resources when exiting"""
+        stats = self.pacer.stats()
+        if stats.frames:
+            print(f"Frame pacing ({self.pacer.strategy}): {stats.frames} frames, "
+                  f"{stats.late_frames} late, {stats.skipped_renders} renders skipped, "
+                  f"jitter {stats.jitter_ms:.2f}ms, longest stall {stats.longest_stall_ms:.1f}ms")
+        self.stop_capture()
         self.sound_manager.cleanup()
+        self.score_store.close()
+        self.telemetry.close()
+        if self.hot_reloader:
+            self.hot_reloader.close()
+        if self.texture_renderer:
+            self.texture_renderer.close()
     
     def handle_click(self, pos: tuple) -> None:
         """Handle mouse click on zombies"""
@@ -110,18 +323,28 @@ class Game:
         # Find the zombie that was clicked (if any)
         hit_zombie = self._check_zombie_hits(pos)
         
+        if not hit_zombie:
+            self.telemetry.emit("click_miss", game_clock.get_ticks(), x=pos[0], y=pos[1])
+        
         # Play appropriate sound
         sound_type = config.SoundType.HIT.value if hit_zombie else config.SoundType.MISS.value
         self.sound_manager.play_sound(sound_type)
     
     def _check_zombie_hits(self, pos: tuple) -> bool:
         """Check if click hit any zombies"""
-        for zombie in self.zombies:
-            if (zombie.rect.collidepoint(pos) and 
-                zombie.alive and 
-                not zombie.clicked):
+        # Topmost (last drawn) zombie first
+        for zombie in reversed(self.zombies):
+            if zombie.alive and not zombie.clicked and zombie.hit_test(pos):
                 if zombie.on_click():
+                    self.lod.promote(zombie)
+                    self.particles.burst("blood", zombie.rect.center)
+                    self.particles.burst("spark", pos)
                     self.score += config.POINTS_PER_HIT
+                    self.telemetry.emit(
+                        "hit", zombie.hurt_timer, zombie=zombie.serial,
+                        reaction=zombie.hurt_timer - zombie.appear_time,
+                        x=pos[0], y=pos[1]
+                    )
                     return True
         return False
     
@@ -131,19 +354,66 @@ class Game:
             return
         
         self.weapon_cursor.update()
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         
         # Check if game time is up
         if self._is_game_time_up(current_time):
             self.state_manager.set_state(config.GameState.GAME_OVER)
             self.stop_background_music()
+            self.last_rank = self.score_store.record(self.score, self.misses)
+            self.telemetry.emit("round_end", current_time, score=self.score, misses=self.misses)
+            if self.telemetry.enabled:
+                self.telemetry.emit("frame_pacing", current_time, **self.pacer.stats()._asdict())
             return
         
         # Spawn new zombies
         self._handle_zombie_spawning(current_time)
         
+        # Move walking zombies
+        if config.ZOMBIE_MOVEMENT_ENABLED:
+            self.mover.update(self.zombies, current_time - self.last_update_time)
+        self.particles.update(current_time - self.last_update_time)
+        self.last_update_time = current_time
+        
         # Update and clean up zombies
         self._update_zombies()
+        
+        self.tick += 1
+        if config.REWIND_ENABLED:
+            self.rewind.record(self.tick, self.snapshot_state())
+    
+    def snapshot_state(self) -> bytes:
+        """Compact binary snapshot of the resumable game state"""
+        return encode_state(self)
+    
+    def restore_state(self, data: bytes, rebase: bool = True) -> None:
+        """Restore a snapshot, shifting its timers to now when rebasing"""
+        decode_state(self, data, rebase)
+        self.lod.reset(self.zombies)
+    
+    def seek(self, tick: int) -> bool:
+        """Restore the state recorded for a tick and continue from there"""
+        data = self.rewind.state_at(tick)
+        if data is None:
+            return False
+        self.restore_state(data)
+        self.rewind.truncate_after(tick)
+        self.tick = tick
+        return True
+    
+    def pause(self) -> None:
+        """Freeze the round, keeping a snapshot to resume from"""
+        if self.state_manager.is_state(config.GameState.PLAYING):
+            self.paused_state = self.snapshot_state()
+            self.state_manager.set_state(config.GameState.PAUSED)
+            self.sound_manager.pause_background_music()
+    
+    def resume(self) -> None:
+        """Resume a paused round with its timers shifted past the pause"""
+        if self.state_manager.is_state(config.GameState.PAUSED) and self.paused_state:
+            self.restore_state(self.paused_state)
+            self.paused_state = None
+            self.sound_manager.resume_background_music()
     
     def _is_game_time_up(self, current_time: int) -> bool:
         """Check if game time has elapsed"""
@@ -162,78 +432,163 @@ class Game:
     
     def _update_zombies(self) -> None:
         """Update all zombies and remove dead ones"""
-        zombies_to_remove = []
+        if config.LOD_ENABLED:
+            self._update_zombies_lod()
+            return
+        
+        survivors = []
         
         for zombie in self.zombies:
             zombie.update()
-            if not zombie.alive:
-                if not zombie.clicked:  # Zombie disappeared without being clicked
-                    self.misses += 1
-                zombies_to_remove.append(zombie)
+            if zombie.alive:
+                survivors.append(zombie)
+            elif not zombie.clicked:  # Zombie disappeared without being clicked
+                self.misses += 1
+                self.telemetry.emit(
+                    "expire", game_clock.get_ticks(), zombie=zombie.serial
+                )
+            else:
+                self.particles.burst("death", zombie.rect.center)
+        
+        # Remove dead zombies in place so other holders of the list stay valid
+        self.zombies[:] = survivors
+    
+    def _update_zombies_lod(self) -> None:
+        """Update only the zombies the LOD scheduler picks for this frame"""
+        current_time = game_clock.get_ticks()
+        expired, died = self.lod.update(self.zombies, current_time)
         
-        # Remove dead zombies safely
-        for zombie in zombies_to_remove:
-            self.zombies.remove(zombie)
+        for zombie in expired:  # Zombie disappeared without being clicked
+            self.misses += 1
+            self.telemetry.emit("expire", current_time, zombie=zombie.serial)
+        for zombie in died:
+            self.particles.burst("death", zombie.rect.center)
+        
+        # The list only changes when a zombie is gone
+        if expired or died:
+            self.zombies[:] = [zombie for zombie in self.zombies if zombie.alive]
     
     def spawn_zombie(self) -> None:
         """Spawn a new zombie at random position"""
         x, y = get_random_position()
-        zombie = Zombie(x, y)
-        self.zombies.add(zombie)
+        clip = Clip.WALKING if config.ZOMBIE_MOVEMENT_ENABLED else Clip.IDLE
+        zombie = Zombie(x, y, clip)
+        self.zombies.append(zombie)
+        self.lod.add(zombie)
+        self.telemetry.emit(
+            "spawn", zombie.appear_time, zombie=zombie.serial,
+            x=x, y=y, lifetime=zombie.lifetime
+        )
     
     def get_remaining_time(self) -> int:
         """Get remaining game time in seconds"""
         if not self.state_manager.is_state(config.GameState.PLAYING):
             return 0
         
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         elapsed_time = (current_time - self.game_start_time) / 1000
         return max(0, config.GAME_DURATION - int(elapsed_time))
 
     def draw(self) -> None:
         """Render current game state"""
+        self.draw_snapshot(self.capture_snapshot())
+    
+    def capture_snapshot(self) -> RenderSnapshot:
+        """Copy everything the renderer needs into an immutable snapshot"""
+        state = self.state_manager.get_state()
+        if state == config.GameState.GAME_OVER:
+            leaderboard = tuple(self.score_store.top(config.LEADERBOARD_DISPLAY))
+        else:
+            leaderboard = ()
+        
+        return RenderSnapshot(
+            state=state,
+            zombies=tuple((z.image, z.rect.topleft) for z in self.zombies if z.alive),
+            score=self.score,
+            misses=self.misses,
+            remaining_time=self.get_remaining_time(),
+            last_click_pos=self.last_click_pos,
+            swing=self.weapon_cursor.swing_state(),
+            leaderboard=leaderboard,
+            last_rank=self.last_rank,
+            particles=self.particles.draw_list(),
+            menu=(self.ui.in_settings, self.ui.selected_item, self.music_volume, self.sound_volume),
+            memory=memory_stats.latest() if self.show_memory_overlay else None,
+        )
+    
+    def draw_snapshot(self, snapshot: RenderSnapshot) -> None:
+        """Render a snapshot of the game state"""
+        if self.texture_renderer:
+            self.texture_renderer.draw(snapshot)
+            return
+        
+        self.compose_snapshot(snapshot)
+        # Read once: F9 may stop the capture on the simulation thread meanwhile
+        capture = self.capture
+        if capture:
+            capture.grab(self.screen)
+        pygame.display.flip()
+    
+    def compose_snapshot(self, snapshot: RenderSnapshot) -> None:
+        """Draw a snapshot onto the display surface without presenting it"""
         self.screen.blit(self.background, (0, 0))
         
-        current_state = self.state_manager.get_state()
+        current_state = snapshot.state
+        if current_state != config.GameState.PLAYING:
+            # Swings are only drawn while playing, so restore the idle cursor
+            self.weapon_cursor.show_system_cursor()
         
         if current_state == config.GameState.MENU:
-            self._draw_menu()
+            self._draw_menu(snapshot)
         elif current_state == config.GameState.PLAYING:
-            self._draw_playing()
+            self._draw_playing(snapshot)
+        elif current_state == config.GameState.PAUSED:
+            self._draw_paused(snapshot)
         elif current_state == config.GameState.GAME_OVER:
-            self._draw_game_over()
+            self._draw_game_over(snapshot)
         
-        pygame.display.flip()
+        if snapshot.memory is not None:
+            self.ui.draw_memory_overlay(self.screen, snapshot.memory)
     
-    def _draw_menu(self) -> None:
+    def _draw_menu(self, snapshot: RenderSnapshot) -> None:
         """Draw menu state"""
-        if self.ui.in_settings:
-            self.ui.draw_settings_menu(self.screen, self.music_volume, self.sound_volume)
+        in_settings, selected_item, music_volume, sound_volume = snapshot.menu
+        if in_settings:
+            self.ui.draw_settings_menu(self.screen, music_volume, sound_volume, selected_item)
         else:
-            self.ui.draw_main_menu(self.screen)
+            self.ui.draw_main_menu(self.screen, selected_item)
     
-    def _draw_playing(self) -> None:
+    def _draw_playing(self, snapshot: RenderSnapshot) -> None:
         """Draw playing state"""
-        # Draw zombies
-        for zombie in self.zombies:
-            zombie.draw(self.screen)
+        # Draw zombies and particles
+        self.screen.blits(snapshot.zombies, doreturn=False)
+        self.screen.blits(snapshot.particles, doreturn=False)
         
         # Draw UI elements
-        self.ui.draw_score(self.screen, self.score)
-        self.ui.draw_misses(self.screen, self.misses)
-        self.ui.draw_time(self.screen, self.get_remaining_time())
+        self.ui.draw_score(self.screen, snapshot.score)
+        self.ui.draw_misses(self.screen, snapshot.misses)
+        self.ui.draw_time(self.screen, snapshot.remaining_time)
         
         # Draw weapon effects
-        if self.last_click_pos:
-            self.weapon_cursor.draw_swing_effect(self.screen, self.last_click_pos)
+        if snapshot.last_click_pos:
+            self.weapon_cursor.draw_swing_effect(self.screen, snapshot.last_click_pos, snapshot.swing)
         
-        self.weapon_cursor.draw_cursor(self.screen)
+        self.weapon_cursor.draw_cursor(self.screen, snapshot.swing)
+    
+    def _draw_paused(self, snapshot: RenderSnapshot) -> None:
+        """Draw paused state"""
+        # Draw frozen zombies and particles
+        self.screen.blits(snapshot.zombies, doreturn=False)
+        self.screen.blits(snapshot.particles, doreturn=False)
+        self.ui.draw_paused(self.screen)
     
-    def _draw_game_over(self) -> None:
+    def _draw_game_over(self, snapshot: RenderSnapshot) -> None:
         """Draw game over state"""
         # Draw frozen zombies
-        for zombie in self.zombies:
-            zombie.draw(self.screen)
+        self.screen.blits(snapshot.zombies, doreturn=False)
         
         # Draw game over screen
-        self.ui.draw_game_over(self.screen, self.score, self.misses)
+        self.ui.draw_game_over(
+            self.screen, snapshot.score, snapshot.misses,
+            snapshot.leaderboard, snapshot.last_rank
+        )
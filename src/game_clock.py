@@ -0,0 +1,37 @@
+"""
+Game time source.
+
+Gameplay timing reads ticks through this module instead of calling
+pygame.time.get_ticks() directly, so headless runs can drive the game
+with a virtual clock that advances faster than real time.
+"""
+import pygame
+from typing import Callable, Optional
+
+_time_source: Callable[[], int] = pygame.time.get_ticks
+
+
+class ManualClock:
+    """Virtual clock that only moves when advanced"""
+    
+    def __init__(self, start_ms: float = 0):
+        self.time_ms = start_ms
+    
+    def advance(self, ms: float) -> None:
+        """Move the clock forward"""
+        self.time_ms += ms
+    
+    def get_ticks(self) -> int:
+        """Current virtual time in milliseconds"""
+        return int(self.time_ms)
+
+
+def get_ticks() -> int:
+    """Get current game time in milliseconds"""
+    return _time_source()
+
+
+def set_time_source(source: Optional[Callable[[], int]] = None) -> None:
+    """Replace the time source; None restores the pygame clock"""
+    global _time_source
+    _time_source = source or pygame.time.get_ticks
@@ -2,19 +2,50 @@
 Game state manager for handling different game states and transitions
 """
 from enum import Enum
+import time
+from typing import Callable, Dict, List
 import config
 
 class GameStateManager:
     def __init__(self):
         self.current_state = config.GameState.MENU
         self.previous_state = None
+        
+        # Warm-up callbacks run once before a state is first entered
+        self.warmups: Dict[config.GameState, List[Callable[[], None]]] = {}
+        self.warmed_up = set()
+        self.warmup_times: Dict[config.GameState, float] = {}  # milliseconds
     
     def set_state(self, new_state: config.GameState):
         """Set new game state"""
         if new_state != self.current_state:
+            self.warm_up(new_state)
             self.previous_state = self.current_state
             self.current_state = new_state
     
+    def register_warmup(self, state: config.GameState, warmup: Callable[[], None]) -> None:
+        """Run a callback before the state is entered for the first time"""
+        self.warmups.setdefault(state, []).append(warmup)
+        self.warmed_up.discard(state)
+    
+    def warm_up(self, state: config.GameState) -> float:
+        """Run the state's pending warm-ups; returns the time taken in milliseconds"""
+        if state in self.warmed_up or state not in self.warmups:
+            return 0.0
+        
+        start = time.perf_counter()
+        for warmup in self.warmups[state]:
+            try:
+                warmup()
+            except Exception as e:
+                print(f"Warm-up for {state.value} failed: {e}")
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        self.warmed_up.add(state)
+        self.warmup_times[state] = elapsed
+        print(f"Warmed up {state.value} in {elapsed:.1f}ms")
+        return elapsed
+    
     def is_state(self, state: config.GameState) -> bool:
         """Check if current state matches given state"""
         return self.current_state == state
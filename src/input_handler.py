@@ -3,6 +3,7 @@ Input handler for managing game input events
 """
 import pygame
 import config
+import game_clock
 from typing import Optional, Dict, Any
 
 class InputHandler:
@@ -11,22 +12,39 @@ class InputHandler:
         self.key_handlers = {
             config.GameState.MENU: self._handle_menu_input,
             config.GameState.PLAYING: self._handle_playing_input,
+            config.GameState.PAUSED: self._handle_paused_input,
             config.GameState.GAME_OVER: self._handle_game_over_input
         }
     
     def handle_events(self) -> None:
         """Handle all input events"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.game.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                current_state = self.game.state_manager.get_state()
-                if current_state in self.key_handlers:
-                    self.key_handlers[current_state](event.key)
+            self.handle_event(event)
+    
+    def handle_event(self, event) -> None:
+        """Handle a single input event"""
+        if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+            # WINDOWCLOSE covers the texture renderer's own window
+            self.game.running = False
+        
+        elif event.type == pygame.KEYDOWN:
+            # Debug keys work in every state
+            if event.key == pygame.K_F3:
+                self.game.toggle_memory_overlay()
+                return
+            if event.key == pygame.K_F4:
+                self.game.dump_memory()
+                return
+            if event.key == pygame.K_F9:
+                self.game.toggle_capture()
+                return
             
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._handle_mouse_input(event)
+            current_state = self.game.state_manager.get_state()
+            if current_state in self.key_handlers:
+                self.key_handlers[current_state](event.key)
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self._handle_mouse_input(event)
     
     def _handle_menu_input(self, key: int) -> None:
         """Handle menu input events"""
@@ -50,6 +68,15 @@ class InputHandler:
         """Handle playing state input events"""
         if key == pygame.K_ESCAPE:
             self._return_to_menu()
+        elif key == pygame.K_p:
+            self.game.pause()
+    
+    def _handle_paused_input(self, key: int) -> None:
+        """Handle paused state input events"""
+        if key == pygame.K_p:
+            self.game.resume()
+        elif key == pygame.K_ESCAPE:
+            self._return_to_menu()
     
     def _handle_game_over_input(self, key: int) -> None:
         """Handle game over input events"""
@@ -60,7 +87,7 @@ class InputHandler:
         """Handle mouse input events"""
         if (self.game.state_manager.is_state(config.GameState.PLAYING) and 
             event.button == 1):  # Left click
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.game.last_click_time > config.CLICK_COOLDOWN:
                 self.game.handle_click(event.pos)
                 self.game.last_click_time = current_time
@@ -0,0 +1,138 @@
+"""
+Animation level-of-detail and update staggering for the zombie horde.
+
+Instead of every zombie checking its lifetime and advancing its animation on
+every frame, the LodScheduler:
+
+- expires zombies from a heap ordered by expiry time, so a frame only looks
+  at zombies that are actually due;
+- animates clicked zombies (hurt and dying, the ones the player watches and
+  whose clips fire events) every frame;
+- spreads the animation of untouched zombies over LOD_BUCKETS frames, each
+  frame advancing one bucket;
+- animates low-detail zombies (mostly hidden behind a zombie drawn above
+  them, or with a frame smaller on screen than LOD_SMALL_AREA) only every
+  LOD_LOW_DETAIL_FACTOR bucket cycles. Low-detail marks are recomputed at
+  that same slower rate, and only after spawns, hits or expiries unless
+  zombies walk.
+
+Today every zombie frame is 120x120, so only occlusion marks zombies. The
+size check is for smaller clips or scaled-down sprites.
+
+Frames are looked up from the elapsed time, so a zombie that skips updates
+lands on the right frame the next time it is animated.
+"""
+import heapq
+from typing import List, Optional, Sequence, Set, Tuple
+
+import config
+from movement import sweep_and_prune
+
+
+class LodScheduler:
+    """Decides which zombies expire and animate on each frame"""
+
+    def __init__(self, buckets: Optional[int] = None, low_detail_factor: Optional[int] = None):
+        self.bucket_count = max(1, buckets or config.LOD_BUCKETS)
+        self.low_detail_factor = max(1, low_detail_factor or config.LOD_LOW_DETAIL_FACTOR)
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every zombie"""
+        self.buckets: List[List] = [[] for _ in range(self.bucket_count)]
+        self.active: List = []  # clicked zombies, animated every frame
+        self.expiry: List[Tuple[int, int, object]] = []  # (expires at, serial, zombie)
+        self.low_detail: Set = set()
+        self.frame = 0
+        self._next_bucket = 0
+        self._stale = True  # low-detail marks need recomputing
+
+    def reset(self, zombies: Sequence) -> None:
+        """Rebuild the schedule for a new set of zombies (e.g. after a restore)"""
+        self.clear()
+        for zombie in zombies:
+            if zombie.clicked:
+                self.active.append(zombie)
+            else:
+                self.add(zombie)
+
+    def add(self, zombie) -> None:
+        """Schedule a newly spawned zombie"""
+        self.buckets[self._next_bucket].append(zombie)
+        self._next_bucket = (self._next_bucket + 1) % self.bucket_count
+        heapq.heappush(self.expiry, (zombie.appear_time + zombie.lifetime, zombie.serial, zombie))
+        self._stale = True
+
+    def promote(self, zombie) -> None:
+        """Animate a clicked zombie every frame until it dies"""
+        self.active.append(zombie)
+        self.low_detail.discard(zombie)
+        self._stale = True
+
+    def update(self, zombies: Sequence, now: int) -> Tuple[List, List]:
+        """Run one frame; returns (expired zombies, zombies that finished dying)"""
+        expired = []
+        expiry = self.expiry
+        # Same rule as Zombie.update: gone once more than lifetime has passed
+        while expiry and expiry[0][0] < now:
+            zombie = heapq.heappop(expiry)[2]
+            if zombie.alive and not zombie.clicked:
+                zombie.alive = False
+                expired.append(zombie)
+                self.low_detail.discard(zombie)
+
+        died = []
+        if self.active:
+            still_active = []
+            for zombie in self.active:
+                if zombie.alive:
+                    zombie.animate(now)
+                if zombie.alive:
+                    still_active.append(zombie)
+                else:
+                    died.append(zombie)
+            self.active = still_active
+
+        if expired:
+            self._stale = True
+
+        index = self.frame % self.bucket_count
+        cycle = self.frame // self.bucket_count
+        animate_low_detail = cycle % self.low_detail_factor == 0
+        if index == 0 and animate_low_detail:
+            # Walking zombies change what covers what, otherwise only spawns and deaths do
+            if self._stale or config.ZOMBIE_MOVEMENT_ENABLED:
+                self.classify(zombies)
+
+        # Drop zombies that died or were clicked since this bucket last ran
+        bucket = self.buckets[index] = [z for z in self.buckets[index] if z.alive and not z.clicked]
+        low_detail = self.low_detail
+        for zombie in bucket:
+            if animate_low_detail or zombie not in low_detail:
+                zombie.animate(now)
+
+        self.frame += 1
+        return expired, died
+
+    def classify(self, zombies: Sequence) -> None:
+        """Mark zombies that are mostly hidden or drawn small as low detail"""
+        low_detail = self.low_detail
+        low_detail.clear()
+        self._stale = False
+        body_w, body_h = config.ZOMBIE_BODY_SIZE
+        half_w, half_h = body_w / 2, body_h / 2
+        hidden_area = body_w * body_h * config.LOD_OCCLUDED_FRACTION
+
+        candidates = [z for z in zombies if z.alive and not z.clicked]
+        small_area = config.LOD_SMALL_AREA
+        for zombie in candidates:
+            if zombie.rect.w * zombie.rect.h < small_area:
+                low_detail.add(zombie)
+        # Later zombies are drawn on top; candidates keep the draw order
+        boxes = [(z.fx - half_w, z.fy - half_h, z.fx + half_w, z.fy + half_h) for z in candidates]
+        for i, j in sweep_and_prune(boxes):
+            below, above = (i, j) if i < j else (j, i)
+            a, b = boxes[below], boxes[above]
+            overlap = (min(a[2], b[2]) - max(a[0], b[0])) * (min(a[3], b[3]) - max(a[1], b[1]))
+            if overlap >= hidden_area:
+                low_detail.add(candidates[below])
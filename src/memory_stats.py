@@ -0,0 +1,126 @@
+"""
+Memory accounting for asset caches.
+
+Every cache registers a reporter returning (entry count, bytes). Sizes are
+computed from what the cache holds rather than measured from the process:
+pixels x bytes per pixel for surfaces, PCM length x channels x sample size
+for sounds, nbytes for NumPy arrays. sample() polls every reporter, tracks
+the peak of each cache and warns once when a cache goes over its budget in
+MEMORY_BUDGETS. The latest sample backs the F3 debug overlay, and dump()
+writes it as JSON.
+"""
+import json
+import os
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+import config
+
+# name -> callable returning (entries, bytes)
+_reporters: Dict[str, Callable[[], Tuple[int, int]]] = {}
+_peaks: Dict[str, int] = {}
+_over_budget = set()
+_latest: List["CacheUsage"] = []
+_last_sample = 0.0
+
+
+class CacheUsage(NamedTuple):
+    name: str
+    entries: int
+    bytes: int
+    peak: int
+    budget: Optional[int]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.bytes > self.budget
+
+
+def register(name: str, reporter: Callable[[], Tuple[int, int]]) -> None:
+    """Register a cache; the reporter returns its (entry count, byte size)"""
+    _reporters[name] = reporter
+
+
+def surface_bytes(surfaces: Iterable[pygame.Surface]) -> int:
+    """Pixel memory of surfaces (RLE-encoded copies are not included)"""
+    return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces)
+
+
+def sound_bytes(sounds: Iterable) -> int:
+    """PCM memory of sounds in the mixer's format"""
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return 0
+    frequency, size, channels = mixer
+    frame_bytes = channels * abs(size) // 8
+    return sum(int(sound.get_length() * frequency) * frame_bytes for sound in sounds)
+
+
+def sample() -> List[CacheUsage]:
+    """Poll every cache, update peaks and report caches that went over budget"""
+    global _latest, _last_sample
+    usage = []
+    for name, reporter in _reporters.items():
+        try:
+            entries, size = reporter()
+        except Exception as e:
+            print(f"Could not measure {name}: {e}")
+            continue
+        peak = _peaks[name] = max(_peaks.get(name, 0), size)
+        entry = CacheUsage(name, entries, size, peak, config.MEMORY_BUDGETS.get(name))
+        usage.append(entry)
+
+        if entry.over_budget and name not in _over_budget:
+            print(f"Memory budget exceeded: {name} uses {size / 2**20:.1f}MB "
+                  f"of {entry.budget / 2**20:.1f}MB")
+            _over_budget.add(name)
+        elif not entry.over_budget:
+            _over_budget.discard(name)
+
+    _latest = usage
+    _last_sample = time.monotonic()
+    return usage
+
+
+def sample_if_due() -> List[CacheUsage]:
+    """Sample at most once per MEMORY_SAMPLE_INTERVAL"""
+    if time.monotonic() - _last_sample >= config.MEMORY_SAMPLE_INTERVAL / 1000:
+        return sample()
+    return _latest
+
+
+def latest() -> List[CacheUsage]:
+    """Most recent sample"""
+    return _latest
+
+
+def report() -> Dict:
+    """Machine-readable form of a fresh sample"""
+    usage = sample()
+    return {
+        "time": time.time(),
+        "total_bytes": sum(u.bytes for u in usage),
+        "caches": {
+            u.name: {
+                "entries": u.entries,
+                "bytes": u.bytes,
+                "peak_bytes": u.peak,
+                "budget_bytes": u.budget,
+                "over_budget": u.over_budget,
+            }
+            for u in usage
+        },
+    }
+
+
+def dump(path: Optional[str] = None) -> str:
+    """Write report() as JSON; returns the path written"""
+    path = config.MEMORY_DUMP_PATH if path is None else path
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report(), f, indent=2)
+    return path
@@ -0,0 +1,129 @@
+"""
+Zombie movement: waypoint walking plus sweep-and-prune separation.
+
+Walking zombies head towards a random waypoint inside the play area and pick
+a new one on arrival. Overlapping zombies are then pushed apart. Overlap is
+measured on a body rect (ZOMBIE_BODY_SIZE) around each zombie's centre rather
+than the mostly transparent sprite frame. Candidates come from a
+sweep-and-prune broad phase (sort by left edge, sweep along x, test y only
+for x-overlapping neighbours), which costs O(n log n + k) for k overlaps
+instead of testing every pair.
+"""
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import config
+from utils import get_random_position
+
+# Play area kept clear of the HUD, matching get_random_position()
+_MIN_X, _MAX_X = 60, config.SCREEN_WIDTH - 60
+_MIN_Y, _MAX_Y = 120, config.SCREEN_HEIGHT - 60
+
+
+def sweep_and_prune(boxes: Sequence[Tuple[float, float, float, float]]) -> List[Tuple[int, int]]:
+    """Index pairs of overlapping (left, top, right, bottom) boxes"""
+    order = sorted(range(len(boxes)), key=lambda i: boxes[i][0])
+    active: List[Tuple[int, float, float, float]] = []  # (index, top, right, bottom)
+    pairs = []
+
+    for i in order:
+        left, top, right, bottom = boxes[i]
+        # One pass drops boxes that end before this one starts along x, compacting
+        # the survivors in place, and tests the survivors along y
+        kept = 0
+        for entry in active:
+            if entry[2] > left:
+                active[kept] = entry
+                kept += 1
+                if entry[1] < bottom and top < entry[3]:
+                    pairs.append((entry[0], i))
+        del active[kept:]
+        active.append((i, top, right, bottom))
+
+    return pairs
+
+
+class HordeMover:
+    """Moves walking zombies along waypoints and keeps them apart"""
+
+    def __init__(self, speed: Optional[float] = None):
+        self.speed = config.ZOMBIE_WALK_SPEED if speed is None else speed
+
+    def update(self, zombies: Sequence, dt_ms: int) -> None:
+        """Advance every walking zombie and resolve overlaps"""
+        step = self.speed * dt_ms / 1000
+        movers = [zombie for zombie in zombies if zombie.alive and not zombie.clicked]
+
+        for zombie in movers:
+            self._walk(zombie, step)
+
+        self.separate(zombies)
+
+        for zombie in movers:
+            zombie.rect.center = (round(zombie.fx), round(zombie.fy))
+
+    def _walk(self, zombie, step: float) -> None:
+        """Move a zombie towards its waypoint"""
+        if zombie.waypoint is None:
+            zombie.waypoint = get_random_position()
+
+        target_x, target_y = zombie.waypoint
+        dx = target_x - zombie.fx
+        dy = target_y - zombie.fy
+        distance = math.hypot(dx, dy)
+
+        if distance <= step:
+            zombie.fx, zombie.fy = target_x, target_y
+            zombie.waypoint = get_random_position()
+        else:
+            zombie.fx += dx / distance * step
+            zombie.fy += dy / distance * step
+
+    def separate(self, zombies: Sequence) -> None:
+        """Push overlapping zombies apart along their axis of least overlap"""
+        body_w, body_h = config.ZOMBIE_BODY_SIZE
+        half_w, half_h = body_w / 2, body_h / 2
+        # Work on plain lists; attribute access per pair dominates a crowded horde
+        xs = [z.fx for z in zombies]
+        ys = [z.fy for z in zombies]
+        moves = [z.alive and not z.clicked for z in zombies]
+        boxes = [(x - half_w, y - half_h, x + half_w, y + half_h) for x, y in zip(xs, ys)]
+        pushed = set()
+
+        for i, j in sweep_and_prune(boxes):
+            a_moves = moves[i]
+            b_moves = moves[j]
+            if not (a_moves or b_moves):
+                continue
+
+            # Positions may have changed since the sweep, so measure again
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            overlap_x = body_w - abs(dx)
+            overlap_y = body_h - abs(dy)
+            if overlap_x <= 0 or overlap_y <= 0:
+                continue
+            share = 0.5 if a_moves and b_moves else 1.0
+
+            if overlap_x < overlap_y:
+                push = (overlap_x if dx >= 0 else -overlap_x) * share
+                if a_moves:
+                    xs[i] += push
+                if b_moves:
+                    xs[j] -= push
+            else:
+                push = (overlap_y if dy >= 0 else -overlap_y) * share
+                if a_moves:
+                    ys[i] += push
+                if b_moves:
+                    ys[j] -= push
+            if a_moves:
+                pushed.add(i)
+            if b_moves:
+                pushed.add(j)
+
+        # Keep pushed zombies inside the play area
+        for i in pushed:
+            zombie = zombies[i]
+            zombie.fx = min(_MAX_X, max(_MIN_X, xs[i]))
+            zombie.fy = min(_MAX_Y, max(_MIN_Y, ys[i]))
@@ -0,0 +1,175 @@
+"""
+Vectorized particle bursts for hits and deaths.
+
+Particle state lives in preallocated NumPy arrays (position, velocity, age,
+lifetime, sprite) holding at most PARTICLE_BUDGET particles; live particles
+are always packed at the front. Each update integrates every particle with a
+few array operations and culls expired or off-screen ones by compacting the
+arrays, so there is no Python object per particle. Sprites come from a small
+pool baked at startup (a few colors and sizes per burst kind, each at several
+fade levels), and the renderer draws all particles with one blits() call.
+"""
+import math
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pygame
+
+import config
+import memory_stats
+import surface_cache
+
+FADE_STEPS = 4  # alpha levels baked per sprite
+
+
+class BurstKind(NamedTuple):
+    colors: Tuple[Tuple[int, int, int], ...]
+    radii: Tuple[int, ...]
+    speed: Tuple[float, float]  # pixels per second
+    life: Tuple[float, float]  # milliseconds
+    gravity: float  # share of PARTICLE_GRAVITY
+    count_setting: str  # config name of the default particle count
+
+
+BURSTS = {
+    "blood": BurstKind(((150, 0, 0), (190, 20, 20), (110, 0, 0)), (2, 3, 4),
+                       (80, 260), (350, 700), 1.0, "PARTICLE_BLOOD_COUNT"),
+    "spark": BurstKind(((255, 240, 120), (255, 255, 255)), (1, 2),
+                       (200, 450), (120, 300), 0.2, "PARTICLE_SPARK_COUNT"),
+    "death": BurstKind(((90, 0, 0), (60, 60, 60)), (3, 5),
+                       (30, 120), (400, 800), 0.4, "PARTICLE_DEATH_COUNT"),
+}
+
+
+class ParticleSystem:
+    """Fixed-budget particle arrays with vectorized integration and culling"""
+
+    def __init__(self, budget: Optional[int] = None, enabled: Optional[bool] = None):
+        self.budget = config.PARTICLE_BUDGET if budget is None else budget
+        self.enabled = config.PARTICLES_ENABLED if enabled is None else enabled
+        self.count = 0
+
+        if not self.enabled:
+            return
+
+        self.rng = np.random.default_rng()
+        self.pos = np.zeros((self.budget, 2), dtype=np.float32)
+        self.vel = np.zeros((self.budget, 2), dtype=np.float32)
+        self.age = np.zeros(self.budget, dtype=np.float32)
+        self.life = np.ones(self.budget, dtype=np.float32)
+        self.gravity = np.zeros(self.budget, dtype=np.float32)
+        self.base = np.zeros(self.budget, dtype=np.int32)  # first fade level in the pool
+
+        self._bake_pool()
+        memory_stats.register('particles', self._memory_usage)
+
+    def _memory_usage(self) -> Tuple[int, int]:
+        """(pool sprite count, bytes) of the sprite pool and particle arrays"""
+        arrays = (self.pos, self.vel, self.age, self.life, self.gravity, self.base)
+        return len(self.pool), memory_stats.surface_bytes(self.pool) + sum(a.nbytes for a in arrays)
+
+    def _bake_pool(self) -> None:
+        """Draw every sprite variant once, at each fade level"""
+        self.pool: List[pygame.Surface] = []
+        self.kind_variants = {}  # kind -> pool index of each variant's first fade level
+        offsets = []
+
+        for name, kind in BURSTS.items():
+            variants = []
+            for color in kind.colors:
+                for radius in kind.radii:
+                    variants.append(len(self.pool))
+                    size = radius * 2 + 1
+                    for step in range(FADE_STEPS):
+                        alpha = 255 * (FADE_STEPS - step) // FADE_STEPS
+                        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+                        pygame.draw.circle(sprite, color + (alpha,), (radius, radius), radius)
+                        self.pool.append(surface_cache.finalize(sprite, rle=False))
+                        offsets.append(radius)
+            self.kind_variants[name] = np.array(variants, dtype=np.int32)
+
+        self.offsets = np.array(offsets, dtype=np.float32)
+        surface_cache.register('particles', self._refinalize_pool)
+
+    def _refinalize_pool(self) -> None:
+        """Convert the pool again after the display format changed"""
+        self.pool = [surface_cache.finalize(sprite, rle=False) for sprite in self.pool]
+
+    def clear(self) -> None:
+        """Remove every particle"""
+        self.count = 0
+
+    def warm_up(self, screen: pygame.Surface) -> None:
+        """Run one burst of each kind through update and drawing, then clear"""
+        if not self.enabled:
+            return
+        for sprite in self.pool:
+            screen.blit(sprite, (0, 0))
+        for kind in BURSTS:
+            self.burst(kind, screen.get_rect().center)
+        self.update(16)
+        screen.blits(self.draw_list(), doreturn=False)
+        self.clear()
+
+    def burst(self, kind: str, pos: Tuple[int, int], count: Optional[int] = None) -> int:
+        """Emit a burst at a position; returns how many particles fit the budget"""
+        if not self.enabled:
+            return 0
+
+        spec = BURSTS[kind]
+        wanted = getattr(config, spec.count_setting) if count is None else count
+        n = min(wanted, self.budget - self.count)
+        if n <= 0:
+            return 0
+
+        rng = self.rng
+        start, end = self.count, self.count + n
+        angle = rng.uniform(0, 2 * math.pi, n)
+        speed = rng.uniform(spec.speed[0], spec.speed[1], n)
+        self.pos[start:end] = pos
+        self.vel[start:end, 0] = np.cos(angle) * speed
+        self.vel[start:end, 1] = np.sin(angle) * speed
+        self.age[start:end] = 0
+        self.life[start:end] = rng.uniform(spec.life[0], spec.life[1], n)
+        self.gravity[start:end] = spec.gravity * config.PARTICLE_GRAVITY
+        self.base[start:end] = rng.choice(self.kind_variants[kind], n)
+        self.count = end
+        return n
+
+    def update(self, dt_ms: int) -> None:
+        """Integrate every live particle and drop the expired or off-screen ones"""
+        n = self.count
+        if n == 0:
+            return
+
+        dt = dt_ms / 1000
+        pos, vel = self.pos[:n], self.vel[:n]
+        vel[:, 1] += self.gravity[:n] * dt
+        pos += vel * dt
+        self.age[:n] += dt_ms
+
+        keep = ((self.age[:n] < self.life[:n]) &
+                (pos[:, 0] > -8) & (pos[:, 0] < config.SCREEN_WIDTH + 8) &
+                (pos[:, 1] < config.SCREEN_HEIGHT + 8))
+        if keep.all():
+            return
+
+        # Compact survivors to the front of the arrays
+        alive = np.flatnonzero(keep)
+        k = len(alive)
+        for array in (self.pos, self.vel, self.age, self.life, self.gravity, self.base):
+            array[:k] = array[alive]
+        self.count = k
+
+    def draw_list(self) -> Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]:
+        """(sprite, topleft) pairs for a single Surface.blits() call"""
+        n = self.count
+        if n == 0:
+            return ()
+
+        fade = (self.age[:n] * FADE_STEPS / self.life[:n]).astype(np.int32)
+        np.minimum(fade, FADE_STEPS - 1, out=fade)
+        sprite = self.base[:n] + fade
+        topleft = (self.pos[:n] - self.offsets[sprite][:, None]).astype(np.int32)
+
+        return tuple(zip(map(self.pool.__getitem__, sprite.tolist()), topleft.tolist()))
@@ -0,0 +1,105 @@
+"""
+Headless gameplay recording for attract-mode and QA footage.
+
+Plays one seeded bot session on a virtual clock and captures every drawn
+frame with FrameCapture. Nothing waits for real time, so the run goes as
+fast as frames can be drawn and encoded. Without --keep-all, frames are
+dropped when the encoders fall behind, as in live capture. With it, the
+game waits for a free buffer instead.
+
+Usage (from the repository root):
+    python src/record_session.py --seed 7 --out data/capture/attract --set GAME_DURATION=20
+    ffmpeg -framerate 60 -pattern_type glob -i 'data/capture/attract/*.png' attract.mp4
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+# Headless drivers must be selected before pygame initializes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import config
+import game_clock
+from bot_player import BotPlayer, BotProfile
+from cli_config import parse_assignments
+
+
+def record(out_dir: str, seed: int = 0, keep_all: bool = False,
+           image_format: Optional[str] = None, profile: Optional[BotProfile] = None) -> Dict[str, Any]:
+    """Play and capture one round; returns timing and capture counts"""
+    from game import Game
+
+    pygame.init()
+    config.SCORE_STORE_ENABLED = False
+    config.TELEMETRY_ENABLED = False
+    if image_format:
+        config.CAPTURE_FORMAT = image_format
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Game()
+
+    random.seed(seed)
+    clock = game_clock.ManualClock()
+    game_clock.set_time_source(clock.get_ticks)
+    bot = BotPlayer(profile, seed)
+    frame_ms = 1000 / config.FPS
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.reset_game()
+    game.start_capture(out_dir, drop=not keep_all)
+    started = time.perf_counter()
+    frames = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        while game.state_manager.is_state(config.GameState.PLAYING):
+            clock.advance(frame_ms)
+            bot.tick(game, clock.get_ticks())
+            game.update()
+            game.draw()
+            frames += 1
+    drawn = time.perf_counter() - started
+    stats = game.capture.close()
+    elapsed = time.perf_counter() - started
+    game.capture = None
+
+    game_clock.set_time_source(None)
+    game.cleanup()
+    return {
+        "frames": frames,
+        "game_seconds": frames * frame_ms / 1000,
+        "draw_seconds": drawn,
+        "wall_seconds": elapsed,
+        "written": stats.written,
+        "dropped": stats.dropped,
+        "failed": stats.failed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record a headless bot session as images")
+    parser.add_argument("--out", default=config.CAPTURE_DIR + "session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", help="png, jpg, bmp, ... (default CAPTURE_FORMAT)")
+    parser.add_argument("--keep-all", action="store_true",
+                        help="wait for the encoders instead of dropping frames")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="override a config setting")
+    args = parser.parse_args()
+
+    for name, values in parse_assignments(args.set).items():
+        setattr(config, name, values[0])
+
+    result = record(args.out, args.seed, args.keep_all, args.format)
+    print(f"{result['frames']} frames ({result['game_seconds']:.1f}s of play) "
+          f"in {result['wall_seconds']:.1f}s, "
+          f"{result['game_seconds'] / result['wall_seconds']:.2f}x real time")
+    print(f"  written {result['written']}  dropped {result['dropped']}  failed {result['failed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Compact game-state snapshots and a rewind ring buffer.
+
+`encode_state()` packs everything needed to resume a round (score, misses,
+timers, cursor swing and every zombie's animation, lifetime and path fields)
+into a fixed-layout binary blob with struct. `RewindBuffer` keeps a bounded
+ring of checkpoints: each holds one full keyframe plus the following ticks
+as deltas (XOR against the previous tick, zlib-compressed), so recording a
+tick costs microseconds and memory is capped by the ring size. A lock guards
+the ring so the memory reporter can measure it from any thread.
+"""
+import struct
+import threading
+import zlib
+from collections import deque
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+import config
+import game_clock
+from sprites.animation import Clip
+from sprites.zombie import Zombie
+
+_STATES = list(config.GameState)
+
+# state, score, misses, game start, last spawn, last update, last click time,
+# click pos (flag, x, y), swing (flag, angle, timer), captured at, zombie count
+_HEADER = struct.Struct("<BiiiiiiBhhBfiiH")
+# serial, x, y, clip, clip start, alive, clicked, appear time, lifetime,
+# hurt time, waypoint (flag, x, y)
+_ZOMBIE = struct.Struct("<IffBiBBiiiBhh")
+
+
+def encode_state(game) -> bytes:
+    """Pack the resumable state of a game"""
+    click = game.last_click_pos
+    cursor = game.weapon_cursor
+    parts = [_HEADER.pack(
+        _STATES.index(game.state_manager.get_state()),
+        game.score, game.misses,
+        game.game_start_time, game.last_zombie_spawn, game.last_update_time,
+        game.last_click_time,
+        click is not None, click[0] if click else 0, click[1] if click else 0,
+        cursor.is_swinging, cursor.sword_angle, cursor.swing_timer,
+        game_clock.get_ticks(), len(game.zombies),
+    )]
+    for z in game.zombies:
+        waypoint = z.waypoint
+        parts.append(_ZOMBIE.pack(
+            z.serial, z.fx, z.fy, z.clip, z.clip_start, z.alive, z.clicked,
+            z.appear_time, z.lifetime, z.hurt_timer,
+            waypoint is not None, waypoint[0] if waypoint else 0, waypoint[1] if waypoint else 0,
+        ))
+    return b"".join(parts)
+
+
+def decode_state(game, data: bytes, rebase: bool = True) -> None:
+    """Restore a game from encode_state() output.
+
+    With rebase, every timer is shifted by the time elapsed since the
+    snapshot was taken, so the round resumes exactly where it paused.
+    """
+    (state, score, misses, start, last_spawn, last_update, last_click_time,
+     has_click, click_x, click_y, swinging, angle, swing_timer,
+     captured_at, count) = _HEADER.unpack_from(data, 0)
+    shift = game_clock.get_ticks() - captured_at if rebase else 0
+
+    game.state_manager.set_state(_STATES[state])
+    game.score = score
+    game.misses = misses
+    game.game_start_time = start + shift
+    game.last_zombie_spawn = last_spawn + shift
+    game.last_update_time = last_update + shift
+    game.last_click_time = last_click_time + shift
+    game.last_click_pos = (click_x, click_y) if has_click else None
+
+    cursor = game.weapon_cursor
+    cursor.is_swinging = bool(swinging)
+    cursor.sword_angle = angle
+    cursor.swing_timer = swing_timer + shift
+
+    zombies = []
+    for (serial, x, y, clip, clip_start, alive, clicked, appear, lifetime, hurt,
+         has_waypoint, waypoint_x, waypoint_y) in _ZOMBIE.iter_unpack(data[_HEADER.size:]):
+        zombies.append(Zombie.from_state(
+            serial, x, y, Clip(clip), clip_start + shift, bool(alive), bool(clicked),
+            appear + shift, lifetime, hurt + shift,
+            (waypoint_x, waypoint_y) if has_waypoint else None,
+        ))
+    game.zombies[:] = zombies
+
+
+def _xor(data: bytes, previous: bytes) -> bytes:
+    """XOR two blobs, padding the shorter one with zeros"""
+    size = max(len(data), len(previous))
+    return np.bitwise_xor(np.frombuffer(data.ljust(size, b"\0"), dtype=np.uint8),
+                          np.frombuffer(previous.ljust(size, b"\0"), dtype=np.uint8)).tobytes()
+
+
+class Checkpoint(NamedTuple):
+    tick: int
+    keyframe: bytes
+    deltas: List[Tuple[int, bytes]]  # (state length, compressed XOR delta), one per tick
+
+
+class RewindBuffer:
+    """Bounded ring of keyframes with delta-encoded ticks in between"""
+
+    def __init__(self, interval: Optional[int] = None, capacity: Optional[int] = None):
+        self.interval = interval or config.REWIND_CHECKPOINT_INTERVAL
+        self.checkpoints: Deque[Checkpoint] = deque(maxlen=capacity or config.REWIND_CHECKPOINTS)
+        self._previous = b""
+        self._last_tick: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop all recorded ticks"""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self.checkpoints.clear()
+        self._previous = b""
+        self._last_tick = None
+
+    def record(self, tick: int, data: bytes) -> None:
+        """Append the state of the next tick"""
+        with self._lock:
+            if self._last_tick is not None and tick != self._last_tick + 1:
+                self._clear()  # Ticks must be contiguous between keyframes
+
+            current = self.checkpoints[-1] if self.checkpoints else None
+            if current is None or tick - current.tick >= self.interval:
+                self.checkpoints.append(Checkpoint(tick, data, []))
+            else:
+                delta = zlib.compress(_xor(data, self._previous), 1)
+                current.deltas.append((len(data), delta))
+
+            self._previous = data
+            self._last_tick = tick
+
+    def truncate_after(self, tick: int) -> None:
+        """Forget ticks after `tick`, so recording continues from there"""
+        with self._lock:
+            data = self._state_at(tick)
+            if data is None:
+                self._clear()
+                return
+
+            while self.checkpoints[-1].tick > tick:
+                self.checkpoints.pop()
+            del self.checkpoints[-1].deltas[tick - self.checkpoints[-1].tick:]
+            self._previous = data
+            self._last_tick = tick
+
+    @property
+    def first_tick(self) -> Optional[int]:
+        return self.checkpoints[0].tick if self.checkpoints else None
+
+    @property
+    def last_tick(self) -> Optional[int]:
+        return self._last_tick
+
+    def state_at(self, tick: int) -> Optional[bytes]:
+        """Rebuild the state recorded for a tick, None if it is not in the ring"""
+        with self._lock:
+            return self._state_at(tick)
+
+    def _state_at(self, tick: int) -> Optional[bytes]:
+        if not self.checkpoints or not self.first_tick <= tick <= self._last_tick:
+            return None
+
+        checkpoint = None
+        for candidate in reversed(self.checkpoints):
+            if candidate.tick <= tick:
+                checkpoint = candidate
+                break
+
+        data = checkpoint.keyframe
+        for length, delta in checkpoint.deltas[:tick - checkpoint.tick]:
+            data = _xor(zlib.decompress(delta), data)[:length]
+        return data
+
+    def memory_usage(self) -> Tuple[int, int]:
+        """(checkpoint count, bytes held by keyframes and deltas)"""
+        with self._lock:
+            return len(self.checkpoints), sum(len(c.keyframe) + sum(len(d) for _, d in c.deltas)
+                                              for c in self.checkpoints)
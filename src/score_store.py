@@ -0,0 +1,200 @@
+"""
+Persistent high-score store.
+
+Scores are appended to a fixed-size binary record log by a background writer
+that fsyncs in batches. After every batch the writer also snapshots the top-N
+index together with the log offset it covers, so startup only replays the
+records written after the last snapshot instead of the whole history.
+"""
+import json
+import os
+import queue
+import struct
+import threading
+import time
+from typing import List, NamedTuple, Optional
+
+import config
+
+# timestamp (float64), score (int32), misses (int32)
+_RECORD = struct.Struct("<dii")
+_STOP = object()
+
+
+class ScoreRecord(NamedTuple):
+    score: int
+    misses: int
+    timestamp: float
+
+
+def _rank_key(record: ScoreRecord) -> tuple:
+    """Higher score first, then fewer misses, then the earlier run"""
+    return (-record.score, record.misses, record.timestamp)
+
+
+def _insert_ranked(top: List[ScoreRecord], record: ScoreRecord, limit: int) -> Optional[int]:
+    """Insert a record into a ranked list, returning its rank if it made the cut"""
+    key = _rank_key(record)
+    if len(top) >= limit and key >= _rank_key(top[-1]):
+        return None
+
+    rank = 0
+    while rank < len(top) and _rank_key(top[rank]) <= key:
+        rank += 1
+    top.insert(rank, record)
+    del top[limit:]
+    return rank
+
+
+class ScoreStore:
+    def __init__(self, log_path: Optional[str] = None, index_path: Optional[str] = None,
+                 top_n: Optional[int] = None, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = config.SCORE_STORE_ENABLED
+        self.log_path = log_path or config.SCORE_LOG_PATH
+        self.index_path = index_path or config.SCORE_INDEX_PATH
+        self.top_n = config.LEADERBOARD_SIZE if top_n is None else top_n
+        self.persistent = False
+
+        self._top: List[ScoreRecord] = []
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._log_offset = 0
+        self._durable_top: List[ScoreRecord] = []
+        self._writer: Optional[threading.Thread] = None
+
+        if enabled:
+            self._open()
+
+    def _open(self) -> None:
+        """Load the index and start the writer thread"""
+        try:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._load()
+            self.persistent = True
+        except OSError as e:
+            print(f"Could not open score store: {e}")
+            print("High scores will not be saved")
+            return
+
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="score-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _load(self) -> None:
+        """Restore the top-N index, replaying only the unindexed log tail"""
+        log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+
+        # Drop a torn record left by a crash mid-append
+        aligned_size = log_size - log_size % _RECORD.size
+        if aligned_size != log_size:
+            with open(self.log_path, "r+b") as log_file:
+                log_file.truncate(aligned_size)
+
+        offset = 0
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+            if 0 <= index["log_offset"] <= aligned_size:
+                offset = index["log_offset"]
+                self._top = [ScoreRecord(*entry) for entry in index["top"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or damaged index - rebuild it from the full log once
+            self._top = []
+
+        if offset < aligned_size:
+            with open(self.log_path, "rb") as log_file:
+                log_file.seek(offset)
+                tail = log_file.read(aligned_size - offset)
+            for timestamp, score, misses in _RECORD.iter_unpack(tail):
+                _insert_ranked(self._top, ScoreRecord(score, misses, timestamp), self.top_n)
+
+        self._top.sort(key=_rank_key)
+        del self._top[self.top_n:]
+        self._log_offset = aligned_size
+        # Index as it exists on disk; the live one may run ahead of the writer
+        self._durable_top = list(self._top)
+
+    def record(self, score: int, misses: int) -> Optional[int]:
+        """Record a finished round; returns its 0-based leaderboard rank or None"""
+        entry = ScoreRecord(score, misses, time.time())
+        with self._lock:
+            rank = _insert_ranked(self._top, entry, self.top_n)
+        if self.persistent:
+            self._queue.put(entry)
+        return rank
+
+    def top(self, limit: Optional[int] = None) -> List[ScoreRecord]:
+        """Get the best records, highest first"""
+        with self._lock:
+            return list(self._top[:limit])
+
+    def is_high_score(self, score: int, misses: int = 0) -> bool:
+        """Check if a score would enter the leaderboard"""
+        candidate = ScoreRecord(score, misses, time.time())
+        with self._lock:
+            return (len(self._top) < self.top_n or
+                    _rank_key(candidate) < _rank_key(self._top[-1]))
+
+    def _writer_loop(self) -> None:
+        """Append queued records and fsync them in batches"""
+        interval = config.SCORE_FSYNC_INTERVAL / 1000
+        pending: List[ScoreRecord] = []
+        stopping = False
+
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=interval if pending else None)
+                if item is _STOP:
+                    stopping = True
+                else:
+                    pending.append(item)
+                    if len(pending) < config.SCORE_FSYNC_BATCH:
+                        continue
+            except queue.Empty:
+                pass
+
+            if pending:
+                self._flush(pending)
+                pending = []
+
+    def _flush(self, records: List[ScoreRecord]) -> None:
+        """Write a batch to the log, fsync it and snapshot the index"""
+        data = b"".join(_RECORD.pack(r.timestamp, r.score, r.misses) for r in records)
+        try:
+            with open(self.log_path, "ab") as log_file:
+                log_file.write(data)
+                log_file.flush()
+                os.fsync(log_file.fileno())
+            self._log_offset += len(data)
+
+            for record in records:
+                _insert_ranked(self._durable_top, record, self.top_n)
+            top = [list(record) for record in self._durable_top]
+            temp_path = self.index_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as index_file:
+                json.dump({"log_offset": self._log_offset, "top": top}, index_file)
+                index_file.flush()
+                os.fsync(index_file.fileno())
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"Could not save scores: {e}")
+            self._discard_partial_write()
+
+    def _discard_partial_write(self) -> None:
+        """Cut the log back to the last whole batch so later records stay aligned"""
+        try:
+            if os.path.getsize(self.log_path) > self._log_offset:
+                os.truncate(self.log_path, self._log_offset)
+        except OSError as e:
+            print(f"Could not roll back the score log: {e}")
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer"""
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
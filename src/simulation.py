@@ -0,0 +1,103 @@
+"""
+Threaded simulation with double-buffered render snapshots.
+
+In threaded mode the simulation (input dispatch, Game.update, spawning and
+zombie updates) runs on its own thread at a fixed rate. After every step it
+publishes an immutable RenderSnapshot into a SnapshotBuffer; the main thread
+only pumps events, forwards them through a queue and renders the latest
+snapshot, so a slow display.flip no longer delays zombie expiry or spawning.
+All shared state (game objects, menus, caches) is changed on the simulation
+thread only; the render thread never reads it outside a snapshot.
+"""
+import queue
+import threading
+import time
+from typing import NamedTuple, Optional, Tuple
+
+import pygame
+
+import config
+import memory_stats
+import surface_cache
+
+
+class RenderSnapshot(NamedTuple):
+    state: config.GameState
+    zombies: Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]  # (frame, topleft)
+    score: int
+    misses: int
+    remaining_time: int
+    last_click_pos: Optional[tuple]
+    swing: Tuple[bool, float, int]  # WeaponCursor.swing_state()
+    leaderboard: tuple
+    last_rank: Optional[int]
+    particles: Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...] = ()  # (sprite, topleft)
+    menu: Tuple[bool, int, float, float] = (False, 0, 1.0, 1.0)  # (in settings, selected item, music, sound)
+    memory: Optional[list] = None  # memory_stats sample while the overlay is shown; never mutated
+
+
+class SnapshotBuffer:
+    """Two snapshot slots: the simulation fills the back one, then swaps"""
+
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+        self.sequence = 0
+
+    def publish(self, snapshot: RenderSnapshot) -> None:
+        """Fill the back slot and make it the front one"""
+        with self._lock:
+            back = 1 - self._front
+            self._slots[back] = snapshot
+            self._front = back
+            self.sequence += 1
+
+    def latest(self) -> Optional[RenderSnapshot]:
+        """Most recently published snapshot"""
+        with self._lock:
+            return self._slots[self._front]
+
+
+class SimulationThread(threading.Thread):
+    """Runs input dispatch and Game.update at a fixed rate"""
+
+    def __init__(self, game, buffer: SnapshotBuffer, events: "queue.Queue"):
+        super().__init__(name="simulation", daemon=True)
+        self.game = game
+        self.buffer = buffer
+        self.events = events
+        self.step_seconds = 1 / config.SIMULATION_RATE
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        game = self.game
+        next_step = time.perf_counter()
+
+        while game.running and not self._stop_event.is_set():
+            # Input forwarded by the render thread
+            while True:
+                try:
+                    event = self.events.get_nowait()
+                except queue.Empty:
+                    break
+                game.input_handler.handle_event(event)
+
+            surface_cache.refresh_if_display_changed()
+            if game.hot_reloader:
+                game.hot_reloader.apply()
+            game.update()
+            memory_stats.sample_if_due()
+            self.buffer.publish(game.capture_snapshot())
+
+            # Fixed rate; skip ahead instead of bursting after a stall
+            next_step += self.step_seconds
+            delay = next_step - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                next_step = time.perf_counter()
+
+    def stop(self) -> None:
+        """Ask the thread to finish its current step and exit"""
+        self._stop_event.set()
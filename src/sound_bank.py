@@ -0,0 +1,110 @@
+"""
+Pre-rendered sound variation bank.
+
+Playing the same sample on every hit gets repetitive. For each varied effect
+the bank renders a few pitch- and gain-shifted copies once, offline, with
+pygame.sndarray and NumPy: pitch by resampling the waveform (linear
+interpolation), gain by scaling and clipping the samples. Playing a variant
+is then just playing a different Sound.
+
+Rendered variants are cached under SOUND_CACHE_DIR, keyed by the source
+file, the mixer format and the variation settings, so warm starts only load
+arrays from disk.
+"""
+import hashlib
+import os
+import random
+from typing import List, Optional
+
+import numpy as np
+import pygame
+
+import config
+
+
+def variation_settings(count: int) -> List[tuple]:
+    """(pitch, gain) pairs spread evenly over the configured ranges"""
+    low_pitch, high_pitch = config.SOUND_PITCH_RANGE
+    low_gain, high_gain = config.SOUND_GAIN_RANGE
+    rng = random.Random(config.SOUND_VARIATION_SEED)
+    settings = []
+    for i in range(count):
+        # Even pitch steps so variants are audibly distinct, random gains
+        pitch = low_pitch + (high_pitch - low_pitch) * i / max(1, count - 1)
+        settings.append((round(pitch, 4), round(rng.uniform(low_gain, high_gain), 4)))
+    return settings
+
+
+def render_variant(samples, pitch: float, gain: float):
+    """Resample by a pitch factor and scale by a gain, keeping the dtype"""
+    length = len(samples)
+    new_length = max(1, int(length / pitch))
+    positions = np.arange(new_length) * pitch
+    source = np.arange(length)
+    data = samples.astype(np.float32)
+
+    if data.ndim == 1:
+        shifted = np.interp(positions, source, data)
+    else:
+        shifted = np.stack([np.interp(positions, source, data[:, channel])
+                            for channel in range(data.shape[1])], axis=1)
+
+    shifted *= gain
+    if np.issubdtype(samples.dtype, np.integer):
+        info = np.iinfo(samples.dtype)
+        np.clip(shifted, info.min, info.max, out=shifted)
+    return np.ascontiguousarray(shifted.astype(samples.dtype))
+
+
+class SoundBank:
+    """Variants of each sound effect, picked at random at play time"""
+
+    def __init__(self, cache_dir: Optional[str] = None, count: Optional[int] = None):
+        self.cache_dir = config.SOUND_CACHE_DIR if cache_dir is None else cache_dir
+        self.count = config.SOUND_VARIANTS if count is None else count
+        self.variants = {}  # sound name -> list of Sounds
+        self.enabled = self.count > 1
+        # Own generator, so playing sounds never shifts seeded gameplay randomness
+        self.rng = random.Random()
+
+    def _cache_path(self, path: str, settings: List[tuple]) -> str:
+        """Cache file for a source sound, the mixer format and the settings"""
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}:{pygame.mixer.get_init()}:{settings}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.npz")
+
+    def build(self, sound_name: str, sound: pygame.mixer.Sound, path: str) -> List[pygame.mixer.Sound]:
+        """Load or render the variants of one effect"""
+        if not self.enabled:
+            return [sound]
+
+        settings = variation_settings(self.count)
+        cache_path = self._cache_path(path, settings)
+        arrays = None
+        try:
+            with np.load(cache_path) as cached:
+                arrays = [cached[f"v{i}"] for i in range(len(settings))]
+        except (OSError, KeyError, ValueError):
+            pass
+
+        if arrays is None:
+            samples = pygame.sndarray.array(sound)
+            arrays = [render_variant(samples, pitch, gain) for pitch, gain in settings]
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write then rename so a crash never leaves a truncated cache
+                temp_path = cache_path + ".tmp.npz"
+                np.savez(temp_path, **{f"v{i}": array for i, array in enumerate(arrays)})
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                print(f"Could not cache sound variants for {sound_name}: {e}")
+
+        self.variants[sound_name] = [pygame.sndarray.make_sound(array) for array in arrays]
+        return self.variants[sound_name]
+
+    def pick(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Random variant of an effect, None if it has none"""
+        variants = self.variants.get(sound_name)
+        return self.rng.choice(variants) if variants else None
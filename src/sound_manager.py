@@ -4,8 +4,17 @@ Sound and music management system
 import pygame
 import os
 import config
+import memory_stats
+from sound_bank import SoundBank
 from typing import Dict, List, Optional
 
+# Candidate files for each sound effect, first existing one wins
+SOUND_FILES = {
+    config.SoundType.CLICK.value: ['click.wav', 'button.wav', 'menu_select.wav'],
+    config.SoundType.HIT.value: ['hit.wav', 'punch.wav', 'whack.wav'],
+    config.SoundType.MISS.value: ['miss.wav', 'swing.wav']
+}
+
 class SoundManager:
     def __init__(self):
         self.sound_enabled = False
@@ -13,8 +22,20 @@ class SoundManager:
         self.music_volume = config.DEFAULT_MUSIC_VOLUME
         self.sound_volume = config.DEFAULT_SOUND_VOLUME
         self.background_music_loaded = False
+        self.bank = SoundBank()
         
         self.init_sounds()
+        memory_stats.register('sounds', self._sounds_memory)
+        memory_stats.register('sound_variants', self._variants_memory)
+    
+    def _sounds_memory(self):
+        """(sound count, PCM bytes) of the loaded effects"""
+        return len(self.sounds), memory_stats.sound_bytes(self.sounds.values())
+    
+    def _variants_memory(self):
+        """(variant count, PCM bytes) of the pre-rendered variants"""
+        variants = [sound for sounds in self.bank.variants.values() for sound in sounds]
+        return len(variants), memory_stats.sound_bytes(variants)
     
     def init_sounds(self) -> None:
         """Initialize sound system and load sound effects"""
@@ -33,15 +54,21 @@ class SoundManager:
     
     def _load_sound_effects(self) -> None:
         """Load sound effect files"""
-        sound_files = {
-            config.SoundType.CLICK.value: ['click.wav', 'button.wav', 'menu_select.wav'],
-            config.SoundType.HIT.value: ['hit.wav', 'punch.wav', 'whack.wav'],
-            config.SoundType.MISS.value: ['miss.wav', 'swing.wav']
-        }
-        
-        for sound_name, possible_files in sound_files.items():
+        for sound_name, possible_files in SOUND_FILES.items():
             self._try_load_sound_files(sound_name, possible_files)
     
+    def reload_sound_file(self, sound_file: str) -> int:
+        """Reload the effects that may come from a changed file; returns how many"""
+        if not self.sound_enabled:
+            return 0
+        
+        reloaded = 0
+        for sound_name, possible_files in SOUND_FILES.items():
+            if sound_file in possible_files:
+                self._try_load_sound_files(sound_name, possible_files)
+                reloaded += 1
+        return reloaded
+    
     def _try_load_sound_files(self, sound_name: str, possible_files: List[str]) -> None:
         """Try to load sound files from a list of possibilities"""
         for sound_file in possible_files:
@@ -50,6 +77,8 @@ class SoundManager:
                 if os.path.exists(sound_path):
                     sound = pygame.mixer.Sound(sound_path)
                     sound.set_volume(self.sound_volume)
+                    if sound_name in config.SOUND_VARIED_EFFECTS:
+                        self._build_variants(sound_name, sound, sound_path)
                     self.sounds[sound_name] = sound
                     print(f"Loaded sound effect: {sound_file} as {sound_name}")
                     return
@@ -57,9 +86,20 @@ class SoundManager:
                 print(f"Could not load {sound_file}: {e}")
                 continue
         
-        # If no sound file found, skip (no fallback sound)
+        # If no sound file found, skip (no fallback sound); drop one removed since loading
+        self.sounds.pop(sound_name, None)
+        self.bank.variants.pop(sound_name, None)
         print(f"No sound effect available for {sound_name}")
     
+    def _build_variants(self, sound_name: str, sound: pygame.mixer.Sound, sound_path: str) -> None:
+        """Render (or load cached) pitch and gain variants of an effect"""
+        try:
+            for variant in self.bank.build(sound_name, sound, sound_path):
+                variant.set_volume(self.sound_volume)
+        except Exception as e:
+            print(f"Could not build variants for {sound_name}: {e}")
+            self.bank.variants.pop(sound_name, None)
+    
     def _load_background_music(self) -> None:
         """Load background music"""
         music_files = [
@@ -86,10 +126,32 @@ class SoundManager:
         """Play a sound effect"""
         if self.sound_enabled and sound_name in self.sounds:
             try:
-                self.sounds[sound_name].play()
+                (self.bank.pick(sound_name) or self.sounds[sound_name]).play()
             except Exception as e:
                 print(f"Error playing sound {sound_name}: {e}")
     
+    def warm_up(self) -> None:
+        """Play every effect once on a muted channel so the first real play does not stall"""
+        if not self.sound_enabled:
+            return
+        try:
+            channel = pygame.mixer.find_channel(True)
+            if channel is None:
+                return
+            volume = channel.get_volume()
+            channel.set_volume(0)
+            sounds = list(self.sounds.values())
+            for variants in self.bank.variants.values():
+                sounds.extend(variants)
+            try:
+                for sound in sounds:
+                    channel.play(sound)
+                channel.stop()
+            finally:
+                channel.set_volume(volume)
+        except Exception as e:
+            print(f"Could not warm up sound effects: {e}")
+    
     def start_background_music(self) -> None:
         """Start playing background music"""
         if self.sound_enabled and self.background_music_loaded:
@@ -107,12 +169,31 @@ class SoundManager:
             except:
                 pass
     
+    def pause_background_music(self) -> None:
+        """Pause background music"""
+        if self.sound_enabled:
+            try:
+                pygame.mixer.music.pause()
+            except:
+                pass
+    
+    def resume_background_music(self) -> None:
+        """Resume paused background music"""
+        if self.sound_enabled:
+            try:
+                pygame.mixer.music.unpause()
+            except:
+                pass
+    
     def set_sound_volume(self, volume: float) -> None:
         """Set volume for all sound effects"""
         self.sound_volume = max(config.MIN_VOLUME, min(config.MAX_VOLUME, volume))
         if self.sound_enabled:
             for sound in self.sounds.values():
                 sound.set_volume(self.sound_volume)
+            for variants in self.bank.variants.values():
+                for sound in variants:
+                    sound.set_volume(self.sound_volume)
     
     def set_music_volume(self, volume: float) -> None:
         """Set music volume"""
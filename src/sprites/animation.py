@@ -0,0 +1,149 @@
+"""
+Data-driven animation clips and precomputed timelines.
+
+Every zombie clip in assets/images/zombie is described once in CLIPS: which
+folder it comes from, how long each frame lasts, what happens when it ends
+(loop, hold the last frame or continue with another clip) and which event it
+fires on completion. Durations and frame limits come from config when a
+Timeline is built, and a Timeline turns a clip and its loaded frames into a
+lookup table, so finding the frame for any elapsed time is a single index.
+"""
+from enum import IntEnum
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+import config
+
+# What a clip does once its last frame has played
+LOOP = "loop"
+HOLD = "hold"
+NEXT = "next"
+
+# Animation event fired when the dying clip completes
+EVENT_DEAD = "dead"
+
+
+class Clip(IntEnum):
+    IDLE = 0
+    IDLE_BLINKING = 1
+    HURT = 2
+    DYING = 3
+    WALKING = 4
+    RUNNING = 5
+    SLASHING = 6
+    SLASHING_IN_THE_AIR = 7
+    RUN_SLASHING = 8
+    THROWING = 9
+    THROWING_IN_THE_AIR = 10
+    RUN_THROWING = 11
+    KICKING = 12
+    JUMP_START = 13
+    JUMP_LOOP = 14
+    SLIDING = 15
+    FALLING_DOWN = 16
+
+
+class ClipTiming(NamedTuple):
+    frame_limit: Optional[int]  # None uses every frame in the folder
+    frame_duration: int  # milliseconds per frame
+    duration: Optional[int]  # spreads the frames over this many milliseconds
+
+
+class ClipSpec(NamedTuple):
+    folder: str
+    end: str = LOOP
+    next_clip: Optional[Clip] = None
+    frame_limit: Optional[str] = None  # config setting capping the frames loaded
+    frame_duration: Optional[int] = None  # None uses ANIMATION_FRAME_DURATION
+    duration: Optional[Callable[[], int]] = None  # clip length from config, in milliseconds
+    # Fired when a non-looping clip completes; a held clip keeps firing it on
+    # every update, so held events should end the clip (like EVENT_DEAD)
+    event: Optional[str] = None
+
+    def timing(self) -> ClipTiming:
+        """Frame limit and durations from the current config"""
+        return ClipTiming(
+            getattr(config, self.frame_limit) if self.frame_limit else None,
+            config.ANIMATION_FRAME_DURATION if self.frame_duration is None else self.frame_duration,
+            None if self.duration is None else self.duration(),
+        )
+
+
+CLIPS = {
+    Clip.IDLE: ClipSpec("Idle", frame_limit="FRAME_LIMIT_IDLE"),
+    Clip.IDLE_BLINKING: ClipSpec("Idle Blinking"),
+    Clip.HURT: ClipSpec("Hurt", NEXT, Clip.DYING, frame_limit="FRAME_LIMIT_HURT",
+                        duration=lambda: config.ZOMBIE_HURT_DURATION),
+    Clip.DYING: ClipSpec("Dying", HOLD, frame_limit="FRAME_LIMIT_DYING",
+                         duration=lambda: config.ZOMBIE_DEATH_TIMEOUT - config.ZOMBIE_HURT_DURATION,
+                         event=EVENT_DEAD),
+    Clip.WALKING: ClipSpec("Walking"),
+    Clip.RUNNING: ClipSpec("Running"),
+    Clip.SLASHING: ClipSpec("Slashing", NEXT, Clip.IDLE),
+    Clip.SLASHING_IN_THE_AIR: ClipSpec("Slashing in The Air", NEXT, Clip.JUMP_LOOP),
+    Clip.RUN_SLASHING: ClipSpec("Run Slashing", NEXT, Clip.RUNNING),
+    Clip.THROWING: ClipSpec("Throwing", NEXT, Clip.IDLE),
+    Clip.THROWING_IN_THE_AIR: ClipSpec("Throwing in The Air", NEXT, Clip.JUMP_LOOP),
+    Clip.RUN_THROWING: ClipSpec("Run Throwing", NEXT, Clip.RUNNING),
+    Clip.KICKING: ClipSpec("Kicking", NEXT, Clip.IDLE),
+    Clip.JUMP_START: ClipSpec("Jump Start", NEXT, Clip.JUMP_LOOP),
+    Clip.JUMP_LOOP: ClipSpec("Jump Loop"),
+    Clip.SLIDING: ClipSpec("Sliding", NEXT, Clip.RUNNING),
+    Clip.FALLING_DOWN: ClipSpec("Falling Down", HOLD),
+}
+
+
+class Timeline:
+    """Frame lookup table for one loaded clip"""
+
+    __slots__ = ('clip', 'frames', 'total', 'end', 'next_clip', 'event', 'timing',
+                 'resolution', 'frame_table', '_lookup')
+
+    def __init__(self, clip: Clip, frames: Sequence):
+        spec = CLIPS[clip]
+        timing = self.timing = spec.timing()
+        self.clip = clip
+        self.frames = tuple(frames)
+        self.end = spec.end
+        self.next_clip = spec.next_clip
+        self.event = spec.event
+
+        durations = self._frame_durations(timing, len(self.frames))
+        self.total = max(1, sum(durations))
+
+        # One entry per resolution step: elapsed // resolution -> frame index
+        resolution = self.resolution = config.ANIMATION_TIMELINE_RESOLUTION
+        lookup: List[int] = []
+        frame_end = 0
+        for index, duration in enumerate(durations):
+            frame_end += duration
+            while len(lookup) * resolution < frame_end:
+                lookup.append(index)
+        self._lookup = lookup or [0]
+        # Same table holding the surfaces, for the per-frame hot path
+        self.frame_table = tuple(self.frames[i] for i in self._lookup)
+
+    @staticmethod
+    def _frame_durations(timing: ClipTiming, count: int) -> List[int]:
+        """Per-frame durations in milliseconds"""
+        if count == 0:
+            return []
+        if timing.duration is None:
+            return [timing.frame_duration] * count
+        # Spread the clip duration evenly, giving leftovers to the first frames
+        base, extra = divmod(timing.duration, count)
+        return [base + (1 if i < extra else 0) for i in range(count)]
+
+    def is_current(self) -> bool:
+        """False once the config settings it was built from have changed"""
+        return (self.timing == CLIPS[self.clip].timing() and
+                self.resolution == config.ANIMATION_TIMELINE_RESOLUTION)
+
+    def frame_index(self, elapsed: int) -> int:
+        """Frame index for the time since the clip started"""
+        if elapsed >= self.total:
+            elapsed = elapsed % self.total if self.end == LOOP else self.total - 1
+        return self._lookup[elapsed // self.resolution]
+
+    def frame(self, elapsed: int):
+        """Frame surface for the time since the clip started"""
+        return self.frames[self.frame_index(elapsed)]
@@ -1,179 +1,269 @@
 import pygame
 import random
 import os
+import itertools
+from typing import Dict, List
 from utils import load_image
 import config
+import game_clock
+import surface_cache
+import memory_stats
+from sprites.animation import Clip, CLIPS, Timeline, LOOP, NEXT, EVENT_DEAD
 
-# Cache for shared sprite images to reduce memory usage
-_sprite_cache = {
-    'idle_frames': None,
-    'hurt_frames': None,
-    'dying_frames': None
+# Cache for shared sprite images to reduce memory usage, keyed by Clip
+_sprite_cache: Dict[Clip, List[pygame.Surface]] = {}
+
+# Hit masks for every cached frame, keyed by the frame surface
+_frame_masks: Dict[pygame.Surface, pygame.mask.Mask] = {}
+
+# Timelines shared by every zombie, indexed by Clip (None until loaded)
+_timelines: List = [None] * len(Clip)
+
+# Clips loaded up front; the rest load the first time a zombie plays them
+PRELOAD_CLIPS = (Clip.IDLE, Clip.HURT, Clip.DYING)
+
+# Solid colors used when a clip's frames cannot be loaded
+_FALLBACK_COLORS = {
+    Clip.IDLE: (0, 255, 0),
+    Clip.HURT: (255, 255, 0),
+    Clip.DYING: (255, 0, 0),
 }
 
-def load_shared_animations():
-    """Load animation frames once and share between all zombies"""
-    if _sprite_cache['idle_frames'] is not None:
-        return _sprite_cache
-    
+# Serial numbers identify zombies in telemetry events
+_serials = itertools.count(1)
+
+def _load_clip_frames(clip):
+    """Load, scale and finalize the frames of one clip"""
+    spec = CLIPS[clip]
+    frames = []
+    clip_path = os.path.join(config.IMG_DIR, "zombie", spec.folder)
+    if os.path.exists(clip_path):
+        files = sorted(f for f in os.listdir(clip_path) if f.endswith('.png'))
+        for file in files[:spec.timing().frame_limit]:
+            img = load_image(f"zombie/{spec.folder}/{file}")
+            img = surface_cache.finalize(pygame.transform.scale(img, config.ZOMBIE_SIZE))
+            frames.append(img)
+    return frames
+
+def load_clip(clip):
+    """Load one clip once and share its timeline between all zombies"""
+    timeline = _timelines[clip]
+    if timeline is not None and clip in _sprite_cache:
+        return timeline
+
     try:
-        # Load idle animation
-        idle_frames = []
-        idle_path = os.path.join(config.IMG_DIR, "zombie", "Idle")
-        if os.path.exists(idle_path):
-            idle_files = sorted([f for f in os.listdir(idle_path) if f.endswith('.png')])[:config.FRAME_LIMIT_IDLE]
-            for file in idle_files:
-                img = load_image(f"zombie/Idle/{file}")
-                img = pygame.transform.scale(img, (120, 120))
-                idle_frames.append(img)
-        
-        # Load hurt animation
-        hurt_frames = []
-        hurt_path = os.path.join(config.IMG_DIR, "zombie", "Hurt")
-        if os.path.exists(hurt_path):
-            hurt_files = sorted([f for f in os.listdir(hurt_path) if f.endswith('.png')])[:config.FRAME_LIMIT_HURT]
-            for file in hurt_files:
-                img = load_image(f"zombie/Hurt/{file}")
-                img = pygame.transform.scale(img, (120, 120))
-                hurt_frames.append(img)
-        
-        # Load dying animation
-        dying_frames = []
-        dying_path = os.path.join(config.IMG_DIR, "zombie", "Dying")
-        if os.path.exists(dying_path):
-            dying_files = sorted([f for f in os.listdir(dying_path) if f.endswith('.png')])[:config.FRAME_LIMIT_DYING]
-            for file in dying_files:
-                img = load_image(f"zombie/Dying/{file}")
-                img = pygame.transform.scale(img, (120, 120))
-                dying_frames.append(img)
-        
-        _sprite_cache['idle_frames'] = idle_frames
-        _sprite_cache['hurt_frames'] = hurt_frames
-        _sprite_cache['dying_frames'] = dying_frames
-        
+        frames = _load_clip_frames(clip)
     except Exception as e:
-        print(f"Error loading zombie animations: {e}")
-        # Fallback sprites
-        size = (120, 120)
-        idle_surf = pygame.Surface(size)
-        idle_surf.fill((0, 255, 0))
-        hurt_surf = pygame.Surface(size)
-        hurt_surf.fill((255, 255, 0))
-        dying_surf = pygame.Surface(size)
-        dying_surf.fill((255, 0, 0))
-        
-        _sprite_cache['idle_frames'] = [idle_surf]
-        _sprite_cache['hurt_frames'] = [hurt_surf]
-        _sprite_cache['dying_frames'] = [dying_surf]
-    
+        print(f"Error loading zombie animation {CLIPS[clip].folder}: {e}")
+        frames = []
+
+    if not frames:
+        # Fallback sprite
+        fallback = pygame.Surface(config.ZOMBIE_SIZE)
+        fallback.fill(_FALLBACK_COLORS.get(clip, (128, 128, 128)))
+        frames = [surface_cache.finalize(fallback)]
+
+    _sprite_cache[clip] = frames
+    _build_masks(frames)
+    _timelines[clip] = Timeline(clip, frames)
+    surface_cache.register('zombie_frames', _refinalize_frames)
+    memory_stats.register('zombie_frames', _frames_memory)
+    memory_stats.register('zombie_masks', _masks_memory)
+    return _timelines[clip]
+
+def _build_masks(frames):
+    """Compute the hit mask of each frame once, at load time"""
+    for frame in frames:
+        _frame_masks[frame] = pygame.mask.from_surface(frame, config.ZOMBIE_HIT_ALPHA)
+
+def _frames_memory():
+    """(frame count, bytes) of the shared zombie frames"""
+    frames = [frame for frames in _sprite_cache.values() for frame in frames]
+    return len(frames), memory_stats.surface_bytes(frames)
+
+def _masks_memory():
+    """(mask count, bytes) of the hit masks, one bit per pixel"""
+    return len(_frame_masks), sum(w * h // 8 for w, h in (m.get_size() for m in _frame_masks.values()))
+
+def load_shared_animations():
+    """Load the clips every round needs once and share them between all zombies"""
+    for clip in PRELOAD_CLIPS:
+        load_clip(clip)
+    if config.ZOMBIE_MOVEMENT_ENABLED:
+        load_clip(Clip.WALKING)
     return _sprite_cache
 
-class Zombie(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        
-        # Position
-        self.x = x
-        self.y = y
-        
-        # Use shared animation frames to save memory
-        shared_animations = load_shared_animations()
-        self.idle_frames = shared_animations['idle_frames']
-        self.hurt_frames = shared_animations['hurt_frames']
-        self.dying_frames = shared_animations['dying_frames']
-        
-        # Current animation state
-        self.current_animation = "idle"
-        self.frame_index = 0
-        self.animation_speed = config.ANIMATION_SPEED
-        self.frame_timer = 0
-        
-        # Sprite properties
-        self.image = self.idle_frames[0]
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.centery = y
-        
+def warm_up(screen):
+    """Load the shared clips and blit every frame once (RLE surfaces encode on first blit)"""
+    for frames in load_shared_animations().values():
+        for frame in frames:
+            screen.blit(frame, (0, 0))
+
+def reload_clip(clip, zombies=()):
+    """Decode a loaded clip again and move the given zombies playing it onto the new frames.
+
+    Returns the new timeline, or None for a clip that was never loaded (it
+    loads fresh on first use anyway).
+    """
+    if clip not in _sprite_cache:
+        return None
+    old_frames = _sprite_cache[clip]
+    _timelines[clip] = None
+    timeline = load_clip(clip)
+    for frame in old_frames:
+        _frame_masks.pop(frame, None)
+    for zombie in zombies:
+        if zombie.clip == clip:
+            zombie.timeline = timeline
+            zombie.image = timeline.frame(max(0, game_clock.get_ticks() - zombie.clip_start))
+    return timeline
+
+def refresh_timelines():
+    """Rebuild timelines whose clip settings changed in config since they were built"""
+    for clip, timeline in enumerate(_timelines):
+        if timeline is None or timeline.is_current():
+            continue
+        clip = Clip(clip)
+        if timeline.timing.frame_limit != CLIPS[clip].timing().frame_limit:
+            reload_clip(clip)  # a different number of frames to decode
+        else:
+            _timelines[clip] = Timeline(clip, timeline.frames)
+
+def _refinalize_frames():
+    """Convert cached frames again after the display format changed"""
+    _frame_masks.clear()
+    for clip, frames in list(_sprite_cache.items()):
+        _sprite_cache[clip] = [surface_cache.finalize(frame) for frame in frames]
+        _build_masks(_sprite_cache[clip])
+        _timelines[clip] = Timeline(clip, _sprite_cache[clip])
+
+class Zombie:
+    """Compact zombie: no per-instance __dict__, frames live in shared timelines"""
+
+    __slots__ = (
+        'rect', 'image', 'clip', 'timeline', 'clip_start', 'fx', 'fy', 'waypoint',
+        'alive', 'clicked', 'appear_time', 'lifetime', 'hurt_timer', 'serial'
+    )
+
+    def __init__(self, x, y, clip=Clip.IDLE):
+        if not _sprite_cache:
+            load_shared_animations()
+
         # Game properties
+        self.serial = next(_serials)
         self.alive = True
         self.clicked = False
-        self.appear_time = pygame.time.get_ticks()
+        self.appear_time = game_clock.get_ticks()
         self.lifetime = random.randint(config.ZOMBIE_LIFETIME_MIN, config.ZOMBIE_LIFETIME_MAX)
-        
-        # State for dying animation
-        self.dying = False
         self.hurt_timer = 0
+
+        # Current animation state
+        self.play(clip, self.appear_time)
+        self.rect = self.image.get_rect(center=(x, y))
         
+        # Sub-pixel position and path target, used by movement.HordeMover
+        self.fx = float(x)
+        self.fy = float(y)
+        self.waypoint = None
+
+    @classmethod
+    def from_state(cls, serial, x, y, clip, clip_start, alive, clicked,
+                   appear_time, lifetime, hurt_timer, waypoint=None):
+        """Rebuild a zombie from saved fields without rolling a new lifetime"""
+        zombie = cls.__new__(cls)
+        zombie.serial = serial
+        zombie.alive = alive
+        zombie.clicked = clicked
+        zombie.appear_time = appear_time
+        zombie.lifetime = lifetime
+        zombie.hurt_timer = hurt_timer
+        zombie.fx = x
+        zombie.fy = y
+        zombie.waypoint = waypoint
+        zombie.clip = clip
+        zombie.timeline = _timelines[clip] or load_clip(clip)
+        zombie.clip_start = clip_start
+        zombie.image = zombie.timeline.frame(max(0, game_clock.get_ticks() - clip_start))
+        zombie.rect = zombie.image.get_rect(center=(round(x), round(y)))
+        return zombie
+
+    def play(self, clip, start_time=None):
+        """Start a clip from its first frame"""
+        self.clip = clip
+        self.timeline = _timelines[clip] or load_clip(clip)
+        self.clip_start = game_clock.get_ticks() if start_time is None else start_time
+        self.image = self.timeline.frames[0]
 
-    
     def update(self):
         """Update zombie animation and state"""
         if not self.alive:
             return
-            
-        current_time = pygame.time.get_ticks()
-        
+
+        current_time = game_clock.get_ticks()
+
         # Check if zombie should disappear (missed)
         if not self.clicked and current_time - self.appear_time > self.lifetime:
             self.alive = False
             return
-        
-        # Handle hurt state - faster transition to dying
-        if self.current_animation == "hurt" and current_time - self.hurt_timer > config.ZOMBIE_HURT_DURATION:
-            self.current_animation = "dying"
-            self.frame_index = 0
-            self.frame_timer = 0
-        
-        # Handle dying animation - ensure zombie dies quickly
-        if self.current_animation == "dying":
-            if self.frame_index >= len(self.dying_frames) - 1:
-                self.alive = False
-                return
-            # Force death after short time to prevent lag
-            elif current_time - self.hurt_timer > config.ZOMBIE_DEATH_TIMEOUT:
-                self.alive = False
-                return
-        
-        # Update animation frame - only update when timer reaches threshold
-        self.frame_timer += self.animation_speed
-        if self.frame_timer >= 1:
-            self.frame_timer = 0
-            frame_changed = False
-            
-            if self.current_animation == "idle" and len(self.idle_frames) > 0:
-                old_frame = self.frame_index
-                self.frame_index = (self.frame_index + 1) % len(self.idle_frames)
-                if old_frame != self.frame_index:
-                    self.image = self.idle_frames[self.frame_index]
-                    frame_changed = True
-                    
-            elif self.current_animation == "hurt" and len(self.hurt_frames) > 0:
-                if self.frame_index < len(self.hurt_frames) - 1:
-                    self.frame_index += 1
-                    self.image = self.hurt_frames[self.frame_index]
-                    frame_changed = True
-                    
-            elif self.current_animation == "dying" and len(self.dying_frames) > 0:
-                if self.frame_index < len(self.dying_frames) - 1:
-                    self.frame_index += 1
-                    self.image = self.dying_frames[self.frame_index]
-                    frame_changed = True
-                else:
-                    # Ensure zombie dies when animation completes
-                    self.alive = False
+
+        self.animate(current_time)
+
+    def animate(self, current_time):
+        """Advance the animation to a point in time, without the lifetime check"""
+        timeline = self.timeline
+        elapsed = current_time - self.clip_start
+        if elapsed >= timeline.total:
+            if timeline.end == LOOP:
+                elapsed %= timeline.total
+            else:
+                timeline, elapsed = self._finish_clip(timeline, elapsed)
+                if not self.alive:
                     return
-    
+
+        self.image = timeline.frame_table[elapsed // timeline.resolution]
+
+    def _finish_clip(self, timeline, elapsed):
+        """Fire end-of-clip events and follow transitions past finished clips"""
+        # Several clips can complete during one long frame
+        while elapsed >= timeline.total and timeline.end != LOOP:
+            if timeline.event is not None:
+                self.on_animation_event(timeline.event)
+                if not self.alive:
+                    break
+            if timeline.end != NEXT:
+                elapsed = timeline.total - 1  # Hold the last frame
+                break
+            self.clip_start += timeline.total
+            elapsed -= timeline.total
+            self.clip = timeline.next_clip
+            timeline = self.timeline = _timelines[self.clip] or load_clip(self.clip)
+
+        if elapsed >= timeline.total:
+            elapsed %= timeline.total
+        return timeline, elapsed
+
+    def on_animation_event(self, event):
+        """React to an event fired by a completed clip"""
+        if event == EVENT_DEAD:
+            self.alive = False
+
+    def hit_test(self, pos):
+        """Pixel-accurate hit test: rect as a fast reject, then the frame mask"""
+        rect = self.rect
+        if not rect.collidepoint(pos):
+            return False
+        mask = _frame_masks.get(self.image)
+        return mask is None or bool(mask.get_at((pos[0] - rect.x, pos[1] - rect.y)))
+
     def on_click(self):
         """Handle zombie being clicked"""
         if not self.clicked and self.alive:
             self.clicked = True
-            self.current_animation = "hurt"
-            self.frame_index = 0
-            self.frame_timer = 0
-            self.hurt_timer = pygame.time.get_ticks()
+            self.hurt_timer = game_clock.get_ticks()
+            self.play(Clip.HURT, self.hurt_timer)
             return True
         return False
-    
+
     def draw(self, screen):
         """Draw zombie on screen"""
         if self.alive:
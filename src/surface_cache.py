@@ -0,0 +1,92 @@
+"""
+Display-format surface finalization.
+
+Scaling a converted surface does not guarantee the copy still matches the
+display's pixel format, and any mismatch turns every blit into a conversion
+blit. `finalize()` converts a surface to the exact display format once its
+final size is known and picks the cheapest way to draw it:
+
+- opaque surfaces are converted with convert()
+- surfaces whose alpha is only fully on or off become colorkeyed
+- surfaces with soft alpha keep per-pixel alpha
+
+Colorkeyed and per-pixel alpha surfaces get RLEACCEL when enough of the
+frame is transparent for run-length encoding to skip work. Caches register a
+refresh callback so they are finalized again when the display format changes.
+"""
+import pygame
+from typing import Callable, Dict, Optional, Tuple
+
+import config
+
+# Caches to re-finalize when the display format changes
+_refreshers: Dict[str, Callable[[], None]] = {}
+_display_format: Optional[Tuple] = None
+
+
+def display_format() -> Optional[Tuple]:
+    """Pixel format of the current display surface, None without a display"""
+    screen = pygame.display.get_surface()
+    if screen is None:
+        return None
+    return (screen.get_bitsize(), screen.get_masks())
+
+
+def finalize(surface: pygame.Surface, rle: bool = True) -> pygame.Surface:
+    """Convert a surface to the display format and choose colorkey/alpha/RLE"""
+    if pygame.display.get_surface() is None:
+        return surface
+
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert()
+
+    width, height = surface.get_size()
+    pixel_count = max(1, width * height)
+    visible = pygame.mask.from_surface(surface, 0).count()  # alpha > 0
+    opaque = pygame.mask.from_surface(surface, 254).count()  # alpha == 255
+    transparent_fraction = 1 - visible / pixel_count
+    use_rle = rle and transparent_fraction >= config.RLE_MIN_TRANSPARENCY
+
+    if opaque == pixel_count:
+        return surface.convert()
+
+    if visible == opaque and not _uses_color(surface, config.COLORKEY):
+        # Binary alpha - a colorkey blit is cheaper than per-pixel blending
+        keyed = pygame.Surface((width, height))
+        keyed.fill(config.COLORKEY)
+        keyed.blit(surface, (0, 0))
+        keyed = keyed.convert()
+        keyed.set_colorkey(config.COLORKEY, pygame.RLEACCEL if use_rle else 0)
+        return keyed
+
+    converted = surface.convert_alpha()
+    if use_rle:
+        converted.set_alpha(255, pygame.RLEACCEL)
+    return converted
+
+
+def _uses_color(surface: pygame.Surface, color: Tuple[int, int, int]) -> bool:
+    """Check if any opaque pixel already has the given color"""
+    mask = pygame.mask.from_threshold(surface, color + (255,), (1, 1, 1, 1))
+    return mask.count() > 0
+
+
+def register(name: str, refresh: Callable[[], None]) -> None:
+    """Register a cache refresh callback run when the display format changes"""
+    global _display_format
+    _refreshers[name] = refresh
+    if _display_format is None:
+        _display_format = display_format()
+
+
+def refresh_if_display_changed() -> bool:
+    """Re-finalize registered caches after a display mode change"""
+    global _display_format
+    current = display_format()
+    if current is None or current == _display_format:
+        return False
+
+    _display_format = current
+    for refresh in list(_refreshers.values()):
+        refresh()
+    return True
@@ -0,0 +1,134 @@
+"""
+Asynchronous session telemetry writer.
+
+Gameplay code calls `emit()`, which only appends a tuple to a deque (atomic
+under the GIL, so no locks on the frame loop). A background thread drains the
+deque, encodes batches as JSON lines and appends them to gzip segments that
+rotate once they reach a size limit. When the deque is full new events are
+dropped and counted instead of stalling the game (the counter takes a lock,
+which only happens on that rare path).
+"""
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import config
+
+
+class Telemetry:
+    def __init__(self, enabled: Optional[bool] = None, directory: Optional[str] = None):
+        if enabled is None:
+            enabled = config.TELEMETRY_ENABLED
+        self.enabled = False
+        self.directory = directory or config.TELEMETRY_DIR
+        self.dropped = 0
+        self.written = 0
+        self._dropped_lock = threading.Lock()  # both threads count drops
+
+        self._events: deque = deque()
+        self._capacity = config.TELEMETRY_QUEUE_SIZE
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+
+        self._session = time.strftime("%Y%m%d-%H%M%S")
+        self._segment_index = 0
+        self._segment: Optional[gzip.GzipFile] = None
+        self._segment_file = None
+
+        if enabled:
+            self._start()
+
+    def _start(self) -> None:
+        """Create the output directory and start the writer thread"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            print(f"Could not create telemetry directory: {e}")
+            print("Telemetry disabled")
+            return
+
+        self.enabled = True
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="telemetry-writer", daemon=True
+        )
+        self._writer.start()
+
+    def emit(self, event_type: str, time_ms: int, **fields) -> None:
+        """Queue an event; never blocks, drops it when the queue is full"""
+        if not self.enabled:
+            return
+        if len(self._events) >= self._capacity:
+            with self._dropped_lock:
+                self.dropped += 1
+            return
+        self._events.append((event_type, time_ms, fields))
+        if len(self._events) >= config.TELEMETRY_BATCH_SIZE:
+            self._wake.set()
+
+    def _writer_loop(self) -> None:
+        """Drain queued events in batches until stopped"""
+        interval = config.TELEMETRY_FLUSH_INTERVAL / 1000
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            self._drain()
+        self._drain()
+        self._close_segment()
+
+    def _drain(self) -> None:
+        """Encode and write everything currently queued"""
+        lines = []
+        events = self._events
+        while events:
+            event_type, time_ms, fields = events.popleft()
+            fields["type"] = event_type
+            fields["t"] = time_ms
+            lines.append(json.dumps(fields, separators=(",", ":")))
+
+        if not lines:
+            return
+
+        try:
+            segment = self._current_segment()
+            segment.write(("\n".join(lines) + "\n").encode("utf-8"))
+            self.written += len(lines)
+            if self._segment_file.tell() >= config.TELEMETRY_SEGMENT_SIZE:
+                self._close_segment()
+        except OSError as e:
+            print(f"Could not write telemetry: {e}")
+            with self._dropped_lock:
+                self.dropped += len(lines)
+
+    def _current_segment(self) -> gzip.GzipFile:
+        """Get the open segment, starting a new one after rotation"""
+        if self._segment is None:
+            name = f"session-{self._session}-{self._segment_index:04d}.jsonl.gz"
+            self._segment_index += 1
+            self._segment_file = open(os.path.join(self.directory, name), "wb")
+            self._segment = gzip.GzipFile(fileobj=self._segment_file, mode="wb")
+        return self._segment
+
+    def _close_segment(self) -> None:
+        """Finish the current gzip segment"""
+        if self._segment is not None:
+            try:
+                self._segment.close()
+                self._segment_file.close()
+            except OSError as e:
+                print(f"Could not close telemetry segment: {e}")
+            self._segment = None
+            self._segment_file = None
+
+    def close(self) -> None:
+        """Flush queued events and stop the writer"""
+        if self._writer is not None:
+            self._stop.set()
+            self._wake.set()
+            self._writer.join()
+            self._writer = None
+        self.enabled = False
@@ -0,0 +1,202 @@
+"""
+Texture renderer backend using pygame._sdl2.
+
+Instead of blitting surfaces onto the display surface, this backend uploads
+each surface it draws (zombie frames, particle sprites, the sword, the
+background, swing effects and HUD glyphs) as a Texture once and draws with
+Renderer copies. Sword rotation and effect scaling and fading happen in the
+renderer, and the CPU only issues copy calls while playing. The menus and the
+pause and game over screens are still composed by the surface code on the
+hidden display and uploaded into one streaming texture per frame.
+
+The game keeps a hidden display-module window so surface conversion and the
+existing surface code keep working. The visible window belongs to the
+Renderer. RENDER_ACCELERATED picks a hardware (1) or software (0) renderer,
+or lets SDL choose (-1). The software renderer works with the dummy video
+driver, for testing.
+"""
+import weakref
+from typing import Dict, Tuple
+
+import pygame
+from pygame._sdl2.video import Renderer, Texture, Window
+
+import config
+import memory_stats
+from simulation import RenderSnapshot
+
+
+class TextureRenderer:
+    """Draws render snapshots with SDL textures"""
+
+    def __init__(self, game, vsync: bool = False):
+        self.game = game
+        size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.window = Window("Zombie Whacker Game", size)
+        self.renderer = Renderer(self.window, accelerated=config.RENDER_ACCELERATED, vsync=vsync)
+
+        # Uploaded surfaces; entries go away with their surface (e.g. after a hot reload)
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, Texture]" = weakref.WeakKeyDictionary()
+        self._glyphs: Dict[Tuple[int, tuple, str], Texture] = {}
+
+        # Non-playing screens are composed on the hidden display and streamed whole.
+        # (GameUI dims the scene with surface-alpha blits, which come out opaque
+        # when drawn onto a transparent layer.)
+        self._frame_texture = Texture(self.renderer, size, streaming=True)
+        self._frame_texture.blend_mode = pygame.BLENDMODE_NONE
+        # The memory overlay is drawn onto a transparent layer over the textured frame
+        self._overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
+        self._overlay_texture = Texture(self.renderer, size, streaming=True)
+        self._overlay_texture.blend_mode = pygame.BLENDMODE_BLEND
+
+        self._trail = self._bake_trail()
+        self._ring = self._bake_ring()
+        self.warmed_up = not config.WARMUP_ENABLED
+        memory_stats.register('textures', self._memory_usage)
+
+    def _memory_usage(self):
+        """(texture count, estimated bytes)"""
+        textures = list(self._textures.values()) + list(self._glyphs.values())
+        textures += [self._frame_texture, self._overlay_texture, self._trail, self._ring]
+        # An estimate: Texture does not expose its pixel format, and the driver decides
+        # how texture memory is stored. SDL creates these as 32-bit (A)RGB textures.
+        return len(textures), sum(t.width * t.height * 4 for t in textures)
+
+    def _bake_trail(self) -> Texture:
+        """Swing trail arc at full alpha; fading uses the texture alpha"""
+        surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+        pygame.draw.arc(surface, (255, 255, 0, 255), (10, 10, 40, 40), 0, 1.57, 3)
+        return Texture.from_surface(self.renderer, surface)
+
+    def _bake_ring(self) -> Texture:
+        """Impact ring at its largest radius; drawn scaled down and faded"""
+        surface = pygame.Surface((50, 50), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 255, 100, 255), (25, 25), 25, 3)
+        return Texture.from_surface(self.renderer, surface)
+
+    def texture(self, surface: pygame.Surface) -> Texture:
+        """Texture for a surface, uploaded on first use"""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._textures[surface] = Texture.from_surface(self.renderer, surface)
+        return texture
+
+    def draw_text(self, font: pygame.font.Font, text: str, color, pos) -> None:
+        """Draw text from cached per-character glyph textures"""
+        x, y = pos
+        glyphs = self._glyphs
+        for char in text:
+            key = (id(font), color, char)
+            glyph = glyphs.get(key)
+            if glyph is None:
+                glyph = glyphs[key] = Texture.from_surface(self.renderer, font.render(char, True, color))
+            glyph.draw(dstrect=(x, y, glyph.width, glyph.height))
+            x += glyph.width
+
+    def warm_up(self) -> None:
+        """Upload every texture a round uses; runs on the render thread with the first round"""
+        self.warmed_up = True
+        from sprites import zombie as zombie_sprites
+        for frames in zombie_sprites.load_shared_animations().values():
+            for frame in frames:
+                self.texture(frame)
+        for sprite in getattr(self.game.particles, 'pool', ()):
+            self.texture(sprite)
+        cursor = self.game.weapon_cursor
+        self.texture(cursor.original_sword)
+        self.texture(cursor.sword_image)
+        self.texture(self.game.background)
+        ui = self.game.ui
+        for label, color in (("Score: ", ui.colors.GREEN), ("Miss: ", ui.colors.RED), ("Time: ", ui.colors.WHITE)):
+            self.draw_text(ui.font_medium, label + "0123456789", color, (0, 0))
+        self.renderer.clear()
+
+    def draw(self, snapshot: RenderSnapshot) -> None:
+        """Render a snapshot and present it"""
+        if snapshot.state != config.GameState.PLAYING:
+            self._draw_composed(snapshot)
+            self._present()
+            return
+
+        if not self.warmed_up:
+            self.warm_up()
+        game = self.game
+        self.texture(game.background).draw()
+        self._draw_sprites(snapshot.zombies)
+        self._draw_sprites(snapshot.particles)
+        self._draw_hud(snapshot)
+        self._draw_weapon(snapshot)
+
+        if snapshot.memory is not None:
+            self._overlay_surface.fill((0, 0, 0, 0))
+            game.ui.draw_memory_overlay(self._overlay_surface, snapshot.memory)
+            self._overlay_texture.update(self._overlay_surface)
+            self._overlay_texture.draw()
+
+        self._present()
+
+    def _present(self) -> None:
+        """Hand the frame to the capture, if recording, and show it"""
+        # Read once: F9 may stop the capture on the simulation thread meanwhile
+        capture = self.game.capture
+        if capture:
+            # Read back from the renderer; the hidden display does not hold this frame
+            capture.grab(self.renderer.to_surface)
+        self.renderer.present()
+
+    def _draw_composed(self, snapshot: RenderSnapshot) -> None:
+        """Menus and overlays: draw with the surface code and upload the frame"""
+        screen = self.game.screen
+        self.game.compose_snapshot(snapshot)
+        self._frame_texture.update(screen)
+        self._frame_texture.draw()
+
+    def _draw_sprites(self, sprites) -> None:
+        """Draw (surface, topleft) pairs"""
+        texture = self.texture
+        for surface, (x, y) in sprites:
+            tex = texture(surface)
+            tex.draw(dstrect=(x, y, tex.width, tex.height))
+
+    def _draw_hud(self, snapshot: RenderSnapshot) -> None:
+        """Score, misses and time from glyph textures"""
+        ui = self.game.ui
+        self.draw_text(ui.font_medium, f"Score: {snapshot.score}", ui.colors.GREEN, ui.score_pos)
+        self.draw_text(ui.font_medium, f"Miss: {snapshot.misses}", ui.colors.RED, ui.miss_pos)
+        self.draw_text(ui.font_medium, f"Time: {snapshot.remaining_time}", ui.colors.WHITE, ui.time_pos)
+
+    def _draw_weapon(self, snapshot: RenderSnapshot) -> None:
+        """Impact ring, swing trail and sword, rotated and faded by the renderer"""
+        cursor = self.game.weapon_cursor
+        is_swinging, sword_angle, swing_timer = snapshot.swing
+
+        if snapshot.last_click_pos:
+            impact = cursor.impact(snapshot.swing)
+            if impact:
+                radius, alpha = impact
+                x, y = snapshot.last_click_pos
+                self._ring.alpha = alpha
+                self._ring.draw(dstrect=(x - radius, y - radius, radius * 2, radius * 2))
+
+        if not cursor.use_custom_draw:
+            cursor.show_system_cursor(not is_swinging)
+            if not is_swinging:
+                return
+
+        x, y = pygame.mouse.get_pos()
+        if is_swinging:
+            sword = self.texture(cursor.original_sword)
+            # Surface rotation is counterclockwise, renderer rotation clockwise
+            sword.draw(dstrect=(x - sword.width // 2, y - sword.height // 2, sword.width, sword.height),
+                       angle=-sword_angle)
+            trail_alpha = cursor.trail_alpha(swing_timer)
+            if trail_alpha > 0:
+                self._trail.alpha = trail_alpha
+                self._trail.draw(dstrect=(x - 30, y - 30, 60, 60))
+        else:
+            sword = self.texture(cursor.sword_image)
+            sword.draw(dstrect=(x - sword.width // 2, y - sword.height // 2, sword.width, sword.height))
+
+    def close(self) -> None:
+        """Destroy the renderer window"""
+        self.window.destroy()
@@ -1,5 +1,6 @@
 import pygame
 import config
+import memory_stats
 
 class GameUI:
     def __init__(self):
@@ -23,6 +24,16 @@ class GameUI:
         self.selected_item = 0
         self.in_settings = False
         
+        # Debug overlay lines, rendered again only when a new sample arrives
+        self._overlay_sample = None
+        self._overlay_lines = []
+        
+        memory_stats.register('fonts', self._fonts_memory)
+    
+    def _fonts_memory(self):
+        """(loaded font count, 0): SDL_ttf does not expose its glyph cache size"""
+        return len({id(font) for font in (self.font_large, self.font_medium, self.font_small)}), 0
+        
     def draw_score(self, screen, score):
         """Draw current score"""
         score_text = self.font_medium.render(f"Score: {score}", True, self.colors.GREEN)
@@ -38,7 +49,62 @@ class GameUI:
         time_text = self.font_medium.render(f"Time: {remaining_time}", True, self.colors.WHITE)
         screen.blit(time_text, self.time_pos)
     
-    def draw_game_over(self, screen, final_score, total_misses):
+    def warm_up(self, screen):
+        """Render the HUD once so its fonts have every digit cached"""
+        self.draw_score(screen, 1234567890)
+        self.draw_misses(screen, 1234567890)
+        self.draw_time(screen, 1234567890)
+    
+    def draw_memory_overlay(self, screen, usage):
+        """Draw per-cache memory use, peaks and budgets (debug overlay)"""
+        if usage is not self._overlay_sample:
+            self._overlay_sample = usage
+            rows = [(("CACHE", "ENTRIES", "MB", "PEAK", "BUDGET"), self.colors.YELLOW)]
+            for entry in usage:
+                budget = f"{entry.budget / 2**20:.1f}" if entry.budget is not None else "-"
+                color = self.colors.RED if entry.over_budget else self.colors.WHITE
+                rows.append(((entry.name, str(entry.entries), f"{entry.bytes / 2**20:.2f}",
+                              f"{entry.peak / 2**20:.2f}", budget), color))
+            total = sum(entry.bytes for entry in usage)
+            rows.append((("total", "", f"{total / 2**20:.2f}", "", ""), self.colors.YELLOW))
+            self._overlay_lines = [
+                [self.font_small.render(cell, True, color) for cell in cells] for cells, color in rows
+            ]
+        
+        if not self._overlay_lines:
+            return
+        # Name column left-aligned, numbers right-aligned
+        columns = (130, 70, 60, 70, 80)
+        width = sum(columns) + 20
+        height = len(self._overlay_lines) * 20 + 10
+        panel = pygame.Surface((width, height))
+        panel.set_alpha(180)
+        panel.fill(self.colors.BLACK)
+        top = config.SCREEN_HEIGHT - height - 10
+        screen.blit(panel, (10, top))
+        for i, cells in enumerate(self._overlay_lines):
+            x = 20
+            for column, (cell, column_width) in enumerate(zip(cells, columns)):
+                left = x if column == 0 else x + column_width - cell.get_width()
+                screen.blit(cell, (left, top + 5 + i * 20))
+                x += column_width
+    
+    def draw_paused(self, screen):
+        """Draw pause overlay"""
+        overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        overlay.set_alpha(128)
+        overlay.fill(self.colors.BLACK)
+        screen.blit(overlay, (0, 0))
+        
+        paused_text = self.font_large.render("PAUSED", True, self.colors.YELLOW)
+        paused_rect = paused_text.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//2 - 20))
+        screen.blit(paused_text, paused_rect)
+        
+        resume_text = self.font_small.render("Press P to resume or ESC for menu", True, self.colors.WHITE)
+        resume_rect = resume_text.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//2 + 30))
+        screen.blit(resume_text, resume_rect)
+    
+    def draw_game_over(self, screen, final_score, total_misses, leaderboard=None, rank=None):
         """Draw game over screen"""
         # Semi-transparent overlay
         overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
@@ -65,9 +131,29 @@ class GameUI:
         restart_text = self.font_small.render("Press SPACE to return to menu or ESC to quit", True, self.colors.YELLOW)
         restart_rect = restart_text.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//2 + 80))
         screen.blit(restart_text, restart_rect)
+        
+        if leaderboard:
+            self.draw_leaderboard(screen, leaderboard, rank)
+    
+    def draw_leaderboard(self, screen, leaderboard, rank=None):
+        """Draw top scores below the game over summary"""
+        title_text = self.font_small.render("TOP SCORES", True, self.colors.BLUE)
+        title_rect = title_text.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//2 + 120))
+        screen.blit(title_text, title_rect)
+        
+        for i, entry in enumerate(leaderboard):
+            # Highlight the round that was just played
+            color = self.colors.YELLOW if i == rank else self.colors.WHITE
+            entry_text = self.font_small.render(
+                f"{i + 1}. {entry.score}  ({entry.misses} misses)", True, color
+            )
+            entry_rect = entry_text.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//2 + 145 + i * 22))
+            screen.blit(entry_text, entry_rect)
     
-    def draw_main_menu(self, screen):
+    def draw_main_menu(self, screen, selected_item=None):
         """Draw main menu"""
+        if selected_item is None:
+            selected_item = self.selected_item
         # Title with shadow effect
         title_shadow = self.font_large.render("ZOMBIE WHACKER", True, self.colors.BLACK)
         title_shadow_rect = title_shadow.get_rect(center=(config.SCREEN_WIDTH//2 + 3, config.SCREEN_HEIGHT//2 - 117))
@@ -80,12 +166,12 @@ class GameUI:
         # Menu items
         menu_start_y = config.SCREEN_HEIGHT//2 - 30
         for i, item in enumerate(self.menu_items):
-            color = self.colors.YELLOW if i == self.selected_item else self.colors.WHITE
+            color = self.colors.YELLOW if i == selected_item else self.colors.WHITE
             text = self.font_medium.render(item, True, color)
             text_rect = text.get_rect(center=(config.SCREEN_WIDTH//2, menu_start_y + i * 50))
             
             # Draw selection highlight
-            if i == self.selected_item:
+            if i == selected_item:
                 highlight_rect = pygame.Rect(text_rect.x - 10, text_rect.y - 5, 
                                            text_rect.width + 20, text_rect.height + 10)
                 pygame.draw.rect(screen, self.colors.DARK_GRAY, highlight_rect)
@@ -98,8 +184,10 @@ class GameUI:
         instruction_rect = instruction_text.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT - 50))
         screen.blit(instruction_text, instruction_rect)
     
-    def draw_settings_menu(self, screen, music_volume, sound_volume):
+    def draw_settings_menu(self, screen, music_volume, sound_volume, selected_item=None):
         """Draw settings menu"""
+        if selected_item is None:
+            selected_item = self.selected_item
         # Title with shadow effect
         title_shadow = self.font_large.render("SETTINGS", True, self.colors.BLACK)
         title_shadow_rect = title_shadow.get_rect(center=(config.SCREEN_WIDTH//2 + 3, config.SCREEN_HEIGHT//2 - 117))
@@ -113,10 +201,10 @@ class GameUI:
         settings_start_y = config.SCREEN_HEIGHT//2 - 50
         
         for i, item in enumerate(self.settings_items):
-            color = self.colors.YELLOW if i == self.selected_item else self.colors.WHITE
+            color = self.colors.YELLOW if i == selected_item else self.colors.WHITE
             
             # Draw selection highlight
-            if i == self.selected_item:
+            if i == selected_item:
                 highlight_rect = pygame.Rect(config.SCREEN_WIDTH//2 - 200, 
                                            settings_start_y + i * 60 - 5,
                                            400, 50)
@@ -177,7 +265,7 @@ class GameUI:
                 screen.blit(text, text_rect)
         
         # Instructions
-        if self.selected_item < 2:  # Volume controls
+        if selected_item < 2:  # Volume controls
             instruction_text = self.font_small.render("Use LEFT/RIGHT arrows to adjust volume", True, self.colors.GRAY)
         else:  # Back button
             instruction_text = self.font_small.render("Press ENTER to go back", True, self.colors.GRAY)
@@ -1,6 +1,9 @@
 import pygame
 import os
 import config
+import game_clock
+import surface_cache
+import memory_stats
 from utils import load_image
 
 class WeaponCursor:
@@ -14,9 +17,6 @@ class WeaponCursor:
         self.swing_duration = 300  # milliseconds
         self.sword_angle = 0
         
-        # Cursor drawing fallback
-        self.use_custom_draw = True  # Always use custom drawing for better control
-        
     def load_sword_images(self):
         """Load sword images and create custom cursor"""
         try:
@@ -30,10 +30,8 @@ class WeaponCursor:
             
             # Store original for rotation
             self.original_sword = self.sword_image.copy()
-            
-            # Hide default cursor and use custom drawing
-            pygame.mouse.set_visible(False)
-            self.use_custom_draw = True
+            self._install_system_cursor(self.sword_image)
+            self._finalize_images()
             print("Sword cursor loaded successfully")
             
         except Exception as e:
@@ -66,22 +64,67 @@ class WeaponCursor:
             ], 2)
             
             self.original_sword = self.sword_image.copy()
-            
-            # Hide default cursor
-            pygame.mouse.set_visible(False)
-            self.use_custom_draw = True
+            self._install_system_cursor(self.sword_image)
+            self._finalize_images()
             print("Fallback sword cursor created")
     
+    def _install_system_cursor(self, image):
+        """Use the idle sword as the OS cursor, or fall back to drawing it every frame"""
+        self.system_cursor_shown = False
+        self.use_custom_draw = True
+        if config.HARDWARE_CURSOR:
+            try:
+                # Hotspot at the centre, where the software sword is drawn
+                size = image.get_size()
+                pygame.mouse.set_cursor(pygame.cursors.Cursor((size[0] // 2, size[1] // 2), image))
+                self.use_custom_draw = False
+            except pygame.error as e:
+                print(f"System cursor not supported, drawing sword in software: {e}")
+        
+        # Software sword hides the default cursor
+        self.show_system_cursor(not self.use_custom_draw)
+    
+    def show_system_cursor(self, visible=True):
+        """Show or hide the OS cursor when the idle sword is a system cursor"""
+        if self.use_custom_draw:
+            visible = False
+        if visible != self.system_cursor_shown:
+            pygame.mouse.set_visible(visible)
+            self.system_cursor_shown = visible
+    
+    def _finalize_images(self):
+        """Match the sword images to the display format"""
+        self.sword_image = surface_cache.finalize(self.sword_image)
+        # Rotation reads every pixel, so the rotation source stays un-RLE'd
+        self.original_sword = surface_cache.finalize(self.original_sword, rle=False)
+        surface_cache.register('sword', self._finalize_images)
+        memory_stats.register('sword', self._memory_usage)
+    
+    def _memory_usage(self):
+        """(image count, bytes) of the sword images"""
+        return 2, memory_stats.surface_bytes((self.sword_image, self.original_sword))
+    
+    def warm_up(self, screen):
+        """Draw a swing off-screen so the first real swing does not stall"""
+        pos = screen.get_rect().center
+        now = game_clock.get_ticks()
+        for angle in (0, 45, 90):
+            rotated = pygame.transform.rotate(self.original_sword, angle)
+            screen.blit(rotated, rotated.get_rect(center=pos))
+        screen.blit(self.sword_image, self.sword_image.get_rect(center=pos))
+        self.draw_swing_trail(screen, pos, now)
+        self.draw_swing_effect(screen, pos, (True, 0, now))
+    
     def start_swing_animation(self):
         """Start weapon swing animation"""
         self.is_swinging = True
-        self.swing_timer = pygame.time.get_ticks()
+        self.swing_timer = game_clock.get_ticks()
         self.sword_angle = 0
     
     def update(self):
         """Update cursor animation"""
         if self.is_swinging:
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.swing_timer > self.swing_duration:
                 self.is_swinging = False
                 self.sword_angle = 0
@@ -92,57 +135,80 @@ class WeaponCursor:
                 import math
                 self.sword_angle = math.sin(progress * math.pi) * 90  # 0 to 90 and back
     
-    def draw_cursor(self, screen):
+    def swing_state(self):
+        """Swing animation state as an immutable tuple for render snapshots"""
+        return (self.is_swinging, self.sword_angle, self.swing_timer)
+    
+    def draw_cursor(self, screen, swing=None):
         """Draw custom cursor at mouse position"""
-        if self.use_custom_draw:
-            mouse_pos = pygame.mouse.get_pos()
+        is_swinging, sword_angle, swing_timer = swing or self.swing_state()
+        
+        if not self.use_custom_draw:
+            # Idle sword is the system cursor; only the swing is drawn here
+            self.show_system_cursor(not is_swinging)
+            if not is_swinging:
+                return
+        
+        mouse_pos = pygame.mouse.get_pos()
+        
+        if is_swinging:
+            # Draw swinging sword with rotation
+            rotated_sword = pygame.transform.rotate(self.original_sword, sword_angle)
+            sword_rect = rotated_sword.get_rect()
+            sword_rect.center = mouse_pos
+            screen.blit(rotated_sword, sword_rect)
             
-            if self.is_swinging:
-                # Draw swinging sword with rotation
-                rotated_sword = pygame.transform.rotate(self.original_sword, self.sword_angle)
-                sword_rect = rotated_sword.get_rect()
-                sword_rect.center = mouse_pos
-                screen.blit(rotated_sword, sword_rect)
-                
-                # Add swing trail effect
-                self.draw_swing_trail(screen, mouse_pos)
-            else:
-                # Draw normal sword cursor
-                sword_rect = self.sword_image.get_rect()
-                sword_rect.center = mouse_pos
-                screen.blit(self.sword_image, sword_rect)
+            # Add swing trail effect
+            self.draw_swing_trail(screen, mouse_pos, swing_timer)
+        else:
+            # Draw normal sword cursor
+            sword_rect = self.sword_image.get_rect()
+            sword_rect.center = mouse_pos
+            screen.blit(self.sword_image, sword_rect)
     
-    def draw_swing_trail(self, screen, pos):
-        """Draw swing trail effect"""
-        current_time = pygame.time.get_ticks()
-        progress = (current_time - self.swing_timer) / self.swing_duration
-        
+    def trail_alpha(self, swing_timer):
+        """Alpha of the swing trail, 0 once it has faded"""
+        progress = (game_clock.get_ticks() - swing_timer) / self.swing_duration
         if progress < 0.5:  # Show trail in first half of swing
-            trail_alpha = int(100 * (1 - progress * 2))  # Fade out
-            if trail_alpha > 0:
-                # Create trail surface with alpha
-                trail_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-                pygame.draw.arc(trail_surface, (255, 255, 0, trail_alpha), 
-                               (10, 10, 40, 40), 0, 1.57, 3)  # Quarter circle arc
-                trail_rect = trail_surface.get_rect()
-                trail_rect.center = pos
-                screen.blit(trail_surface, trail_rect)
+            return max(0, int(100 * (1 - progress * 2)))  # Fade out
+        return 0
     
-    def draw_swing_effect(self, screen, pos):
-        """Draw sword swing effect at cursor position"""
-        if self.is_swinging:
-            current_time = pygame.time.get_ticks()
-            progress = (current_time - self.swing_timer) / self.swing_duration
+    def impact(self, swing=None):
+        """(radius, alpha) of the impact ring, None when it is not shown"""
+        is_swinging, _, swing_timer = swing or self.swing_state()
+        if is_swinging:
+            progress = (game_clock.get_ticks() - swing_timer) / self.swing_duration
             
             # Impact effect at the beginning
             if progress < 0.3:
                 impact_alpha = int(255 * (1 - progress * 3.33))
                 if impact_alpha > 0:
-                    impact_radius = int(20 + progress * 15)
-                    # Create impact surface with alpha
-                    impact_surface = pygame.Surface((impact_radius * 2, impact_radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(impact_surface, (255, 255, 100, impact_alpha), 
-                                     (impact_radius, impact_radius), impact_radius, 3)
-                    impact_rect = impact_surface.get_rect()
-                    impact_rect.center = pos
-                    screen.blit(impact_surface, impact_rect)
\ No newline at end of file
+                    return int(20 + progress * 15), impact_alpha
+        return None
+    
+    def draw_swing_trail(self, screen, pos, swing_timer=None):
+        """Draw swing trail effect"""
+        if swing_timer is None:
+            swing_timer = self.swing_timer
+        trail_alpha = self.trail_alpha(swing_timer)
+        if trail_alpha > 0:
+            # Create trail surface with alpha
+            trail_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+            pygame.draw.arc(trail_surface, (255, 255, 0, trail_alpha), 
+                           (10, 10, 40, 40), 0, 1.57, 3)  # Quarter circle arc
+            trail_rect = trail_surface.get_rect()
+            trail_rect.center = pos
+            screen.blit(trail_surface, trail_rect)
+    
+    def draw_swing_effect(self, screen, pos, swing=None):
+        """Draw sword swing effect at cursor position"""
+        impact = self.impact(swing)
+        if impact:
+            impact_radius, impact_alpha = impact
+            # Create impact surface with alpha
+            impact_surface = pygame.Surface((impact_radius * 2, impact_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(impact_surface, (255, 255, 100, impact_alpha), 
+                             (impact_radius, impact_radius), impact_radius, 3)
+            impact_rect = impact_surface.get_rect()
+            impact_rect.center = pos
+            screen.blit(impact_surface, impact_rect)
@@ -0,0 +1,119 @@
+import pygame
+import pytest
+
+import config
+import game_clock
+from sprites import zombie as zombie_sprites
+from sprites.animation import CLIPS, Clip, EVENT_DEAD, HOLD, LOOP, NEXT, Timeline
+
+
+def frames(count):
+    return [pygame.Surface((4, 4)) for _ in range(count)]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Virtual clock and hand-built timelines instead of loaded clips"""
+    monkeypatch.setattr(config, "ANIMATION_TIMELINE_RESOLUTION", 1)
+    monkeypatch.setattr(config, "ANIMATION_FRAME_DURATION", 100)
+    monkeypatch.setattr(config, "ZOMBIE_HURT_DURATION", 200)
+    monkeypatch.setattr(config, "ZOMBIE_DEATH_TIMEOUT", 800)
+    timelines = [None] * len(Clip)
+    for clip, count in ((Clip.IDLE, 3), (Clip.HURT, 3), (Clip.DYING, 4),
+                        (Clip.SLASHING, 2), (Clip.FALLING_DOWN, 2)):
+        timelines[clip] = Timeline(clip, frames(count))
+    monkeypatch.setattr(zombie_sprites, "_timelines", timelines)
+    monkeypatch.setitem(zombie_sprites._sprite_cache, Clip.IDLE, timelines[Clip.IDLE].frames)
+
+    manual = game_clock.ManualClock()
+    game_clock.set_time_source(manual.get_ticks)
+    yield manual
+    game_clock.set_time_source(None)
+
+
+def make_zombie(clip):
+    return zombie_sprites.Zombie.from_state(1, 50, 50, clip, 0, True, clip != Clip.IDLE, 0, 10 ** 6, 0)
+
+
+def test_frame_lookup_with_fixed_frame_duration(clock):
+    timeline = Timeline(Clip.IDLE, frames(3))
+    assert timeline.end == LOOP and timeline.total == 300
+    assert [timeline.frame_index(t) for t in (0, 99, 100, 299)] == [0, 0, 1, 2]
+    assert timeline.frame_index(300) == 0  # loops
+    assert timeline.frame_index(450) == 1
+
+
+def test_duration_is_spread_over_frames(clock):
+    timeline = Timeline(Clip.HURT, frames(3))
+    assert timeline.total == 200
+    # 67 + 67 + 66 milliseconds, leftovers on the first frames
+    assert [timeline.frame_index(t) for t in (66, 67, 133, 134, 199)] == [0, 1, 1, 2, 2]
+    assert timeline.frame_index(500) == 2  # non-looping clips stay on the last frame
+
+
+def test_coarse_resolution_table(clock, monkeypatch):
+    monkeypatch.setattr(config, "ANIMATION_TIMELINE_RESOLUTION", 5)
+    timeline = Timeline(Clip.IDLE, frames(2))
+    assert timeline.frame_table[0] is timeline.frames[0]
+    assert timeline.frame(104) is timeline.frames[1]
+
+
+def test_timelines_read_settings_when_built(clock, monkeypatch):
+    old = Timeline(Clip.HURT, frames(3))
+    monkeypatch.setattr(config, "ZOMBIE_HURT_DURATION", 400)
+    assert not old.is_current()
+    new = Timeline(Clip.HURT, frames(3))
+    assert new.total == 400 and new.is_current()
+    assert Timeline(Clip.DYING, frames(4)).total == 400  # death timeout minus hurt
+    monkeypatch.setattr(config, "FRAME_LIMIT_DYING", 2)
+    assert CLIPS[Clip.DYING].timing().frame_limit == 2
+
+
+def test_refresh_timelines_rebuilds_changed_clips(clock, monkeypatch):
+    idle = zombie_sprites._timelines[Clip.IDLE]
+    monkeypatch.setattr(config, "ZOMBIE_HURT_DURATION", 300)
+    zombie_sprites.refresh_timelines()
+    assert zombie_sprites._timelines[Clip.HURT].total == 300
+    assert zombie_sprites._timelines[Clip.DYING].total == 500
+    assert zombie_sprites._timelines[Clip.IDLE] is idle
+
+
+def test_next_transition_carries_over_elapsed_time(clock):
+    zombie = make_zombie(Clip.HURT)
+    zombie.animate(250)
+    assert zombie.clip == Clip.DYING
+    assert zombie.clip_start == 200
+    assert zombie.image is zombie.timeline.frames[0]  # 50ms into 150ms frames
+    assert zombie.alive
+
+
+def test_hold_with_event_ends_the_zombie(clock):
+    zombie = make_zombie(Clip.DYING)
+    assert CLIPS[Clip.DYING].end == HOLD and CLIPS[Clip.DYING].event == EVENT_DEAD
+    zombie.animate(599)
+    assert zombie.alive
+    zombie.animate(600)
+    assert not zombie.alive
+
+
+def test_hurt_then_dying_in_one_long_frame(clock):
+    zombie = make_zombie(Clip.HURT)
+    zombie.animate(5000)
+    assert zombie.clip == Clip.DYING
+    assert not zombie.alive
+
+
+def test_hold_without_event_keeps_last_frame(clock):
+    zombie = make_zombie(Clip.FALLING_DOWN)
+    zombie.animate(10_000)
+    assert zombie.alive
+    assert zombie.clip == Clip.FALLING_DOWN
+    assert zombie.image is zombie.timeline.frames[-1]
+
+
+def test_next_into_looping_clip(clock):
+    zombie = make_zombie(Clip.SLASHING)
+    assert CLIPS[Clip.SLASHING].end == NEXT
+    zombie.animate(200 + 350)  # slash ends at 200, then 350ms into the 300ms idle loop
+    assert zombie.clip == Clip.IDLE
+    assert zombie.image is zombie.timeline.frames[0]
@@ -0,0 +1,35 @@
+import pytest
+
+import bot_swarm
+import config
+from bot_player import BotProfile
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """In-process worker Game; its init turns persistence off, so restore that afterwards"""
+    monkeypatch.setattr(config, "SCORE_STORE_ENABLED", config.SCORE_STORE_ENABLED)
+    monkeypatch.setattr(config, "TELEMETRY_ENABLED", config.TELEMETRY_ENABLED)
+    monkeypatch.setattr(config, "GAME_DURATION", 8)
+
+
+def test_swept_values_give_different_results_and_are_restored(worker):
+    spawn_rate = config.ZOMBIE_SPAWN_RATE
+    profile = BotProfile()
+    fast = bot_swarm.run_session(7, {"ZOMBIE_SPAWN_RATE": 500}, profile, draw=False)
+    slow = bot_swarm.run_session(7, {"ZOMBIE_SPAWN_RATE": 3000}, profile, draw=False)
+
+    assert fast["clicks"] > slow["clicks"]
+    assert config.ZOMBIE_SPAWN_RATE == spawn_rate
+    # The same seed and settings replay the same round on the reused worker
+    again = bot_swarm.run_session(7, {"ZOMBIE_SPAWN_RATE": 500}, profile, draw=False)
+    keys = ("score", "misses", "clicks", "reaction_mean")
+    assert [again[key] for key in keys] == [fast[key] for key in keys]
+
+
+def test_overrides_are_restored_when_a_session_fails(worker):
+    spawn_rate = config.ZOMBIE_SPAWN_RATE
+    with pytest.raises(ZeroDivisionError):
+        bot_swarm.run_session(1, {"ZOMBIE_SPAWN_RATE": 123, "FPS": 0}, BotProfile(), draw=False)
+    assert config.ZOMBIE_SPAWN_RATE == spawn_rate
+    assert config.FPS != 0
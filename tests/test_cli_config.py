@@ -0,0 +1,20 @@
+import pytest
+
+from cli_config import parse_assignments, parse_value
+
+
+def test_values_are_typed():
+    assert [parse_value(v) for v in ("true", "False", "12", "0.5", "easy")] == [True, False, 12, 0.5, "easy"]
+
+
+def test_assignments_parse_value_lists():
+    assert parse_assignments(["ZOMBIE_SPAWN_RATE=900,1200", "FPS=30"]) == {
+        "ZOMBIE_SPAWN_RATE": [900, 1200], "FPS": [30],
+    }
+
+
+def test_unknown_and_import_time_settings_are_rejected():
+    with pytest.raises(SystemExit, match="Unknown"):
+        parse_assignments(["NOT_A_SETTING=1"])
+    with pytest.raises(SystemExit, match="BOT_ACCURACY"):
+        parse_assignments(["BOT_ACCURACY=0.5"])
@@ -0,0 +1,109 @@
+import io
+import os
+import struct
+import threading
+import time
+import zlib
+
+import pygame
+
+import config
+from frame_capture import FrameCapture, encode_png
+from game import Game
+
+
+def chunks(data):
+    position = 8
+    while position < len(data):
+        length, = struct.unpack(">I", data[position:position + 4])
+        kind = data[position + 4:position + 8]
+        body = data[position + 8:position + 8 + length]
+        crc, = struct.unpack(">I", data[position + 8 + length:position + 12 + length])
+        yield kind, body, crc
+        position += 12 + length
+
+
+def test_encode_png_structure():
+    pixels = bytes(range(3 * 2 * 3))  # 3x2 RGB
+    data = encode_png(pixels, (3, 2), 1)
+
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    found = list(chunks(data))
+    assert [kind for kind, _, _ in found] == [b"IHDR", b"IDAT", b"IEND"]
+    for kind, body, crc in found:
+        assert zlib.crc32(kind + body) == crc
+    assert struct.unpack(">IIBBBBB", found[0][1]) == (3, 2, 8, 2, 0, 0, 0)
+    # One filter byte (none) before each row
+    assert zlib.decompress(found[1][1]) == b"\0" + pixels[:9] + b"\0" + pixels[9:]
+
+
+def test_encode_png_round_trips_through_pygame():
+    surface = pygame.Surface((17, 5))
+    for x in range(17):
+        for y in range(5):
+            surface.set_at((x, y), (x * 15, y * 50, (x * y) % 256))
+    pixels = pygame.image.tobytes(surface, "RGB")
+
+    decoded = pygame.image.load(io.BytesIO(encode_png(pixels, (17, 5), 6)), "frame.png")
+    assert decoded.get_size() == (17, 5)
+    assert pygame.image.tobytes(decoded, "RGB") == pixels
+
+
+def test_grab_after_close_does_nothing(tmp_path):
+    screen = pygame.Surface((8, 6))
+    capture = FrameCapture(screen, str(tmp_path), image_format="bmp")
+    assert capture.grab(screen)
+    capture.close()
+    assert not capture.grab(screen)
+    assert capture.stats().grabbed == 1
+    assert os.listdir(tmp_path) == ["frame_000000.bmp"]
+
+
+class YieldingGame(Game):
+    """Gives up the GIL on every read of capture, so a toggle can land between reads"""
+
+    @property
+    def capture(self):
+        time.sleep(0)
+        return self._capture
+
+    @capture.setter
+    def capture(self, capture):
+        self._capture = capture
+
+
+def test_toggling_capture_while_frames_are_grabbed(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CAPTURE_DIR", str(tmp_path) + os.sep)
+    monkeypatch.setattr(config, "CAPTURE_FORMAT", "bmp")
+    pygame.display.init()
+    # Just what draw_snapshot and the capture toggles touch
+    game = YieldingGame.__new__(YieldingGame)
+    game.screen = pygame.display.set_mode((32, 24))
+    game.capture = None
+    game.texture_renderer = None
+    game.compose_snapshot = lambda snapshot: None
+    done = threading.Event()
+    errors = []
+
+    def render():
+        while not done.is_set():
+            try:
+                game.draw_snapshot(None)
+            except Exception as e:
+                errors.append(e)
+                return
+
+    thread = threading.Thread(target=render)
+    thread.start()
+    try:
+        # F9 on the simulation thread while the render thread grabs frames
+        for _ in range(100):
+            game.toggle_capture()
+    finally:
+        done.set()
+        thread.join()
+        game.stop_capture()
+
+    assert not errors
+    # Recordings started within the same second still get their own folders
+    assert len(os.listdir(tmp_path)) == 50
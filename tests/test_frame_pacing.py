@@ -0,0 +1,100 @@
+import sys
+import threading
+
+import pytest
+
+import config
+from frame_pacing import FramePacer
+
+
+@pytest.fixture
+def pacing(monkeypatch):
+    monkeypatch.setattr(config, "FRAME_LATE_TOLERANCE", 2)
+    monkeypatch.setattr(config, "FRAME_SKIP_POLICY", "skip_render")
+    monkeypatch.setattr(config, "FRAME_SKIP_MAX", 2)
+
+
+def run(pacer, starts):
+    """Feed frame start times (seconds) through the schedule"""
+    renders = []
+    for now in starts:
+        renders.append(pacer._schedule(now))
+        pacer._record(now)
+    return renders
+
+
+def test_deadlines_are_absolute(pacing):
+    pacer = FramePacer("sleep_spin", fps=100)
+    assert run(pacer, [1.0, 1.011, 1.0205]) == [True, True, True]
+    # Deadlines stay on the 10ms grid from the first frame, not from each start
+    assert pacer._deadline == pytest.approx(1.03)
+    assert pacer.late_frames == 0
+
+
+def test_late_frames_use_tolerance(pacing):
+    pacer = FramePacer("sleep_spin", fps=100)
+    run(pacer, [1.0, 1.0115, 1.0235])  # 1.5ms late, then 3.5ms late
+    assert pacer.late_frames == 1
+
+
+def test_skip_render_catches_up_then_gives_up(pacing):
+    pacer = FramePacer("sleep_spin", fps=100)
+    # A 50ms stall: the next frames are whole periods behind
+    renders = run(pacer, [1.0, 1.06, 1.061, 1.062, 1.063])
+    assert renders == [True, False, False, True, True]
+    assert pacer.skipped_renders == 2
+    # Giving up at 1.062 restarts the schedule from there
+    assert pacer._deadline == pytest.approx(1.082)
+
+
+def test_vsync_never_skips(pacing):
+    pacer = FramePacer("vsync", fps=100)
+    assert run(pacer, [1.0, 1.06, 1.061]) == [True, True, True]
+    assert pacer.skipped_renders == 0
+
+
+def test_stats(pacing):
+    pacer = FramePacer("sleep_spin", fps=100)
+    run(pacer, [1.0, 1.01, 1.02, 1.05])
+    stats = pacer.stats()
+    assert stats.frames == 4
+    assert stats.mean_interval_ms == pytest.approx(50 / 3)
+    assert stats.longest_stall_ms == pytest.approx(30)
+    assert stats.jitter_ms > 0
+
+    pacer.reset_stats()
+    assert pacer.stats().frames == 0
+
+
+def test_unknown_strategy_falls_back(pacing):
+    assert FramePacer("bogus", fps=60).strategy == "sleep_spin"
+
+
+def test_stats_and_reset_from_another_thread(pacing):
+    # Switch threads often so an unguarded deque gets mutated mid-iteration
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    pacer = FramePacer("vsync", fps=60)  # vsync never waits, so frames come as fast as possible
+    done = threading.Event()
+    errors = []
+
+    def render_loop():
+        try:
+            while not done.is_set():
+                pacer.begin_frame()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=render_loop)
+    thread.start()
+    try:
+        for i in range(2000):
+            stats = pacer.stats()
+            assert stats.frames >= 0 and stats.jitter_ms >= 0
+            if i % 500 == 499:
+                pacer.reset_stats()
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    assert not errors
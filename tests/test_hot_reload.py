@@ -0,0 +1,130 @@
+import os
+import shutil
+import time
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+import config
+from asset_watcher import AssetWatcher, HotReloader
+from sound_manager import SoundManager
+from sprites import zombie as zombie_sprites
+from sprites.animation import Clip
+
+
+@pytest.fixture
+def sound_dir(tmp_path, monkeypatch):
+    """Copies of the effects in a scratch sound folder"""
+    for name in ("hit.wav", "miss.wav"):
+        shutil.copy(os.path.join(config.SOUND_DIR, name), tmp_path / name)
+    monkeypatch.setattr(config, "SOUND_DIR", str(tmp_path) + os.sep)
+    monkeypatch.setattr(config, "SOUND_VARIANTS", 1)
+    pygame.mixer.init()
+    yield tmp_path
+    pygame.mixer.quit()
+
+
+def test_deleted_sound_is_dropped(sound_dir):
+    manager = SoundManager()
+    hit = config.SoundType.HIT.value
+    if not manager.sound_enabled:
+        pytest.skip("audio mixer unavailable")
+    assert hit in manager.sounds
+
+    os.remove(sound_dir / "hit.wav")
+    assert manager.reload_sound_file("hit.wav") == 1
+    assert hit not in manager.sounds
+    manager.play_sound(hit)  # silently does nothing
+
+
+def test_deleted_sound_falls_back_to_the_next_file(sound_dir):
+    manager = SoundManager()
+    miss = config.SoundType.MISS.value
+    if not manager.sound_enabled:
+        pytest.skip("audio mixer unavailable")
+    old = manager.sounds[miss]
+
+    shutil.copy(sound_dir / "miss.wav", sound_dir / "swing.wav")
+    os.remove(sound_dir / "miss.wav")
+    manager.reload_sound_file("miss.wav")
+    assert manager.sounds[miss] is not old
+
+
+def wait_for_changes(watcher, expected, timeout=5):
+    """Collect reported paths until the expected ones arrived"""
+    seen = []
+    deadline = time.monotonic() + timeout
+    while not set(expected) <= set(seen) and time.monotonic() < deadline:
+        time.sleep(0.02)
+        seen.extend(watcher.drain())
+    return seen
+
+
+def test_watcher_reports_added_modified_and_removed_files_once(tmp_path):
+    existing = tmp_path / "a.png"
+    existing.write_bytes(b"one")
+    watcher = AssetWatcher([str(tmp_path)], interval=10)
+    watcher.start()
+    try:
+        existing.write_bytes(b"changed")
+        added = tmp_path / "sub" / "b.png"
+        added.parent.mkdir()
+        added.write_bytes(b"new")
+        seen = wait_for_changes(watcher, [str(existing), str(added)])
+        assert sorted(seen) == sorted([str(existing), str(added)])
+
+        os.remove(existing)
+        assert wait_for_changes(watcher, [str(existing)]) == [str(existing)]
+        time.sleep(0.1)
+        assert watcher.drain() == []  # settled files are not reported again
+    finally:
+        watcher.stop()
+        watcher.join()
+
+
+def test_paths_are_classified_by_cache():
+    classify = HotReloader._classify
+    image = lambda *parts: os.path.join(config.IMG_DIR, *parts)
+    assert classify(image("zombie", "Idle", "0001.png")) == ("zombie", ["Idle", "0001.png"])
+    assert classify(image("sword", "Icon28_02.png")) == ("sword", ["Icon28_02.png"])
+    assert classify(image("background", "background_2.jpg")) == ("background", ["background_2.jpg"])
+    assert classify(os.path.join(config.SOUND_DIR, "hit.wav")) == ("sound", ["hit.wav"])
+    assert classify(os.path.join("src", "game.py")) == (None, [])
+
+
+class StubWatcher:
+    def __init__(self, changed):
+        self.changed = changed
+
+    def is_alive(self):
+        return True
+
+    def drain(self):
+        changed, self.changed = self.changed, []
+        return changed
+
+
+def test_render_side_reloads_wait_for_the_render_thread(monkeypatch):
+    calls = []
+    game = SimpleNamespace(
+        zombies=[],
+        weapon_cursor=SimpleNamespace(load_sword_images=lambda: calls.append("sword")),
+        reload_background=lambda: calls.append("background"),
+        sound_manager=SimpleNamespace(reload_sound_file=lambda name: calls.append(name) or 1),
+    )
+    monkeypatch.setattr(zombie_sprites, "reload_clip", lambda clip, zombies: calls.append(clip) or object())
+    changed = [
+        os.path.join(config.IMG_DIR, "zombie", "Idle", "0001.png"),
+        os.path.join(config.IMG_DIR, "sword", "Icon28_02.png"),
+        os.path.join(config.IMG_DIR, "sword", "Icon28_03.png"),
+        os.path.join(config.IMG_DIR, "background", "background_2.jpg"),
+        os.path.join(config.SOUND_DIR, "hit.wav"),
+    ]
+    reloader = HotReloader(game, StubWatcher(changed))
+
+    assert reloader.apply() == 2
+    assert calls == [Clip.IDLE, "hit.wav"]
+    assert reloader.apply_render() == 2
+    assert calls[2:] == ["sword", "background"]
+    assert reloader.apply_render() == 0
@@ -0,0 +1,101 @@
+import pygame
+
+import config
+from lod import LodScheduler
+
+
+class StubZombie:
+    """The attributes LodScheduler reads from a Zombie"""
+
+    def __init__(self, serial, appear_time, lifetime, pos=(0, 0)):
+        self.serial = serial
+        self.appear_time = appear_time
+        self.lifetime = lifetime
+        self.alive = True
+        self.clicked = False
+        self.fx, self.fy = pos
+        self.rect = pygame.Rect(0, 0, 120, 120)
+        self.rect.center = pos
+        self.animated = []
+
+    def animate(self, now):
+        self.animated.append(now)
+
+
+def spread(count, lifetime=1000):
+    return [StubZombie(i, 0, lifetime, (i * 200, 100)) for i in range(count)]
+
+
+def test_expiry_heap_expires_in_due_order_once():
+    scheduler = LodScheduler(buckets=2, low_detail_factor=1)
+    zombies = [StubZombie(0, 0, 300), StubZombie(1, 0, 100), StubZombie(2, 50, 100)]
+    for zombie in zombies:
+        scheduler.add(zombie)
+
+    expired, _ = scheduler.update(zombies, 100)  # "more than lifetime" - nothing yet
+    assert expired == []
+    expired, _ = scheduler.update(zombies, 151)
+    assert [z.serial for z in expired] == [1, 2]
+    expired, _ = scheduler.update(zombies, 151)
+    assert expired == []
+    expired, _ = scheduler.update(zombies, 301)
+    assert [z.serial for z in expired] == [0]
+    assert not any(z.alive for z in zombies)
+
+
+def test_clicked_zombies_do_not_expire_and_animate_every_frame():
+    scheduler = LodScheduler(buckets=3, low_detail_factor=1)
+    zombie = StubZombie(0, 0, 100)
+    scheduler.add(zombie)
+    zombie.clicked = True
+    scheduler.promote(zombie)
+
+    for now in (50, 150, 250):
+        expired, died = scheduler.update([zombie], now)
+        assert expired == [] and died == []
+    assert zombie.alive
+    assert zombie.animated == [50, 150, 250]
+
+    zombie.alive = False
+    _, died = scheduler.update([zombie], 300)
+    assert died == [zombie]
+
+
+def test_buckets_spread_animation_over_frames():
+    scheduler = LodScheduler(buckets=3, low_detail_factor=1)
+    zombies = spread(6, lifetime=10 ** 6)
+    for zombie in zombies:
+        scheduler.add(zombie)
+
+    scheduler.update(zombies, 1)
+    assert sum(1 for z in zombies if z.animated) == 2
+    scheduler.update(zombies, 2)
+    scheduler.update(zombies, 3)
+    assert all(len(z.animated) == 1 for z in zombies)
+
+
+def test_occluded_zombie_is_low_detail(monkeypatch):
+    monkeypatch.setattr(config, "ZOMBIE_MOVEMENT_ENABLED", False)
+    scheduler = LodScheduler(buckets=1, low_detail_factor=4)
+    below = StubZombie(0, 0, 10 ** 6, (300, 300))
+    above = StubZombie(1, 0, 10 ** 6, (302, 301))
+    apart = StubZombie(2, 0, 10 ** 6, (600, 100))
+    zombies = [below, above, apart]
+    for zombie in zombies:
+        scheduler.add(zombie)
+
+    for now in range(1, 5):
+        scheduler.update(zombies, now)
+    assert scheduler.low_detail == {below}
+    # Low-detail zombies only animate every low_detail_factor cycles
+    assert len(below.animated) == 1
+    assert len(above.animated) == len(apart.animated) == 4
+
+
+def test_small_sprites_are_low_detail():
+    scheduler = LodScheduler(buckets=1, low_detail_factor=4)
+    full, small = StubZombie(0, 0, 10 ** 6, (100, 300)), StubZombie(1, 0, 10 ** 6, (500, 300))
+    small.rect.size = (40, 40)
+    scheduler.classify([full, small])
+    assert scheduler.low_detail == {small}
+    assert 120 * 120 >= config.LOD_SMALL_AREA  # today's frames never count as small
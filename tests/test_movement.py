@@ -0,0 +1,78 @@
+import random
+
+import config
+from movement import HordeMover, sweep_and_prune
+
+
+def brute_force_pairs(boxes):
+    pairs = set()
+    for i, a in enumerate(boxes):
+        for j, b in enumerate(boxes[:i]):
+            if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                pairs.add(frozenset((i, j)))
+    return pairs
+
+
+def test_sweep_and_prune_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(50):
+        boxes = []
+        for _ in range(rng.randint(0, 40)):
+            x, y = rng.uniform(0, 500), rng.uniform(0, 500)
+            boxes.append((x, y, x + rng.uniform(1, 80), y + rng.uniform(1, 80)))
+        pairs = sweep_and_prune(boxes)
+        assert len(pairs) == len(set(map(frozenset, pairs)))
+        assert set(map(frozenset, pairs)) == brute_force_pairs(boxes)
+
+
+def test_touching_edges_do_not_overlap():
+    assert sweep_and_prune([(0, 0, 10, 10), (10, 0, 20, 10), (0, 10, 10, 20)]) == []
+
+
+class Body:
+    def __init__(self, x, y, clicked=False):
+        self.fx, self.fy = float(x), float(y)
+        self.alive = True
+        self.clicked = clicked
+
+
+def overlapping(a, b):
+    body_w, body_h = config.ZOMBIE_BODY_SIZE
+    # Pushes leave bodies exactly touching, give or take float rounding (sub-pixel)
+    return abs(a.fx - b.fx) < body_w - 1e-3 and abs(a.fy - b.fy) < body_h - 1e-3
+
+
+def test_separation_pushes_both_walkers_along_the_smaller_overlap():
+    body_w, _ = config.ZOMBIE_BODY_SIZE
+    a, b = Body(400, 300), Body(420, 305)
+    HordeMover().separate([a, b])
+    # x overlap (30) is smaller than y overlap (65): each moves half of it sideways
+    assert (a.fx, a.fy) == (385, 300)
+    assert (b.fx, b.fy) == (435, 305)
+    assert b.fx - a.fx == body_w
+
+
+def test_clicked_zombies_stay_put_and_walkers_take_the_whole_push():
+    _, body_h = config.ZOMBIE_BODY_SIZE
+    walker, hurt = Body(400, 300), Body(402, 340, clicked=True)
+    HordeMover().separate([walker, hurt])
+    assert (hurt.fx, hurt.fy) == (402, 340)
+    # y overlap (30) is smaller than x overlap (48): the walker moves up by all of it
+    assert hurt.fy - walker.fy == body_h and walker.fx == 400
+    assert not overlapping(walker, hurt)
+
+
+def test_pushes_stay_inside_the_play_area():
+    a, b = Body(61, 300), Body(70, 300)
+    HordeMover().separate([a, b])
+    assert a.fx == 60  # clamped at the left edge of the play area
+    assert b.fx > 70
+
+
+def test_repeated_separation_untangles_a_crowd():
+    rng = random.Random(5)
+    crowd = [Body(rng.uniform(300, 500), rng.uniform(250, 400)) for _ in range(12)]
+    mover = HordeMover()
+    for _ in range(60):
+        mover.separate(crowd)
+    assert not any(overlapping(a, b) for i, a in enumerate(crowd) for b in crowd[:i])
@@ -0,0 +1,101 @@
+import random
+import threading
+
+from rewind import RewindBuffer
+
+
+def states(count, seed=3):
+    """Blobs that change a little every tick and grow and shrink like the zombie list"""
+    rng = random.Random(seed)
+    data = bytearray(rng.randbytes(40))
+    result = []
+    for _ in range(count):
+        for _ in range(rng.randint(0, 4)):
+            data[rng.randrange(len(data))] = rng.randrange(256)
+        if rng.random() < 0.2:
+            data.extend(rng.randbytes(12))
+        elif rng.random() < 0.2 and len(data) > 24:
+            del data[-12:]
+        result.append(bytes(data))
+    return result
+
+
+def record_all(buffer, blobs, first_tick=1):
+    for i, data in enumerate(blobs):
+        buffer.record(first_tick + i, data)
+
+
+def test_state_at_rebuilds_every_recorded_tick():
+    blobs = states(50)
+    buffer = RewindBuffer(interval=8, capacity=10)
+    record_all(buffer, blobs)
+    assert buffer.first_tick == 1 and buffer.last_tick == 50
+    for tick, data in enumerate(blobs, start=1):
+        assert buffer.state_at(tick) == data
+    assert buffer.state_at(0) is None
+    assert buffer.state_at(51) is None
+
+
+def test_old_checkpoints_fall_out_of_the_ring():
+    blobs = states(100)
+    buffer = RewindBuffer(interval=10, capacity=3)
+    record_all(buffer, blobs)
+    assert buffer.first_tick == 71
+    assert buffer.state_at(70) is None
+    assert buffer.state_at(71) == blobs[70]
+    assert buffer.state_at(100) == blobs[99]
+
+
+def test_truncate_after_continues_from_the_seeked_tick():
+    blobs = states(40)
+    buffer = RewindBuffer(interval=8, capacity=10)
+    record_all(buffer, blobs)
+
+    buffer.truncate_after(13)
+    assert buffer.last_tick == 13
+    assert buffer.state_at(14) is None
+    assert [c.tick for c in buffer.checkpoints] == [1, 9]
+
+    # A new future is recorded as deltas against the seeked state
+    branch = states(20, seed=9)
+    record_all(buffer, branch, first_tick=14)
+    for tick in range(1, 14):
+        assert buffer.state_at(tick) == blobs[tick - 1]
+    for tick in range(14, 34):
+        assert buffer.state_at(tick) == branch[tick - 14]
+
+
+def test_truncate_after_a_missing_tick_clears():
+    buffer = RewindBuffer(interval=4, capacity=2)
+    record_all(buffer, states(20))
+    buffer.truncate_after(3)
+    assert buffer.last_tick is None and not buffer.checkpoints
+
+
+def test_gap_in_ticks_starts_over():
+    blobs = states(10)
+    buffer = RewindBuffer(interval=4, capacity=4)
+    record_all(buffer, blobs[:5])
+    buffer.record(9, blobs[5])
+    assert buffer.first_tick == 9
+    assert buffer.state_at(4) is None
+    assert buffer.state_at(9) == blobs[5]
+
+
+def test_memory_usage_while_recording_on_another_thread():
+    blobs = states(400)
+    buffer = RewindBuffer(interval=5, capacity=8)
+    done = threading.Event()
+
+    def recorder():
+        for _ in range(5):
+            record_all(buffer, blobs, first_tick=buffer.last_tick + 1 if buffer.last_tick else 1)
+        done.set()
+
+    thread = threading.Thread(target=recorder)
+    thread.start()
+    while not done.is_set():
+        count, size = buffer.memory_usage()
+        assert count <= 8 and size >= 0
+    thread.join()
+    assert buffer.memory_usage()[0] == 8
@@ -0,0 +1,115 @@
+import json
+import os
+
+from score_store import ScoreRecord, ScoreStore, _RECORD
+
+
+def write_log(path, records):
+    with open(path, "ab") as log_file:
+        for score, misses, timestamp in records:
+            log_file.write(_RECORD.pack(timestamp, score, misses))
+
+
+def write_index(path, log_offset, top):
+    with open(path, "w", encoding="utf-8") as index_file:
+        json.dump({"log_offset": log_offset, "top": [list(r) for r in top]}, index_file)
+
+
+def open_store(tmp_path, top_n=5):
+    return ScoreStore(str(tmp_path / "scores.log"), str(tmp_path / "scores.idx"), top_n=top_n, enabled=True)
+
+
+def test_torn_trailing_record_is_truncated(tmp_path):
+    log_path = tmp_path / "scores.log"
+    write_log(log_path, [(10, 0, 1.0), (20, 1, 2.0)])
+    with open(log_path, "ab") as log_file:
+        log_file.write(b"\x01\x02\x03")  # crash mid-append
+
+    store = open_store(tmp_path)
+    try:
+        assert os.path.getsize(log_path) == 2 * _RECORD.size
+        assert [r.score for r in store.top()] == [20, 10]
+    finally:
+        store.close()
+
+
+def test_only_log_tail_after_index_offset_is_replayed(tmp_path):
+    write_log(tmp_path / "scores.log", [(10, 0, 1.0), (20, 0, 2.0), (30, 0, 3.0)])
+    # The index covers the first two records; its top deliberately differs from them
+    write_index(tmp_path / "scores.idx", 2 * _RECORD.size, [ScoreRecord(99, 0, 0.5)])
+
+    store = open_store(tmp_path)
+    try:
+        assert [r.score for r in store.top()] == [99, 30]
+    finally:
+        store.close()
+
+
+def test_damaged_index_rebuilds_from_full_log(tmp_path):
+    write_log(tmp_path / "scores.log", [(10, 0, 1.0), (20, 0, 2.0), (30, 0, 3.0)])
+    (tmp_path / "scores.idx").write_text("{not json", encoding="utf-8")
+
+    store = open_store(tmp_path)
+    try:
+        assert [r.score for r in store.top()] == [30, 20, 10]
+    finally:
+        store.close()
+
+
+def test_stale_index_past_end_of_log_rebuilds_from_full_log(tmp_path):
+    write_log(tmp_path / "scores.log", [(10, 0, 1.0), (20, 0, 2.0)])
+    write_index(tmp_path / "scores.idx", 10 * _RECORD.size, [ScoreRecord(99, 0, 0.5)])
+
+    store = open_store(tmp_path)
+    try:
+        assert [r.score for r in store.top()] == [20, 10]
+    finally:
+        store.close()
+
+
+def test_records_survive_reopen_and_rank_by_score_then_misses(tmp_path):
+    store = open_store(tmp_path, top_n=3)
+    ranks = [store.record(score, misses) for score, misses in ((10, 2), (30, 0), (10, 1), (5, 0))]
+    store.close()
+    assert ranks == [0, 0, 1, None]
+
+    reopened = open_store(tmp_path, top_n=3)
+    try:
+        assert [(r.score, r.misses) for r in reopened.top()] == [(30, 0), (10, 1), (10, 2)]
+        assert not reopened.is_high_score(5)
+    finally:
+        reopened.close()
+
+
+def test_disabled_store_keeps_scores_in_memory(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.log"), str(tmp_path / "scores.idx"), top_n=3, enabled=False)
+    store.record(10, 0)
+    store.close()
+    assert [r.score for r in store.top()] == [10]
+    assert not (tmp_path / "scores.log").exists()
+
+
+def test_failed_flush_rolls_back_partial_write(tmp_path, monkeypatch):
+    store = open_store(tmp_path)
+    log_path = tmp_path / "scores.log"
+    store._flush([ScoreRecord(10, 0, 1.0)])
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    # The batch reaches the file, then fsync fails
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "fsync", failing_fsync)
+        store._flush([ScoreRecord(20, 0, 2.0), ScoreRecord(30, 0, 3.0)])
+    assert os.path.getsize(log_path) == _RECORD.size
+
+    store._flush([ScoreRecord(40, 0, 4.0)])
+    store.close()
+    with open(log_path, "rb") as log_file:
+        assert [score for _, score, _ in _RECORD.iter_unpack(log_file.read())] == [10, 40]
+
+    reopened = open_store(tmp_path)
+    try:
+        assert [r.score for r in reopened.top()] == [40, 10]
+    finally:
+        reopened.close()
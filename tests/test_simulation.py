@@ -0,0 +1,97 @@
+import queue
+import threading
+import time
+
+import config
+from simulation import RenderSnapshot, SimulationThread, SnapshotBuffer
+
+
+def snapshot(score):
+    return RenderSnapshot(config.GameState.PLAYING, (), score, score, 0, None, (False, 0, 0), (), None)
+
+
+def test_latest_is_the_last_published():
+    buffer = SnapshotBuffer()
+    assert buffer.latest() is None
+    first, second = snapshot(1), snapshot(2)
+    buffer.publish(first)
+    buffer.publish(second)
+    assert buffer.latest() is second
+    assert buffer.sequence == 2
+
+
+def test_concurrent_publish_and_read():
+    buffer = SnapshotBuffer()
+    buffer.publish(snapshot(0))
+    count = 20000
+    done = threading.Event()
+    errors = []
+
+    def reader():
+        last = 0
+        while not done.is_set():
+            current = buffer.latest()
+            # Always a whole snapshot, and never an older one than before
+            if current.score != current.misses or current.score < last:
+                errors.append((last, current))
+                return
+            last = current.score
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+    for score in range(1, count + 1):
+        buffer.publish(snapshot(score))
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert not errors
+    assert buffer.latest().score == count
+    assert buffer.sequence == count + 1
+
+
+class StubInput:
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event)
+
+
+class StubGame:
+    """Just what SimulationThread touches"""
+
+    def __init__(self):
+        self.running = True
+        self.hot_reloader = None
+        self.input_handler = StubInput()
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+    def capture_snapshot(self):
+        return snapshot(self.updates)
+
+
+def test_simulation_thread_publishes_steps_and_stops(monkeypatch):
+    monkeypatch.setattr(config, "SIMULATION_RATE", 500)
+    game = StubGame()
+    buffer = SnapshotBuffer()
+    events = queue.Queue()
+    events.put("click")
+    simulation = SimulationThread(game, buffer, events)
+    simulation.start()
+
+    deadline = time.monotonic() + 5
+    while buffer.sequence < 5 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    simulation.stop()
+    simulation.join(timeout=5)
+
+    assert not simulation.is_alive()
+    assert buffer.sequence >= 5
+    # Every step publishes the state it just updated, and input is handled first
+    assert buffer.latest().score == game.updates == buffer.sequence
+    assert game.input_handler.events == ["click"]
@@ -0,0 +1,30 @@
+import random
+
+import numpy as np
+
+from sound_bank import SoundBank, render_variant
+
+
+def test_pick_leaves_the_global_rng_alone():
+    bank = SoundBank(cache_dir="unused", count=3)
+    bank.variants["hit"] = ["a", "b", "c"]
+
+    random.seed(5)
+    expected = [random.random() for _ in range(3)]
+    random.seed(5)
+    picks = []
+    for _ in range(3):
+        picks.append(bank.pick("hit"))
+        picks.append(random.random())
+
+    assert picks[1::2] == expected
+    assert set(picks[::2]) <= {"a", "b", "c"}
+    assert bank.pick("missing") is None
+
+
+def test_render_variant_resamples_and_clips():
+    samples = np.array([[0, 0], [20000, -20000], [30000, -30000], [0, 0]], dtype=np.int16)
+    higher = render_variant(samples, 2.0, 1.0)
+    assert higher.shape == (2, 2) and higher.dtype == np.int16
+    louder = render_variant(samples, 1.0, 2.0)
+    assert louder[2].tolist() == [32767, -32768]
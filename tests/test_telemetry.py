@@ -0,0 +1,64 @@
+import gzip
+import json
+import os
+
+import config
+from telemetry import Telemetry
+
+
+def read_events(directory):
+    events = []
+    for name in sorted(os.listdir(directory)):
+        with gzip.open(os.path.join(directory, name), "rt", encoding="utf-8") as segment:
+            events.extend(json.loads(line) for line in segment)
+    return events
+
+
+def test_segments_rotate_at_size_limit_without_losing_events(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "TELEMETRY_SEGMENT_SIZE", 4096)
+    monkeypatch.setattr(config, "TELEMETRY_BATCH_SIZE", 10 ** 6)
+    telemetry = Telemetry(enabled=True, directory=str(tmp_path))
+    telemetry.close()  # stop the writer so the test drains deterministically
+    telemetry.enabled = True
+
+    for batch in range(5):
+        for i in range(200):
+            telemetry.emit("hit", batch * 200 + i, payload=os.urandom(32).hex())
+        telemetry._drain()
+    telemetry._close_segment()
+
+    segments = sorted(os.listdir(tmp_path))
+    assert len(segments) > 1
+    assert all(name.endswith(".jsonl.gz") for name in segments)
+    # Every segment but the last was closed once it reached the limit
+    assert all(os.path.getsize(tmp_path / name) >= 4096 for name in segments[:-1])
+    events = read_events(tmp_path)
+    assert [e["t"] for e in events] == list(range(1000))
+    assert all(e["type"] == "hit" for e in events)
+    assert telemetry.written == 1000 and telemetry.dropped == 0
+
+
+def test_full_queue_drops_and_counts(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "TELEMETRY_QUEUE_SIZE", 3)
+    monkeypatch.setattr(config, "TELEMETRY_BATCH_SIZE", 10 ** 6)
+    telemetry = Telemetry(enabled=True, directory=str(tmp_path))
+    telemetry.close()
+    telemetry.enabled = True
+
+    for i in range(5):
+        telemetry.emit("tick", i)
+    telemetry._drain()
+    telemetry._close_segment()
+
+    assert telemetry.dropped == 2
+    assert [e["t"] for e in read_events(tmp_path)] == [0, 1, 2]
+
+
+def test_close_flushes_queued_events(tmp_path):
+    telemetry = Telemetry(enabled=True, directory=str(tmp_path))
+    telemetry.emit("round_end", 5, score=30)
+    telemetry.close()
+
+    assert read_events(tmp_path) == [{"score": 30, "type": "round_end", "t": 5}]
+    telemetry.emit("ignored", 6)  # closed telemetry ignores events
+    assert telemetry.dropped == 0
@@ -0,0 +1,43 @@
+import pygame
+import pytest
+
+import config
+from game_state import GameStateManager
+from sound_manager import SoundManager
+
+
+def test_warmups_run_on_first_entry_only():
+    manager = GameStateManager()
+    calls = []
+    manager.register_warmup(config.GameState.PLAYING, lambda: calls.append("playing"))
+    manager.register_warmup(config.GameState.PLAYING, lambda: 1 / 0)  # failures are reported, not raised
+    assert calls == []
+
+    manager.set_state(config.GameState.PLAYING)
+    assert calls == ["playing"]
+    assert config.GameState.PLAYING in manager.warmup_times
+
+    manager.set_state(config.GameState.PAUSED)
+    manager.set_state(config.GameState.PLAYING)
+    assert calls == ["playing"]
+
+
+@pytest.fixture
+def mixer(monkeypatch):
+    monkeypatch.setattr(config, "SOUND_VARIANTS", 1)
+    pygame.mixer.init()
+    yield
+    pygame.mixer.quit()
+
+
+def test_sound_warm_up_keeps_channel_volumes(mixer):
+    channels = [pygame.mixer.Channel(i) for i in range(pygame.mixer.get_num_channels())]
+    for i, channel in enumerate(channels):
+        channel.set_volume(0.25 + 0.05 * i)
+    before = [channel.get_volume() for channel in channels]
+
+    manager = SoundManager()
+    if not manager.sounds:
+        pytest.skip("no sound effects could be loaded")
+    manager.warm_up()
+    assert [channel.get_volume() for channel in channels] == before